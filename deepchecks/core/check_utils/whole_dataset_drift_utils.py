@@ -17,6 +17,7 @@ import numpy as np
 import pandas as pd
 
 from deepchecks import Dataset  # TODO: Remove?
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.distribution.plot import feature_distribution_traces, drift_score_bar_traces
 from deepchecks.utils.features import N_TOP_MESSAGE, calculate_feature_importance_or_none
 from deepchecks.utils.strings import format_percent
@@ -36,12 +37,24 @@ from sklearn.model_selection import train_test_split
 import plotly.graph_objects as go
 
 
+FEATURE_IMPORTANCE_METHODS = ('permutation', 'split_gain', 'drop_column')
+
+
+def validate_feature_importance_method(feature_importance_method: str):
+    """Raise DeepchecksValueError if the domain classifier feature importance method is not supported."""
+    if feature_importance_method not in FEATURE_IMPORTANCE_METHODS:
+        raise DeepchecksValueError(f'feature_importance_method must be one of {list(FEATURE_IMPORTANCE_METHODS)}, '
+                                   f'but got: {feature_importance_method}')
+
+
 def run_whole_dataset_drift(train_dataframe: pd.DataFrame, test_dataframe: pd.DataFrame,
                             numerical_features: List[Hashable], cat_features: List[Hashable], sample_size: int,
                             random_state: int, test_size: float, n_top_columns: int, min_feature_importance: float,
-                            max_num_categories: Optional[int], min_meaningful_drift_score: float):
+                            max_num_categories: Optional[int], min_meaningful_drift_score: float,
+                            feature_importance_method: str = 'permutation', early_stopping: bool = False):
     """Calculate whole dataset drift."""
-    domain_classifier = generate_model(numerical_features, cat_features, random_state)
+    validate_feature_importance_method(feature_importance_method)
+    domain_classifier = generate_model(numerical_features, cat_features, random_state, early_stopping)
 
     train_sample_df = train_dataframe.sample(sample_size, random_state=random_state)
     test_sample_df = test_dataframe.sample(sample_size, random_state=random_state)
@@ -57,18 +70,28 @@ def run_whole_dataset_drift(train_dataframe: pd.DataFrame, test_dataframe: pd.Da
 
     domain_classifier = domain_classifier.fit(x_train, y_train)
 
-    y_test.name = 'belongs_to_test'
-    domain_test_dataset = Dataset(pd.concat([x_test.reset_index(drop=True), y_test.reset_index(drop=True)], axis=1),
-                                  cat_features=cat_features, label='belongs_to_test')
-
     # calculate feature importance of domain_classifier, containing the information which features separate
     # the dataset best.
-    fi, importance_type = calculate_feature_importance_or_none(
-        domain_classifier,
-        domain_test_dataset,
-        force_permutation=True,
-        permutation_kwargs={'n_repeats': 10, 'random_state': random_state, 'timeout': 120}
-    )
+    if feature_importance_method == 'split_gain':
+        fi, importance_type = split_gain_importance(domain_classifier, numerical_features + cat_features), \
+            'split_gain'
+        if fi is None:
+            warnings.warn('Could not read the split gains of the domain classifier, using drop_column feature '
+                          'importance instead')
+            feature_importance_method = 'drop_column'
+    if feature_importance_method == 'drop_column':
+        fi, importance_type = drop_column_importance(domain_classifier, x_test, y_test), 'drop_column'
+    elif feature_importance_method == 'permutation':
+        y_test.name = 'belongs_to_test'
+        domain_test_dataset = Dataset(pd.concat([x_test.reset_index(drop=True), y_test.reset_index(drop=True)],
+                                                axis=1),
+                                      cat_features=cat_features, label='belongs_to_test')
+        fi, importance_type = calculate_feature_importance_or_none(
+            domain_classifier,
+            domain_test_dataset,
+            force_permutation=True,
+            permutation_kwargs={'n_repeats': 10, 'random_state': random_state, 'timeout': 120}
+        )
 
     fi = fi.sort_values(ascending=False) if fi is not None else None
 
@@ -110,8 +133,12 @@ def run_whole_dataset_drift(train_dataframe: pd.DataFrame, test_dataframe: pd.Da
 
 
 def generate_model(numerical_columns: List[Hashable], categorical_columns: List[Hashable],
-                   random_state: int = 42) -> Pipeline:
-    """Generate the unfitted Domain Classifier model."""
+                   random_state: int = 42, early_stopping: bool = False) -> Pipeline:
+    """Generate the unfitted Domain Classifier model.
+
+    If early_stopping is True, the boosting stops once the loss on a validation part of the training data stops
+    improving, which saves fitting iterations when the datasets are easily (or not at all) distinguishable.
+    """
     categorical_transformer = Pipeline(
         steps=[('encoder', OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=np.nan,
                                           dtype=np.float64))]
@@ -128,10 +155,53 @@ def generate_model(numerical_columns: List[Hashable], categorical_columns: List[
         steps=[('preprocessing', preprocessor),
                ('model', HistGradientBoostingClassifier(
                    max_depth=2, max_iter=10, random_state=random_state,
-                   categorical_features=[False] * len(numerical_columns) + [True] * len(categorical_columns)
+                   categorical_features=[False] * len(numerical_columns) + [True] * len(categorical_columns),
+                   # Without early stopping the model keeps the sklearn default
+                   **({'early_stopping': True, 'n_iter_no_change': 2} if early_stopping else {})
                ))])
 
 
+def split_gain_importance(domain_classifier: Pipeline, feature_names: List[Hashable]) -> Optional[pd.Series]:
+    """Calculate the feature importance of the fitted domain classifier as the total gain of the splits on each feature.
+
+    The gains are read from the fitted trees, so no additional predictions are needed. The feature names should be
+    in the order of the domain classifier preprocessing (numerical and then categorical features). The fitted trees
+    are not part of the public API of sklearn, so None is returned if they can't be read.
+    """
+    model = domain_classifier.named_steps['model']
+    gains = np.zeros(len(feature_names))
+    try:
+        # pylint: disable=protected-access
+        for iteration_predictors in model._predictors:
+            for predictor in iteration_predictors:
+                splits = predictor.nodes[predictor.nodes['is_leaf'] == 0]
+                np.add.at(gains, splits['feature_idx'].astype(int), splits['gain'])
+    except (AttributeError, KeyError, ValueError, TypeError, IndexError):
+        return None
+    total_gain = gains.sum()
+    return pd.Series(gains / total_gain if total_gain > 0 else gains, index=feature_names)
+
+
+def drop_column_importance(domain_classifier: Pipeline, x_test: pd.DataFrame, y_test: pd.Series) -> pd.Series:
+    """Calculate the feature importance of the fitted domain classifier by dropping each feature in a single pass.
+
+    A feature is dropped by replacing all its values with missing values, which the domain classifier handles
+    natively, so it does not need to be refitted. The importance of a feature is the decrease in the domain
+    classifier AUC when it is dropped, normalized to sum to 1.
+    """
+    auc = roc_auc_score(y_test, domain_classifier.predict_proba(x_test)[:, 1])
+    importance = pd.Series(0.0, index=x_test.columns)
+    all_missing = np.zeros(len(x_test), dtype=bool)
+    for feature in x_test.columns:
+        x_dropped = x_test.copy()
+        # Keep the column dtype, as the domain classifier preprocessing depends on it
+        x_dropped[feature] = x_test[feature].where(all_missing)
+        dropped_auc = roc_auc_score(y_test, domain_classifier.predict_proba(x_dropped)[:, 1])
+        importance[feature] = max(auc - dropped_auc, 0)
+    total_importance = importance.sum()
+    return importance / total_importance if total_importance > 0 else importance
+
+
 def auc_to_drift_score(auc: float) -> float:
     """Calculate the drift score, which is 2*auc - 1, with auc being the auc of the Domain Classifier.
 
@@ -10,6 +10,7 @@
 #
 """Package for tabular functionality."""
 from .dataset import Dataset
+from .dataset_sketch import DatasetSketch
 from .context import Context
 from .suite import Suite
 from .base_checks import (
@@ -25,6 +26,7 @@ from .model_base import (
 
 __all__ = [
     "Dataset",
+    "DatasetSketch",
     "Context",
     "SingleDatasetCheck",
     "TrainTestCheck",
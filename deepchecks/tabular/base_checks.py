@@ -47,7 +47,21 @@ def wrap_run(func, check_instance: BaseCheck):
     return wrapped
 
 
-class SingleDatasetCheck(SingleDatasetBaseCheck):
+class _WrappedRunPickleMixin:
+    """Make checks with a wrapped `run_logic` picklable, used when running a suite on a process pool."""
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The wrapped function is a closure which can't be pickled, it is recreated on unpickling
+        state.pop('run_logic', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        setattr(self, 'run_logic', wrap_run(getattr(self, 'run_logic'), self))
+
+
+class SingleDatasetCheck(_WrappedRunPickleMixin, SingleDatasetBaseCheck):
     """Parent class for checks that only use one dataset."""
 
     context_type = Context
@@ -71,7 +85,7 @@ class SingleDatasetCheck(SingleDatasetBaseCheck):
         raise NotImplementedError()
 
 
-class TrainTestCheck(TrainTestBaseCheck):
+class TrainTestCheck(_WrappedRunPickleMixin, TrainTestBaseCheck):
     """Parent class for checks that compare two datasets.
 
     The class checks train dataset and test dataset for model training and test.
@@ -99,7 +113,7 @@ class TrainTestCheck(TrainTestBaseCheck):
         raise NotImplementedError()
 
 
-class ModelOnlyCheck(ModelOnlyBaseCheck):
+class ModelOnlyCheck(_WrappedRunPickleMixin, ModelOnlyBaseCheck):
     """Parent class for checks that only use a model and no datasets."""
 
     context_type = Context
@@ -125,7 +139,7 @@ class ModelOnlyCheck(ModelOnlyBaseCheck):
         return CheckFailure(check, DeepchecksNotSupportedError(msg))
 
 
-class ModelComparisonCheck(BaseCheck):
+class ModelComparisonCheck(_WrappedRunPickleMixin, BaseCheck):
     """Parent class for check that compares between two or more models."""
 
     def __init__(self):
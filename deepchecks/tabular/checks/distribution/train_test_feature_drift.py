@@ -11,11 +11,16 @@
 """Module contains Train Test Drift check."""
 
 from collections import OrderedDict
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Tuple, Optional, Callable
+
+import pandas as pd
 
 from deepchecks.core import ConditionResult, CheckResult
 from deepchecks.tabular import Context, TrainTestCheck, Dataset
-from deepchecks.utils.distribution.drift import calc_drift_and_plot
+from deepchecks.tabular.dataset_sketch import DatasetSketch
+from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.utils.distribution.drift import calc_drift_scores, plot_drift
+from deepchecks.utils.distribution.sketch import calc_sketch_drift_score
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.typing import Hashable
 
@@ -111,34 +116,68 @@ class TrainTestFeatureDrift(TrainTestCheck):
                 self.columns, self.ignore_columns
             ).sample(self.n_samples, random_state=self.random_state)
 
-        values_dict = OrderedDict()
-        displays_dict = OrderedDict()
-        for column in train_dataset.features:
-            if features_importance is not None:
-                fi_rank_series = features_importance.rank(method='first', ascending=False)
-                fi_rank = fi_rank_series[column]
-                plot_title = f'{column} (#{int(fi_rank)} in FI)'
-            else:
-                plot_title = column
+        column_types = {column: 'categorical' if column in train_dataset.cat_features else 'numerical'
+                        for column in train_dataset.features}
+        drift_scores = calc_drift_scores(train_dataset.data, test_dataset.data, column_types,
+                                         max_num_categories=self.max_num_categories)
 
-            value, method, display = calc_drift_and_plot(
-                train_column=train_dataset.data[column],
-                test_column=test_dataset.data[column],
-                plot_title=plot_title,
-                column_type='categorical' if column in train_dataset.cat_features else 'numerical',
-                max_num_categories=self.max_num_categories
-            )
+        return self._drift_result(
+            drift_scores, column_types, features_importance,
+            lambda column: (train_dataset.data[column], test_dataset.data[column])
+        )
+
+    def run(self, train_dataset, test_dataset, model=None) -> CheckResult:
+        """Run check.
+
+        Either of the datasets can be a DatasetSketch, in order to calculate the drift against a summary of a
+        dataset which does not fit in memory. In that case the drift is calculated on all the summarized rows,
+        and the features are sorted by drift score.
+        """
+        if isinstance(train_dataset, DatasetSketch) or isinstance(test_dataset, DatasetSketch):
+            return self.finalize_check_result(self._run_on_sketches(train_dataset, test_dataset))
+        return super().run(train_dataset, test_dataset, model)
+
+    def _run_on_sketches(self, train_dataset, test_dataset) -> CheckResult:
+        if isinstance(train_dataset, DatasetSketch):
+            train_sketch = train_dataset
+            test_sketch = test_dataset if isinstance(test_dataset, DatasetSketch) else train_sketch.like(test_dataset)
+        else:
+            test_sketch = test_dataset
+            train_sketch = test_sketch.like(train_dataset)
+
+        features = train_sketch.features
+        if self.columns is not None or self.ignore_columns is not None:
+            features = list(select_from_dataframe(pd.DataFrame(columns=features), self.columns,
+                                                  self.ignore_columns).columns)
+        column_types = {column: 'categorical' if column in train_sketch.cat_features else 'numerical'
+                        for column in features}
+        drift_scores = {
+            column: calc_sketch_drift_score(train_sketch.column_sketch(column), test_sketch.column_sketch(column),
+                                            max_num_categories=self.max_num_categories)
+            for column in features
+        }
+        return self._drift_result(
+            drift_scores, column_types, None,
+            lambda column: (pd.Series(train_sketch.column_sketch(column).sample()),
+                            pd.Series(test_sketch.column_sketch(column).sample()))
+        )
+
+    def _drift_result(self, drift_scores: Dict[Hashable, Tuple[float, str]], column_types: Dict[Hashable, str],
+                      features_importance: Optional[pd.Series],
+                      columns_values: Callable[[Hashable], Tuple[pd.Series, pd.Series]]) -> CheckResult:
+        """Create the check result from the drift scores, plotting the values of only the displayed columns."""
+        values_dict = OrderedDict()
+        for column, (value, method) in drift_scores.items():
             values_dict[column] = {
                 'Drift score': value,
                 'Method': method,
                 'Importance': features_importance[column] if features_importance is not None else None
             }
-            displays_dict[column] = display
 
         if self.sort_feature_by == 'feature importance' and features_importance is not None:
             columns_order = features_importance.sort_values(ascending=False).head(self.n_top_columns).index
         else:
-            columns_order = sorted(train_dataset.features, key=lambda col: values_dict[col]['Drift score'], reverse=True
+            columns_order = sorted(values_dict, key=lambda col: values_dict[col]['Drift score'], reverse=True
                                    )[:self.n_top_columns]
 
         sorted_by = self.sort_feature_by if features_importance is not None else 'drift score'
@@ -150,7 +189,23 @@ class TrainTestFeatureDrift(TrainTestCheck):
             <br>If available, the plot titles also show the feature importance (FI) rank.
         </span>"""
 
-        displays = [headnote] + [displays_dict[col] for col in columns_order]
+        # Plots are created only for the displayed columns
+        displays = [headnote]
+        for column in columns_order:
+            if features_importance is not None:
+                fi_rank = features_importance.rank(method='first', ascending=False, na_option='bottom')[column]
+                plot_title = f'{column} (#{int(fi_rank)} in FI)'
+            else:
+                plot_title = column
+            train_column, test_column = columns_values(column)
+            displays.append(plot_drift(
+                train_column=train_column,
+                test_column=test_column,
+                plot_title=plot_title,
+                column_type=column_types[column],
+                score=values_dict[column]['Drift score'],
+                max_num_categories=self.max_num_categories
+            ))
 
         return CheckResult(value=values_dict, display=displays, header='Train Test Drift')
 
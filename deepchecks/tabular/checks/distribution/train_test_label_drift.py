@@ -12,9 +12,14 @@
 
 from typing import Dict
 
+import pandas as pd
+
 from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular.dataset_sketch import DatasetSketch
 from deepchecks.core import CheckResult, ConditionResult
-from deepchecks.utils.distribution.drift import calc_drift_and_plot
+from deepchecks.core.errors import DatasetValidationError
+from deepchecks.utils.distribution.drift import calc_drift_and_plot, plot_drift
+from deepchecks.utils.distribution.sketch import calc_sketch_drift_score
 
 
 __all__ = ['TrainTestLabelDrift']
@@ -67,6 +72,42 @@ class TrainTestLabelDrift(TrainTestCheck):
             max_num_categories=self.max_num_categories
         )
 
+        return self._drift_result(drift_score, method, display)
+
+    def run(self, train_dataset, test_dataset, model=None) -> CheckResult:
+        """Run check.
+
+        Either of the datasets can be a DatasetSketch, in order to calculate the drift against a summary of a
+        dataset which does not fit in memory.
+        """
+        if isinstance(train_dataset, DatasetSketch) or isinstance(test_dataset, DatasetSketch):
+            return self.finalize_check_result(self._run_on_sketches(train_dataset, test_dataset))
+        return super().run(train_dataset, test_dataset, model)
+
+    def _run_on_sketches(self, train_dataset, test_dataset) -> CheckResult:
+        if isinstance(train_dataset, DatasetSketch):
+            train_sketch = train_dataset
+            test_sketch = test_dataset if isinstance(test_dataset, DatasetSketch) else train_sketch.like(test_dataset)
+        else:
+            test_sketch = test_dataset
+            train_sketch = test_sketch.like(train_dataset)
+        if train_sketch.label_name is None:
+            raise DatasetValidationError('Check is irrelevant for Datasets without label')
+
+        train_label = train_sketch.column_sketch(train_sketch.label_name)
+        test_label = test_sketch.column_sketch(test_sketch.label_name)
+        drift_score, method = calc_sketch_drift_score(train_label, test_label, self.max_num_categories)
+        display = plot_drift(
+            train_column=pd.Series(train_label.sample()),
+            test_column=pd.Series(test_label.sample()),
+            plot_title=train_sketch.label_name,
+            column_type='categorical' if train_sketch.label_type == 'classification_label' else 'numerical',
+            score=drift_score,
+            max_num_categories=self.max_num_categories
+        )
+        return self._drift_result(drift_score, method, display)
+
+    def _drift_result(self, drift_score: float, method: str, display) -> CheckResult:
         headnote = """<span>
             The Drift score is a measure for the difference between two distributions, in this check - the test
             and train distributions.<br> The check shows the drift score and distributions for the label.
@@ -58,11 +58,19 @@ class TrustScoreComparison(TrainTestCheck):
     n_to_show : int , default: 5
         Number of samples to show of worst and best trust score.
     percent_top_scores_to_hide : float  , default: 0.05
+    algorithm : str , default: kd_tree
+        used in TrustScore (Nearest neighbors tree to build for each class; either 'kd_tree' or 'ball_tree')
+    n_projection_components : int , default: None
+        used in TrustScore (If given, the data is randomly projected to this number of dimensions, so the nearest
+        neighbors distances are approximate but faster to calculate)
+    n_jobs : int , default: 1
+        used in TrustScore (Number of threads used to query the trees. Negative value means the number of CPUs)
     """
 
     def __init__(self, k_filter: int = 10, alpha: float = 0.001,
                  max_number_categories: int = 10, min_test_samples: int = 300, sample_size: int = 10_000,
-                 random_state: int = 42, n_to_show: int = 5, percent_top_scores_to_hide: float = 0.05):
+                 random_state: int = 42, n_to_show: int = 5, percent_top_scores_to_hide: float = 0.05,
+                 algorithm: str = 'kd_tree', n_projection_components: int = None, n_jobs: int = 1):
         super().__init__()
         _validate_parameters(k_filter, alpha, max_number_categories, min_test_samples, sample_size, n_to_show,
                              percent_top_scores_to_hide)
@@ -74,12 +82,16 @@ class TrustScoreComparison(TrainTestCheck):
         self.random_state = random_state
         self.n_to_show = n_to_show
         self.percent_top_scores_to_hide = percent_top_scores_to_hide
+        self.algorithm = algorithm
+        self.n_projection_components = n_projection_components
+        self.n_jobs = n_jobs
 
     def run_logic(self, context: Context) -> CheckResult:
         """Run check."""
         test_dataset = context.test
         train_dataset = context.train
-        model = context.model
+        train_model = context.get_cached_model('train')
+        test_model = context.get_cached_model('test')
         features_list = train_dataset.features
         label_name = train_dataset.label_name
         context.assert_classification_task()
@@ -116,14 +128,16 @@ class TrustScoreComparison(TrainTestCheck):
             return np.array([label_transform_dict[lbl] for lbl in np_label])
 
         y_train = train_data_sample[label_name].replace(label_transform_dict)
-        trust_score_model = TrustScore(k_filter=self.k_filter, alpha=self.alpha)
+        trust_score_model = TrustScore(k_filter=self.k_filter, alpha=self.alpha, algorithm=self.algorithm,
+                                       n_projection_components=self.n_projection_components, n_jobs=self.n_jobs,
+                                       random_state=self.random_state)
         trust_score_model.fit(X=x_train.to_numpy(), Y=y_train.to_numpy())
         # Calculate y on train and get scores
-        y_train_pred = model.predict(train_data_sample[features_list]).flatten()
+        y_train_pred = train_model.predict(train_data_sample[features_list]).flatten()
         train_trust_scores = trust_score_model.score(x_train.to_numpy(),
                                                      transform_numpy_label(y_train_pred))[0].astype('float64')
         # Calculate y on test dataset using the model
-        y_test_pred = model.predict(test_data_sample[features_list]).flatten()
+        y_test_pred = test_model.predict(test_data_sample[features_list]).flatten()
         test_trust_scores = trust_score_model.score(x_test.to_numpy(),
                                                     transform_numpy_label(y_test_pred))[0].astype('float64')
 
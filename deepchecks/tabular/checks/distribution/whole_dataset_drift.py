@@ -11,7 +11,8 @@
 """Module contains the domain classifier drift check."""
 from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.tabular import Context, TrainTestCheck
-from deepchecks.core.check_utils.whole_dataset_drift_utils import run_whole_dataset_drift
+from deepchecks.core.check_utils.whole_dataset_drift_utils import (run_whole_dataset_drift,
+                                                                   validate_feature_importance_method)
 from deepchecks.utils.strings import format_number
 
 __all__ = ['WholeDatasetDrift']
@@ -50,6 +51,14 @@ class WholeDatasetDrift(TrainTestCheck):
         Fraction of the combined datasets to use for the evaluation of the domain classifier.
     min_meaningful_drift_score : float , default 0.05
         Minimum drift score for displaying drift in check. Under that score, check will display "nothing found".
+    feature_importance_method : str , default: 'permutation'
+        Method of calculating the feature importance of the domain classifier. 'permutation' for permutation
+        importance, 'split_gain' for the total gain of the splits on each feature in the fitted trees, or
+        'drop_column' for the decrease in AUC when replacing each feature with missing values. 'split_gain' and
+        'drop_column' are much faster than 'permutation', which predicts on 10 permutations of each feature.
+    early_stopping : bool , default: False
+        Whether to stop fitting the domain classifier once its loss on a validation part of the training data stops
+        improving.
     """
 
     def __init__(
@@ -60,7 +69,9 @@ class WholeDatasetDrift(TrainTestCheck):
             sample_size: int = 10_000,
             random_state: int = 42,
             test_size: float = 0.3,
-            min_meaningful_drift_score: float = 0.05
+            min_meaningful_drift_score: float = 0.05,
+            feature_importance_method: str = 'permutation',
+            early_stopping: bool = False
     ):
         super().__init__()
 
@@ -71,6 +82,9 @@ class WholeDatasetDrift(TrainTestCheck):
         self.random_state = random_state
         self.test_size = test_size
         self.min_meaningful_drift_score = min_meaningful_drift_score
+        validate_feature_importance_method(feature_importance_method)
+        self.feature_importance_method = feature_importance_method
+        self.early_stopping = early_stopping
 
     def run_logic(self, context: Context) -> CheckResult:
         """Run check.
@@ -112,7 +126,9 @@ class WholeDatasetDrift(TrainTestCheck):
                                                         test_size=self.test_size, n_top_columns=self.n_top_columns,
                                                         min_feature_importance=self.min_feature_importance,
                                                         max_num_categories=self.max_num_categories,
-                                                        min_meaningful_drift_score=self.min_meaningful_drift_score)
+                                                        min_meaningful_drift_score=self.min_meaningful_drift_score,
+                                                        feature_importance_method=self.feature_importance_method,
+                                                        early_stopping=self.early_stopping)
 
         if displays:
             displays.insert(0, headnote)
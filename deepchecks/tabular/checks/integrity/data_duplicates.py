@@ -12,11 +12,12 @@
 from typing import Union, List
 
 import numpy as np
+import pandas as pd
 
 from deepchecks.core import CheckResult, ConditionResult, ConditionCategory
 from deepchecks.core.errors import DatasetValidationError
 from deepchecks.tabular import Context, SingleDatasetCheck
-from deepchecks.utils.dataframes import select_from_dataframe
+from deepchecks.utils.dataframes import select_from_dataframe, group_identical_rows
 from deepchecks.utils.strings import format_percent, format_list
 from deepchecks.utils.typing import Hashable
 
@@ -65,45 +66,32 @@ class DataDuplicates(SingleDatasetCheck):
 
         df = select_from_dataframe(df, self.columns, self.ignore_columns)
 
-        data_columns = list(df.columns)
-
         n_samples = df.shape[0]
 
         if n_samples == 0:
             raise DatasetValidationError('Dataset does not contain any data')
 
-        # HACK: pandas have bug with groupby on category dtypes, so until it fixed, change dtypes manually
-        category_columns = df.dtypes[df.dtypes == 'category'].index.tolist()
-        if category_columns:
-            df = df.astype({c: 'object' for c in category_columns})
-
-        group_unique_data = df[data_columns].groupby(data_columns, dropna=False).size()
-        n_unique = len(group_unique_data)
+        group_codes = group_identical_rows(df)
+        group_sizes = np.bincount(group_codes)
+        n_unique = len(group_sizes)
 
         percent_duplicate = 1 - (1.0 * int(n_unique)) / (1.0 * int(n_samples))
 
         if percent_duplicate > 0:
-            # patched for anonymous_series
-            is_anonymous_series = 0 in group_unique_data.keys().names
-            if is_anonymous_series:
-                new_name = str(group_unique_data.keys().names)
-                new_index = group_unique_data.keys()
-                new_index.names = [new_name if name == 0 else name for name in new_index.names]
-                group_unique_data = group_unique_data.reindex(new_index)
-            duplicates_counted = group_unique_data.reset_index().rename(columns={0: 'Number of Duplicates'})
-            if is_anonymous_series:
-                duplicates_counted.rename(columns={new_name: 0}, inplace=True)
-
-            most_duplicates = duplicates_counted[duplicates_counted['Number of Duplicates'] > 1]. \
-                nlargest(self.n_to_show, ['Number of Duplicates'])
-
-            indexes = []
-            for row in most_duplicates.iloc():
-                indexes.append(format_list(df.index[np.all(df == row[data_columns], axis=1)].to_list()))
-
-            most_duplicates['Instances'] = indexes
-
-            most_duplicates = most_duplicates.set_index(['Instances', 'Number of Duplicates'])
+            duplicated_groups = np.flatnonzero(group_sizes > 1)
+            most_duplicated_groups = duplicated_groups[
+                np.argsort(-group_sizes[duplicated_groups], kind='stable')[:self.n_to_show]
+            ]
+            # Positions of the rows of the shown groups, in their order in the data
+            shown_rows = np.flatnonzero(np.isin(group_codes, most_duplicated_groups))
+            instances = [shown_rows[group_codes[shown_rows] == group] for group in most_duplicated_groups]
+
+            most_duplicates = df.iloc[[rows[0] for rows in instances]]
+            most_duplicates.index = pd.MultiIndex.from_arrays(
+                [[format_list(df.index[rows].to_list()) for rows in instances],
+                 group_sizes[most_duplicated_groups]],
+                names=['Instances', 'Number of Duplicates']
+            )
 
             text = f'{format_percent(percent_duplicate)} of data samples are duplicates. '
             explanation = 'Each row in the table shows an example of duplicate data and the number of times it appears.'
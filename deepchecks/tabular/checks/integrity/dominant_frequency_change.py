@@ -71,8 +71,8 @@ class DominantFrequencyChange(TrainTestCheck):
         p_dict = {}
 
         for column in train_dataset.features:
-            top_ref = baseline_df[column].value_counts(dropna=False)
-            top_test = test_df[column].value_counts(dropna=False)
+            top_ref = train_dataset.column_profile(column).value_counts
+            top_test = test_dataset.column_profile(column).value_counts
 
             if len(top_ref) == 1 or top_ref.iloc[0] > top_ref.iloc[1] * self.dominance_ratio:
                 value = top_ref.index[0]
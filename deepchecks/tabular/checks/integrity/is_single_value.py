@@ -11,6 +11,8 @@
 """Module contains is_single_value check."""
 from typing import Union, List
 
+import pandas as pd
+
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.utils.dataframes import select_from_dataframe
@@ -53,13 +55,14 @@ class IsSingleValue(SingleDatasetCheck):
         """
         # Validate parameters
         if dataset_type == 'train':
-            df = context.train.data
+            dataset = context.train
         else:
-            df = context.test.data
+            dataset = context.test
 
-        df = select_from_dataframe(df, self.columns, self.ignore_columns)
+        df = select_from_dataframe(dataset.data, self.columns, self.ignore_columns)
 
-        is_single_unique_value = (df.nunique(dropna=False) == 1)
+        is_single_unique_value = pd.Series([dataset.column_profile(column).n_unique_with_nulls == 1
+                                            for column in df.columns], index=df.columns, dtype=bool)
 
         if is_single_unique_value.any():
             # get names of columns with one unique value
@@ -18,7 +18,7 @@ from deepchecks.core import CheckResult, ConditionResult, ConditionCategory
 from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
-from deepchecks.utils.strings import is_string_column, format_percent
+from deepchecks.utils.strings import format_percent
 from deepchecks.utils.typing import Hashable
 
 
@@ -73,8 +73,9 @@ class MixedDataTypes(SingleDatasetCheck):
         result_dict = {}
 
         for column_name in df.columns:
-            column_data = df[column_name].dropna()
-            mix = self._get_data_mix(column_data)
+            if not dataset.column_profile(column_name).is_string:
+                continue
+            mix = self._check_mixed_percentage(df[column_name].dropna())
             if mix:
                 result_dict[column_name] = mix
                 # Format percents for display
@@ -90,12 +91,6 @@ class MixedDataTypes(SingleDatasetCheck):
 
         return CheckResult(result_dict, display=display)
 
-    @classmethod
-    def _get_data_mix(cls, column_data: pd.Series) -> dict:
-        if is_string_column(column_data):
-            return cls._check_mixed_percentage(column_data)
-        return {}
-
     @classmethod
     def _check_mixed_percentage(cls, column_data: pd.Series) -> dict:
         total_rows = column_data.count()
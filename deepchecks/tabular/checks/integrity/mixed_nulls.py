@@ -20,7 +20,7 @@ from deepchecks.core import CheckResult, ConditionResult
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
-from deepchecks.utils.strings import string_baseform, format_percent
+from deepchecks.utils.strings import strings_baseform, format_percent
 from deepchecks.utils.typing import Hashable
 
 
@@ -84,21 +84,21 @@ class MixedNulls(SingleDatasetCheck):
         display_array = []
         result_dict = defaultdict(dict)
 
-        for column_name in list(df.columns):
-            column_data = df[column_name]
-            # TODO: Modify this once Dataset type casting mechanism is done
-            if column_data.dtype != pd.StringDtype:
-                continue
-            # Get counts of all values in series including NaNs, in sorted order of count
-            column_counts: pd.Series = column_data.value_counts(dropna=False)
+        # TODO: Modify this once Dataset type casting mechanism is done
+        string_columns = [column_name for column_name in df.columns if df[column_name].dtype == pd.StringDtype]
+        # Get counts of all values in series including NaNs, in sorted order of count
+        columns_counts = {column_name: dataset.column_profile(column_name).value_counts
+                          for column_name in string_columns}
+        null_values = self._get_null_values(columns_counts.values(), null_string_list)
+
+        for column_name, column_counts in columns_counts.items():
             # Filter out values not in the nulls list
-            null_counts = {value: count for value, count in column_counts.items()
-                           if string_baseform(value) in null_string_list}
+            null_counts = column_counts[column_counts.index.isin(null_values)]
             if len(null_counts) < 2:
                 continue
             # Save the column info
             for null_value, count in null_counts.items():
-                percent = count / len(column_data)
+                percent = count / len(df)
                 display_array.append([column_name, null_value, count, format_percent(percent)])
                 result_dict[column_name][null_value] = {'count': count, 'percent': percent}
 
@@ -114,6 +114,25 @@ class MixedNulls(SingleDatasetCheck):
 
         return CheckResult(result_dict, display=display)
 
+    @staticmethod
+    def _get_null_values(columns_counts: Iterable[pd.Series], null_string_list: set) -> np.ndarray:
+        """Return the values of all the columns which are considered null.
+
+        The base form of each distinct value is calculated once for all the columns.
+        """
+        columns_counts = list(columns_counts)
+        if not columns_counts:
+            return np.array([], dtype=object)
+        unique_values = pd.Series(pd.unique(np.concatenate([counts.index.to_numpy(dtype=object)
+                                                            for counts in columns_counts])))
+        baseforms = strings_baseform(unique_values)
+        is_null = baseforms.isin([value for value in null_string_list if isinstance(value, str)])
+        if np.NaN in null_string_list:
+            # Only NaN itself is considered as null among the values which are not strings (None is not)
+            missing = baseforms.isna()
+            is_null[missing] = baseforms[missing].map(lambda value: isinstance(value, float))
+        return unique_values[is_null].to_numpy(dtype=object)
+
     def _validate_null_string_list(self, nsl, check_nan: bool) -> set:
         """Validate the object given is a list of strings. If null is given return default list of null values.
 
@@ -63,7 +63,8 @@ class CategoryMismatchTrainTest(TrainTestCheck):
         train_dataset = context.train
         cat_features = train_dataset.cat_features
 
-        test_df = select_from_dataframe(test_dataset.data, self.columns, self.ignore_columns)
+        # Validates the columns exist in the test data, which is then read through the columns profiles
+        select_from_dataframe(test_dataset.data, self.columns, self.ignore_columns)
         train_df = select_from_dataframe(train_dataset.data, self.columns, self.ignore_columns)
 
         # After filtering the columns drop cat features that don't exist anymore
@@ -73,24 +74,22 @@ class CategoryMismatchTrainTest(TrainTestCheck):
         n_test_samples = test_dataset.n_samples
 
         for feature in cat_features:
-            train_column = train_df[feature]
-            test_column = test_df[feature]
+            train_profile = train_dataset.column_profile(feature)
+            test_counts = test_dataset.column_profile(feature).value_counts
+            test_counts = test_counts[test_counts.to_numpy() > 0]
 
             # np.nan != np.nan, so we remove these values if they exist in training
-            if train_column.isna().any():
-                test_column = test_column.dropna()
+            if train_profile.n_nulls > 0:
+                test_counts = test_counts[test_counts.index.notna()]
 
-            unique_training_values = train_column.unique()
-            unique_test_values = test_column.unique()
-
-            new_category_values = sorted(set(unique_test_values).difference(set(unique_training_values)))
-            new_category_samples = dict(test_column.value_counts()[new_category_values])
+            new_category_values = sorted(set(test_counts.index).difference(set(train_profile.unique_values)))
+            new_category_samples = dict(test_counts[new_category_values])
             sorted_new_categories = sorted(new_category_values,
                                            key=lambda x, count=new_category_samples: count[x],
                                            reverse=True)
 
             if new_category_values:
-                n_new_cat = len(test_column[test_column.isin(new_category_values)])
+                n_new_cat = sum(new_category_samples.values())
 
                 new_categories.append({'name': feature,
                                        'n_new': n_new_cat,
@@ -19,8 +19,8 @@ from scipy import stats
 
 from deepchecks.core import CheckResult, ConditionResult, ConditionCategory
 from deepchecks.tabular import Context, SingleDatasetCheck
-from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df, is_categorical
-from deepchecks.utils.strings import is_string_column, format_number, format_percent
+from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
+from deepchecks.utils.strings import format_number, format_percent
 from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.typing import Hashable
 
@@ -105,13 +105,13 @@ class StringLengthOutOfBounds(SingleDatasetCheck):
         results = defaultdict(lambda: {'outliers': []})
 
         for column_name in df.columns:
-            column: Series = df[column_name].dropna()
-
-            if not is_string_column(column) or is_categorical(column,
-                                                              max_categorical_ratio=self.min_unique_value_ratio,
-                                                              max_categories=self.min_unique_values):
+            column_profile = dataset.column_profile(column_name)
+            if not column_profile.is_string or column_profile.is_categorical(
+                    max_categorical_ratio=self.min_unique_value_ratio, max_categories=self.min_unique_values):
                 continue
 
+            column: Series = df[column_name].dropna()
+
             string_length_column = column.map(lambda x: len(str(x)))
 
             # If not a lot of unique values, calculate the percentiles for existing values.
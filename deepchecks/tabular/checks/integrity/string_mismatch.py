@@ -21,8 +21,7 @@ from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
 from deepchecks.utils.typing import Hashable
 from deepchecks.utils.strings import (
-    get_base_form_to_variants_dict,
-    is_string_column,
+    get_base_form_to_variants_counts,
     format_percent
 )
 
@@ -68,17 +67,13 @@ class StringMismatch(SingleDatasetCheck):
 
         for column_name in df.columns:
             column: pd.Series = df[column_name]
-            if not is_string_column(column):
+            if not dataset.column_profile(column_name).is_string:
                 continue
 
-            uniques = column.unique()
-            base_form_to_variants = get_base_form_to_variants_dict(uniques)
-            for base_form, variants in base_form_to_variants.items():
-                if len(variants) == 1:
-                    continue
+            base_form_to_variants_counts = get_base_form_to_variants_counts(column)
+            for base_form, variants_counts in base_form_to_variants_counts.items():
                 result_dict[column_name][base_form] = []
-                for variant in variants:
-                    count = sum(column == variant)
+                for variant, count in variants_counts:
                     percent = count / len(column)
                     results.append([column_name, base_form, variant, count, format_percent(percent)])
                     result_dict[column_name][base_form].append({
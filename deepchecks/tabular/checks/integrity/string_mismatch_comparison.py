@@ -21,7 +21,6 @@ from deepchecks.utils.features import N_TOP_MESSAGE, column_importance_sorter_df
 from deepchecks.utils.typing import Hashable
 from deepchecks.utils.strings import (
     get_base_form_to_variants_dict,
-    is_string_column,
     format_percent,
 )
 
@@ -86,7 +85,8 @@ class StringMismatchComparison(TrainTestCheck):
             tested_column: pd.Series = df[column_name]
             baseline_column: pd.Series = baseline_df[column_name]
             # If one of the columns isn't string type, continue
-            if not is_string_column(tested_column) or not is_string_column(baseline_column):
+            if not context.test.column_profile(column_name).is_string or \
+                    not context.train.column_profile(column_name).is_string:
                 continue
 
             tested_baseforms = get_base_form_to_variants_dict(tested_column.unique())
@@ -126,6 +126,77 @@ class PartialBoostingModel:
             ))
 
 
+class StagedBoostingPredictions:
+    """Predictions of a sklearn boosting model limited to each of the given numbers of estimators.
+
+    The `staged_predict` and `staged_predict_proba` methods of the model yield its predictions after each estimator
+    is added, so the predictions of all the steps are calculated in a single pass over the estimators, instead of
+    copying the model and predicting from the first estimator for each step. The predictions are calculated on the
+    first call of each method, and reused by the following steps as long as they are on the same rows.
+
+    Parameters
+    ----------
+    model
+        boosting model, or pipeline ending with a boosting model, of one of the supported models.
+    steps
+        Numbers of estimators to limit the model to.
+    """
+
+    SUPPORTED_MODELS = (
+        'AdaBoostClassifier',
+        'GradientBoostingClassifier',
+        'AdaBoostRegressor',
+        'GradientBoostingRegressor'
+    )
+
+    def __init__(self, model, steps):
+        self.model = model
+        self.steps = set(steps)
+        self._outputs = {}
+
+    @classmethod
+    def is_supported(cls, model) -> bool:
+        """Return whether the model has staged predictions."""
+        return get_model_of_pipeline(model).__class__.__name__ in cls.SUPPORTED_MODELS
+
+    def partial_model(self, step) -> '_StagedPartialBoostingModel':
+        """Return model with `predict` and `predict_proba` methods limited to the given number of estimators."""
+        return _StagedPartialBoostingModel(self, step)
+
+    def output(self, method, x, step):
+        """Return output of the model method on x, limited to the given number of estimators."""
+        index = getattr(x, 'index', None)
+        if method not in self._outputs or index is None or not self._outputs[method][0].equals(index):
+            self._outputs[method] = (index, self._staged_outputs(method, x))
+        return self._outputs[method][1][step]
+
+    def _staged_outputs(self, method, x):
+        if isinstance(self.model, Pipeline) and len(self.model.steps) > 1:
+            x = self.model[:-1].transform(x)
+        staged_method = getattr(get_model_of_pipeline(self.model), f'staged_{method}')
+        outputs = {}
+        for step, output in enumerate(staged_method(x), start=1):
+            if step in self.steps:
+                outputs[step] = output
+                if len(outputs) == len(self.steps):
+                    break
+        return outputs
+
+
+class _StagedPartialBoostingModel:
+    """Model limited to a number of estimators, with predictions taken from staged predictions."""
+
+    def __init__(self, staged_predictions: StagedBoostingPredictions, step):
+        self.staged_predictions = staged_predictions
+        self.step = step
+
+    def predict_proba(self, x):
+        return self.staged_predictions.output('predict_proba', x, self.step)
+
+    def predict(self, x):
+        return self.staged_predictions.output('predict', x, self.step)
+
+
 class BoostingOverfit(TrainTestCheck):
     """Check for overfit caused by using too many iterations in a gradient boosted model.
 
@@ -169,11 +240,17 @@ class BoostingOverfit(TrainTestCheck):
         num_estimators = PartialBoostingModel.n_estimators(model)
         estimator_steps = _calculate_steps(self.num_steps, num_estimators)
 
-        train_scores = []
-        test_scores = []
-        for step in estimator_steps:
-            train_scores.append(_partial_score(scorer, train_dataset, model, step))
-            test_scores.append(_partial_score(scorer, test_dataset, model, step))
+        if StagedBoostingPredictions.is_supported(model):
+            train_predictions = StagedBoostingPredictions(model, estimator_steps)
+            test_predictions = StagedBoostingPredictions(model, estimator_steps)
+            train_scores = [scorer(train_predictions.partial_model(step), train_dataset) for step in estimator_steps]
+            test_scores = [scorer(test_predictions.partial_model(step), test_dataset) for step in estimator_steps]
+        else:
+            train_scores = []
+            test_scores = []
+            for step in estimator_steps:
+                train_scores.append(_partial_score(scorer, train_dataset, model, step))
+                test_scores.append(_partial_score(scorer, test_dataset, model, step))
 
         fig = go.Figure()
         fig.add_trace(go.Scatter(x=estimator_steps, y=np.array(train_scores),
@@ -46,7 +46,7 @@ class CalibrationScore(SingleDatasetCheck):
         context.assert_classification_task()
         ds_x = dataset.features_columns
         ds_y = dataset.label_col
-        model = t.cast(ClassificationModel, context.model)
+        model = t.cast(ClassificationModel, context.get_cached_model(dataset_type))
 
         # Expect predict_proba to return in order of the sorted classes.
         y_pred = model.predict_proba(ds_x)
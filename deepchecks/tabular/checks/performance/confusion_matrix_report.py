@@ -43,7 +43,7 @@ class ConfusionMatrixReport(SingleDatasetCheck):
         context.assert_classification_task()
         ds_y = dataset.label_col
         ds_x = dataset.features_columns
-        model = context.model
+        model = context.get_cached_model(dataset_type)
 
         y_pred = model.predict(ds_x)
         confusion_matrix = sklearn.metrics.confusion_matrix(ds_y, y_pred)
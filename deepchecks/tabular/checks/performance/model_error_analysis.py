@@ -109,7 +109,8 @@ class ModelErrorAnalysis(TrainTestCheck):
         test_dataset = context.test
         train_dataset.assert_label()
         task_type = context.task_type
-        model = context.model
+        train_model = context.get_cached_model('train')
+        test_model = context.get_cached_model('test')
 
         scorer = context.get_single_scorer(self.user_scorer)
 
@@ -118,19 +119,19 @@ class ModelErrorAnalysis(TrainTestCheck):
 
         # Create scoring function, used to calculate the per sample model error
         if task_type == ModelType.REGRESSION:
-            def scoring_func(dataset: Dataset):
+            def scoring_func(dataset: Dataset, model):
                 return per_sample_mse(dataset.label_col, model.predict(dataset.features_columns))
         else:
             le = preprocessing.LabelEncoder()
             le.fit(train_dataset.classes)
 
-            def scoring_func(dataset: Dataset):
+            def scoring_func(dataset: Dataset, model):
                 encoded_label = le.transform(dataset.label_col)
                 return per_sample_binary_cross_entropy(encoded_label,
                                                        model.predict_proba(dataset.features_columns))
 
-        train_scores = scoring_func(train_dataset)
-        test_scores = scoring_func(test_dataset)
+        train_scores = scoring_func(train_dataset, train_model)
+        test_scores = scoring_func(test_dataset, test_model)
 
         cat_features = train_dataset.cat_features
         numeric_features = [num_feature for num_feature in train_dataset.features if num_feature not in cat_features]
@@ -147,7 +148,7 @@ class ModelErrorAnalysis(TrainTestCheck):
         display, value = error_model_display(error_fi,
                                              error_model_predicted,
                                              test_dataset,
-                                             model,
+                                             test_model,
                                              scorer,
                                              self.max_features_to_show,
                                              self.min_feature_contribution,
@@ -80,12 +80,12 @@ class PerformanceReport(TrainTestCheck):
         train_dataset = context.train
         test_dataset = context.test
 
-        model = context.model
         task_type = context.task_type
         classes = train_dataset.classes
 
         scorers = context.get_scorers(self.user_scorers, class_avg=False)
         datasets = {'Train': train_dataset, 'Test': test_dataset}
+        models = {'Train': context.get_cached_model('train'), 'Test': context.get_cached_model('test')}
 
         if task_type in {ModelType.MULTICLASS, ModelType.BINARY}:
             plot_x_axis = 'Class'
@@ -98,7 +98,7 @@ class PerformanceReport(TrainTestCheck):
                     [dataset_name, class_name, scorer.name, class_score, n_samples[class_name]]
                     for scorer in scorers
                     # scorer returns numpy array of results with item per class
-                    for class_score, class_name in zip(scorer(model, dataset), classes)
+                    for class_score, class_name in zip(scorer(models[dataset_name], dataset), classes)
                 )
 
             results_df = pd.DataFrame(results, columns=['Dataset', 'Class', 'Metric', 'Value', 'Number of samples'])
@@ -106,7 +106,8 @@ class PerformanceReport(TrainTestCheck):
         else:
             plot_x_axis = 'Dataset'
             results = [
-                [dataset_name, scorer.name, scorer(model, dataset), cast(pd.Series, dataset.label_col).count()]
+                [dataset_name, scorer.name, scorer(models[dataset_name], dataset),
+                 cast(pd.Series, dataset.label_col).count()]
                 for dataset_name, dataset in datasets.items()
                 for scorer in scorers
             ]
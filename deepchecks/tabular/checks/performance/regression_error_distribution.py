@@ -62,7 +62,7 @@ class RegressionErrorDistribution(SingleDatasetCheck):
             dataset = context.test
 
         context.assert_regression_task()
-        model = context.model
+        model = context.get_cached_model(dataset_type)
         x_test = dataset.features_columns
         y_test = dataset.label_col
 
@@ -59,7 +59,7 @@ class RocReport(SingleDatasetCheck):
         context.assert_classification_task()
         ds_y = dataset.label_col
         ds_x = dataset.features_columns
-        y_pred_prob = context.model.predict_proba(ds_x)
+        y_pred_prob = context.get_cached_model(dataset_type).predict_proba(ds_x)
 
         dataset_classes = dataset.classes
         multi_y = (np.array(ds_y)[:, None] == np.unique(ds_y)).astype(int)
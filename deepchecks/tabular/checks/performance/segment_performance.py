@@ -12,12 +12,13 @@
 from typing import Callable, Union, Optional, List, cast, Tuple
 
 import numpy as np
+import pandas as pd
 import plotly.figure_factory as ff
 
-from deepchecks.tabular import Context, SingleDatasetCheck, Dataset
+from deepchecks.tabular import Context, SingleDatasetCheck
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DeepchecksValueError, DatasetValidationError
-from deepchecks.utils.performance.partition import partition_column
+from deepchecks.utils.performance.partition import partition_column, DeepchecksFilter
 from deepchecks.utils.strings import format_number
 from deepchecks.utils.typing import Hashable
 
@@ -75,7 +76,7 @@ class SegmentPerformance(SingleDatasetCheck):
         else:
             dataset = context.test
 
-        model = context.model
+        model = context.get_cached_model(dataset_type)
         features_importance = context.features_importance
         scorer = context.get_single_scorer(self.user_scorer)
         dataset.assert_features()
@@ -88,7 +89,8 @@ class SegmentPerformance(SingleDatasetCheck):
             if features_importance is None:
                 self.feature_1, self.feature_2, *_ = features
             else:
-                features_importance.sort_values(ascending=False, inplace=True)
+                # Sorted as a copy, as the features importance of the context is shared with the other checks
+                features_importance = features_importance.sort_values(ascending=False)
                 self.feature_1, self.feature_2, *_ = cast(List[Hashable], list(features_importance.keys()))
 
         elif self.feature_1 is None or self.feature_2 is None:
@@ -97,24 +99,24 @@ class SegmentPerformance(SingleDatasetCheck):
         feature_1_filters = partition_column(dataset, self.feature_1, max_segments=self.max_segments)
         feature_2_filters = partition_column(dataset, self.feature_2, max_segments=self.max_segments)
 
-        scores = np.empty((len(feature_1_filters), len(feature_2_filters)), dtype=float)
-        counts = np.empty((len(feature_1_filters), len(feature_2_filters)), dtype=int)
-
-        for i, feature_1_filter in enumerate(feature_1_filters):
-            data = dataset.data
-            feature_1_df = feature_1_filter.filter(data)
-            for j, feature_2_filter in enumerate(feature_2_filters):
-                feature_2_df = feature_2_filter.filter(feature_1_df)
-
-                # Run on filtered data and save to matrix
-                if feature_2_df.empty:
-                    score = np.NaN
-                else:
-                    score = scorer(model,
-                                   Dataset(feature_2_df, features=dataset.features,
-                                           label=dataset.label_name, cat_features=dataset.cat_features))
-                scores[i, j] = score
-                counts[i, j] = len(feature_2_df)
+        # Each row is assigned to the cell of its segments once, and the cells are scored on views of the dataset, so
+        # the predictions of the whole dataset (cached by the context) are reused by all the cells
+        data = dataset.data
+        feature_1_codes = _segments_codes(data, feature_1_filters)
+        feature_2_codes = _segments_codes(data, feature_2_filters)
+        in_cell = (feature_1_codes >= 0) & (feature_2_codes >= 0)
+        cell_codes = feature_1_codes * len(feature_2_filters) + feature_2_codes
+        shape = (len(feature_1_filters), len(feature_2_filters))
+
+        positions = np.flatnonzero(in_cell)
+        positions = positions[np.argsort(cell_codes[positions], kind='stable')]
+        counts = np.bincount(cell_codes[in_cell], minlength=shape[0] * shape[1]).reshape(shape)
+        cells_positions = np.split(positions, np.cumsum(counts.ravel())[:-1])
+
+        scores = np.full(shape, np.NaN, dtype=float)
+        for (i, j), cell_positions in zip(np.ndindex(*shape), cells_positions):
+            if len(cell_positions) > 0:
+                scores[i, j] = scorer(model, dataset.select_rows(cell_positions))
 
         x = [v.label for v in feature_2_filters]
         y = [v.label for v in feature_1_filters]
@@ -140,3 +142,11 @@ class SegmentPerformance(SingleDatasetCheck):
 
         value = {'scores': scores, 'counts': counts, 'feature_1': self.feature_1, 'feature_2': self.feature_2}
         return CheckResult(value, display=fig)
+
+
+def _segments_codes(data: pd.DataFrame, filters: List[DeepchecksFilter]) -> np.ndarray:
+    """Return the index of the segment of each row in the given disjoint filters, or -1 if it is in none of them."""
+    codes = np.full(len(data), -1, dtype=int)
+    for i, segment_filter in enumerate(filters):
+        codes[np.asarray(segment_filter.filter_func(data), dtype=bool)] = i
+    return codes
@@ -120,7 +120,7 @@ class SimpleModelComparison(TrainTestCheck):
         simple_model = self._create_simple_model(train_dataset, task_type)
 
         models = [
-            (f'{type(model).__name__} model', 'Origin', model),
+            (f'{type(model).__name__} model', 'Origin', context.get_cached_model('test')),
             (f'Simple model - {self.simple_model_type}', 'Simple', simple_model)
         ]
 
@@ -9,8 +9,11 @@
 # ----------------------------------------------------------------------------
 #
 """Module for base tabular context."""
+import threading
+from functools import partial
 from typing import Callable, Union, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
 from deepchecks.tabular.dataset import Dataset
@@ -18,6 +21,7 @@ from deepchecks.utils.validation import validate_model, model_type_validation
 from deepchecks.utils.metrics import ModelType, task_type_check, get_default_scorers, init_validate_scorers
 from deepchecks.utils.typing import BasicModel
 from deepchecks.utils.features import calculate_feature_importance_or_none
+from deepchecks.utils.feature_importance_cache import FeatureImportanceCache, get_feature_importance_cache
 from deepchecks.core.errors import (
     DatasetValidationError, ModelValidationError,
     DeepchecksNotSupportedError, DeepchecksValueError
@@ -29,6 +33,34 @@ __all__ = [
 ]
 
 
+class _CachedPredictionsModel:
+    """Model wrapper serving predict and predict_proba on rows of a context dataset from the context cache.
+
+    Parameters
+    ----------
+    context : Context
+        The context holding the model and the predictions cache
+    dataset_type : str
+        The dataset ('train' or 'test') predicted on
+    """
+
+    def __init__(self, context: 'Context', dataset_type: str):
+        self._context = context
+        self._dataset_type = dataset_type
+
+    def __getattr__(self, name):
+        """Return attribute of the wrapped model, with predict and predict_proba served from the cache."""
+        # Avoid infinite recursion when the wrapper attributes are not set yet (for example when copied)
+        if name.startswith('__') or name in ('_context', '_dataset_type'):
+            raise AttributeError(name)
+        # Raises AttributeError if the model doesn't have the attribute, so hasattr works as on the model itself
+        attribute = getattr(self._context.model, name)
+        if name in ('predict', 'predict_proba'):
+            # pylint: disable=protected-access
+            return partial(self._context._get_model_output, name, self._dataset_type)
+        return attribute
+
+
 class Context:
     """Contains all the data + properties the user has passed to a check/suite, and validates it seamlessly.
 
@@ -47,7 +79,8 @@ class Context:
     feature_importance_force_permutation : bool , default: False
         force calculation of permutation features importance
     feature_importance_timeout : int , default: 120
-        timeout in second for the permutation features importance calculation
+        timeout in second for the permutation features importance calculation. The features are permuted until
+        their importance stabilizes, and when the timeout is reached the importance calculated so far is used
     scorers : Mapping[str, Union[str, Callable]] , default: None
         dict of scorers names to scorer sklearn_name/function
     scorers_per_class : Mapping[str, Union[str, Callable]] , default: None
@@ -55,6 +88,9 @@ class Context:
         See <a href=
         "https://scikit-learn.org/stable/modules/model_evaluation.html#from-binary-to-multiclass-and-multilabel">
         scikit-learn docs</a>
+    feature_importance_cache : Union[str, FeatureImportanceCache] , default: None
+        persistent cache of the calculated features importance, or a path of a directory to use as cache. Features
+        importance calculated in previous runs on equal model and dataset is read from the cache
     """
 
     def __init__(self,
@@ -66,7 +102,8 @@ class Context:
                  feature_importance_force_permutation: bool = False,
                  feature_importance_timeout: int = 120,
                  scorers: Mapping[str, Union[str, Callable]] = None,
-                 scorers_per_class: Mapping[str, Union[str, Callable]] = None
+                 scorers_per_class: Mapping[str, Union[str, Callable]] = None,
+                 feature_importance_cache: Union[str, FeatureImportanceCache] = None
                  ):
         # Validations
         if train is None and test is None and model is None:
@@ -105,6 +142,7 @@ class Context:
         self._feature_importance_force_permutation = feature_importance_force_permutation
         self._features_importance = features_importance
         self._feature_importance_timeout = feature_importance_timeout
+        self._feature_importance_cache = get_feature_importance_cache(feature_importance_cache)
         self._calculated_importance = False
         self._importance_type = None
         self._validated_model = False
@@ -112,6 +150,23 @@ class Context:
         self._user_scorers = scorers
         self._user_scorers_per_class = scorers_per_class
         self._model_name = model_name
+        # Cache of model outputs on the whole datasets, by dataset type and model method
+        self._model_output_cache = {}
+        # Features of the datasets the cached model outputs were computed on, by dataset type
+        self._model_output_features = {}
+        # Guards lazily computed properties when checks of a suite are run on multiple threads
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        """Return the state to pickle, without the lock."""
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        """Restore the pickled state and create a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     # Properties
     # Validations note: We know train & test fit each other so all validations can be run only on train
@@ -156,18 +211,20 @@ class Context:
     @property
     def features_importance(self) -> Optional[pd.Series]:
         """Return features importance, or None if not possible."""
-        if not self._calculated_importance:
-            if self._model and (self._train or self._test):
-                permutation_kwargs = {'timeout': self._feature_importance_timeout}
-                dataset = self.test if self.have_test() else self.train
-                importance, importance_type = calculate_feature_importance_or_none(
-                    self._model, dataset, self._feature_importance_force_permutation, permutation_kwargs
-                )
-                self._features_importance = importance
-                self._importance_type = importance_type
-            else:
-                self._features_importance = None
-            self._calculated_importance = True
+        with self._lock:
+            if not self._calculated_importance:
+                if self._model and (self._train or self._test):
+                    permutation_kwargs = {'timeout': self._feature_importance_timeout, 'adaptive': True}
+                    dataset = self.test if self.have_test() else self.train
+                    importance, importance_type = calculate_feature_importance_or_none(
+                        self._model, dataset, self._feature_importance_force_permutation, permutation_kwargs,
+                        cache=self._feature_importance_cache
+                    )
+                    self._features_importance = importance
+                    self._importance_type = importance_type
+                else:
+                    self._features_importance = None
+                self._calculated_importance = True
 
         return self._features_importance
 
@@ -180,6 +237,49 @@ class Context:
             return self._importance_type
         return None
 
+    def get_cached_model(self, dataset_type: str = 'train'):
+        """Return the model, with predictions on rows of the given dataset computed once and cached.
+
+        The returned object can be used in place of the model (for example, passed to scorers). Calls to predict
+        and predict_proba with a DataFrame of the dataset features, or a subset of its rows, are served from the
+        cache. The rows are matched by their index, and the features are compared to the dataset features of the
+        rows, so modified features are passed to the model. Any other input is passed to the model.
+
+        Parameters
+        ----------
+        dataset_type : str , default: 'train'
+            the dataset the predictions are on, 'train' or 'test'
+        """
+        # Validate the model exists
+        _ = self.model
+        return _CachedPredictionsModel(self, dataset_type)
+
+    def _get_model_output(self, method: str, dataset_type: str, features: pd.DataFrame):
+        """Return output of the model method on the given features, using the cache if the rows are known."""
+        dataset = self.train if dataset_type == 'train' else self.test
+        if isinstance(features, pd.DataFrame) and list(features.columns) == dataset.features:
+            key = (dataset_type, method)
+            with self._lock:
+                if dataset_type not in self._model_output_features:
+                    self._model_output_features[dataset_type] = dataset.features_columns
+                dataset_features = self._model_output_features[dataset_type]
+                if key not in self._model_output_cache:
+                    output = getattr(self.model, method)(dataset_features)
+                    self._model_output_cache[key] = np.asarray(output)
+            output = self._model_output_cache[key]
+            if features is dataset_features:
+                return output.copy()
+            dataset_index = dataset_features.index
+            if features.index.equals(dataset_index):
+                if features.equals(dataset_features):
+                    return output.copy()
+            elif dataset_index.is_unique:
+                positions = dataset_index.get_indexer(features.index)
+                # The cached predictions are used only if the features are equal to the dataset features of the rows
+                if (positions >= 0).all() and features.equals(dataset_features.iloc[positions]):
+                    return output[positions]
+        return getattr(self.model, method)(features)
+
     def have_test(self):
         """Return whether there is test dataset defined."""
         return self._test is not None
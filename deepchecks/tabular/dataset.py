@@ -12,6 +12,7 @@
 # pylint: disable=inconsistent-quotes,protected-access
 import typing as t
 import logging
+from copy import copy
 from functools import lru_cache
 
 import numpy as np
@@ -19,6 +20,7 @@ import pandas as pd
 from pandas.core.dtypes.common import is_numeric_dtype
 from sklearn.model_selection import train_test_split
 
+from deepchecks.utils.column_profile import ColumnProfile
 from deepchecks.utils.dataframes import select_from_dataframe
 from deepchecks.utils.features import is_categorical, infer_categorical_features
 from deepchecks.utils.typing import Hashable
@@ -96,7 +98,9 @@ class Dataset:
     _set_datetime_from_dataframe_index: t.Optional[bool]
     _datetime_column: t.Optional[pd.Series]
     _cat_features: t.List[Hashable]
-    _data: pd.DataFrame
+    _data: t.Optional[pd.DataFrame]
+    _view_of: t.Optional[t.Tuple[pd.DataFrame, t.Optional[np.ndarray], t.Optional[t.List[Hashable]]]]
+    _column_profiles: t.Dict[Hashable, ColumnProfile]
     _max_categorical_ratio: float
     _max_categories: int
     _label_type: t.Optional[str]
@@ -120,6 +124,8 @@ class Dataset:
     ):
 
         self._data = df.copy()
+        self._view_of = None
+        self._column_profiles = {}
 
         # Validations
         if label is None:
@@ -264,7 +270,9 @@ class Dataset:
                 max_categorical_ratio=max_categorical_ratio,
                 max_categories=max_categories,
                 max_float_categories=max_float_categories,
-                columns=self._features
+                columns=self._features,
+                column_profile=self.column_profile,
+                bounded=True
             )
 
         if ((self._datetime_name is not None) or self._set_datetime_from_dataframe_index) and convert_datetime:
@@ -272,6 +280,7 @@ class Dataset:
                 self._datetime_column = pd.to_datetime(self._datetime_column, **self._datetime_args)
             else:
                 self._data[self._datetime_name] = pd.to_datetime(self._data[self._datetime_name], **self._datetime_args)
+                self._column_profiles.pop(self._datetime_name, None)
 
         if label_type:
             self._label_type = label_type
@@ -396,8 +405,100 @@ class Dataset:
     @property
     def data(self) -> pd.DataFrame:
         """Return the data of dataset."""
+        if self._data is None:
+            # Data of a view is taken from the shared data only when first accessed
+            self._data = self._take_from_source(self._view_of[2])
+            self._view_of = None
         return self._data
 
+    def _source(self) -> t.Tuple[pd.DataFrame, t.Optional[np.ndarray], t.Optional[t.List[Hashable]]]:
+        """Return the data this dataset is taken from, with the positions of its rows and its columns (or None)."""
+        if self._data is not None:
+            return self._data, None, None
+        return self._view_of
+
+    def _take_from_source(self, columns: t.Optional[t.List[Hashable]]) -> pd.DataFrame:
+        """Return the given columns (or all columns) of the rows of this dataset, taken from its source data."""
+        source, rows, view_columns = self._source()
+        columns = columns if columns is not None else view_columns
+        # The rows are taken first, so the columns are not copied for all the rows of the source
+        if rows is not None:
+            source = source.take(rows)
+        if columns is not None:
+            source = source.take(source.columns.get_indexer(columns), axis=1)
+        return source
+
+    def _column(self, column: Hashable) -> pd.Series:
+        """Return column of this dataset, without taking the other columns of a view."""
+        source, rows, _ = self._source()
+        return source[column] if rows is None else source[column].take(rows)
+
+    def _view(self: TDataset, rows: t.Optional[np.ndarray] = None,
+              columns: t.Optional[t.List[Hashable]] = None) -> TDataset:
+        """Create dataset of the given rows positions and columns of this dataset, which shares its data.
+
+        The metadata of this dataset is carried over without validations or inference, and the data is taken only
+        when it is accessed.
+        """
+        source, source_rows, source_columns = self._source()
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.intp)
+            source_rows = rows if source_rows is None else source_rows[rows]
+        if columns is not None:
+            source_columns = list(columns)
+
+        new_dataset = copy(self)
+        new_dataset._data = None
+        new_dataset._view_of = (source, source_rows, source_columns)
+        new_dataset._column_profiles = {}
+        if columns is not None:
+            new_dataset._features = [feat for feat in self._features if feat in columns]
+            new_dataset._cat_features = [feat for feat in self._cat_features if feat in columns]
+            if self._label_name not in columns:
+                new_dataset._label_name = None
+            if not self._set_index_from_dataframe_index and self._index_name not in columns:
+                new_dataset._index_name = None
+            if not self._set_datetime_from_dataframe_index and self._datetime_name not in columns:
+                new_dataset._datetime_name = None
+        if rows is not None and self._set_datetime_from_dataframe_index:
+            new_dataset._datetime_column = self._datetime_column.iloc[rows]
+        return new_dataset
+
+    def select_rows(self: TDataset, rows: t.Union[pd.Series, np.ndarray, t.Sequence]) -> TDataset:
+        """Create dataset of a subset of the rows of this dataset, without copying the data.
+
+        Parameters
+        ----------
+        rows : t.Union[pd.Series, np.ndarray, t.Sequence]
+            Either boolean mask of the rows to keep (null values are treated as False), or the positions of the rows
+            to keep.
+
+        Returns
+        -------
+        Dataset
+            new dataset instance, sharing the data of this dataset until its data is accessed
+        """
+        if not isinstance(rows, (np.ndarray, pd.Series, pd.api.extensions.ExtensionArray)):
+            rows = np.asarray(rows)
+        if pd.api.types.is_bool_dtype(rows) or \
+                (pd.api.types.is_object_dtype(rows) and pd.api.types.infer_dtype(rows) == 'boolean'):
+            if len(rows) != self.n_samples:
+                raise DeepchecksValueError(f'Boolean mask of rows must have length of {self.n_samples}, '
+                                           f'but got: {len(rows)}')
+            # Nullable boolean masks are converted with null treated as False, as done by pandas when filtering
+            rows = pd.array(rows, dtype='boolean').to_numpy(dtype=bool, na_value=False)
+            if rows.all():
+                return self
+            rows = np.flatnonzero(rows)
+        elif pd.api.types.is_integer_dtype(rows):
+            rows = np.asarray(rows, dtype=np.int64)
+        elif len(rows) == 0:
+            rows = np.empty(0, dtype=np.int64)
+        else:
+            raise DeepchecksValueError(f'Rows must be either boolean mask or integer positions, but got values of '
+                                       f'type: {rows.dtype}')
+        return self._view(rows=rows)
+
     def copy(self: TDataset, new_data: pd.DataFrame) -> TDataset:
         """Create a copy of this Dataset with new data.
 
@@ -445,12 +546,13 @@ class Dataset:
             instance of the Dataset with sampled internal dataframe.
         """
         if drop_na_label and self.label_name:
-            valid_idx = self.data[self.label_name].notna()
-            data_to_sample = self.data[valid_idx]
+            rows_to_sample = np.flatnonzero(self._column(self.label_name).notna().to_numpy())
         else:
-            data_to_sample = self.data
-        n_samples = min(n_samples, len(data_to_sample))
-        return self.copy(data_to_sample.sample(n_samples, replace=replace, random_state=random_state))
+            rows_to_sample = np.arange(self.n_samples)
+        n_samples = min(n_samples, len(rows_to_sample))
+        # Sampling the positions draws the same rows as sampling the dataframe, without copying it
+        sampled_rows = pd.Series(rows_to_sample).sample(n_samples, replace=replace, random_state=random_state)
+        return self._view(rows=sampled_rows.to_numpy())
 
     @property
     def n_samples(self) -> int:
@@ -461,7 +563,8 @@ class Dataset:
         int
             Number of samples in dataframe
         """
-        return self.data.shape[0]
+        source, rows, _ = self._source()
+        return len(source) if rows is None else len(rows)
 
     def __len__(self) -> int:
         """Return number of samples in the member dataframe.
@@ -519,13 +622,14 @@ class Dataset:
         if isinstance(stratify, bool):
             stratify = self.label_col if stratify else None
 
-        train_df, test_df = train_test_split(self._data,
-                                             test_size=test_size,
-                                             train_size=train_size,
-                                             random_state=random_state,
-                                             shuffle=shuffle,
-                                             stratify=stratify)
-        return self.copy(train_df), self.copy(test_df)
+        # Splitting the positions gives the same split as splitting the dataframe, without copying it
+        train_rows, test_rows = train_test_split(np.arange(self.n_samples),
+                                                 test_size=test_size,
+                                                 train_size=train_size,
+                                                 random_state=random_state,
+                                                 shuffle=shuffle,
+                                                 stratify=stratify)
+        return self._view(rows=train_rows), self._view(rows=test_rows)
 
     @staticmethod
     def _infer_label_type(
@@ -548,6 +652,8 @@ class Dataset:
             max_categories: int,
             max_float_categories: int,
             columns: t.Optional[t.List[Hashable]] = None,
+            column_profile: t.Optional[t.Callable[[Hashable], ColumnProfile]] = None,
+            bounded: bool = False
     ) -> t.List[Hashable]:
         """Infers which features are categorical by checking types and number of unique values.
 
@@ -558,6 +664,8 @@ class Dataset:
         max_categories: int
         max_float_categories: int
         columns: t.Optional[t.List[Hashable]] , default: None
+        column_profile: t.Optional[t.Callable[[Hashable], ColumnProfile]] , default: None
+        bounded: bool , default: False
         Returns
         -------
         t.List[Hashable]
@@ -568,7 +676,9 @@ class Dataset:
             max_categorical_ratio=max_categorical_ratio,
             max_categories=max_categories,
             max_float_categories=max_float_categories,
-            columns=columns
+            columns=columns,
+            column_profile=column_profile,
+            bounded=bounded
         )
 
         if len(categorical_columns) > 0:
@@ -603,13 +713,35 @@ class Dataset:
             If is categorical according to input numbers
 
         """
-        return is_categorical(
-            t.cast(pd.Series, self._data[col_name]),
+        return self.column_profile(col_name).is_categorical(
             max_categorical_ratio=self._max_categorical_ratio,
             max_categories=self._max_categories,
             max_float_categories=self._max_float_categories
         )
 
+    def column_profile(self, column: Hashable) -> ColumnProfile:
+        """Return the profile of the column, which memoizes statistics of the column such as its values counts.
+
+        The profile is kept by the dataset, so statistics computed by one check are reused by the following checks.
+        The data of the dataset should not be changed in place after profiles are computed.
+
+        Parameters
+        ----------
+        column : Hashable
+            name of the column
+
+        Returns
+        -------
+        ColumnProfile
+            profile of the column
+        """
+        if column not in self._column_profiles:
+            source, _, view_columns = self._source()
+            if column not in (view_columns if view_columns is not None else source.columns):
+                raise DeepchecksValueError(f'Column {column} not found in dataset columns')
+            self._column_profiles[column] = ColumnProfile(self._column(column))
+        return self._column_profiles[column]
+
     @property
     def index_name(self) -> t.Optional[Hashable]:
         """If index column exists, return its name.
@@ -640,7 +772,7 @@ class Dataset:
             else:
                 raise DeepchecksValueError(f'Don\'t know to handle index_name of type {type(self._index_name)}')
         elif self._index_name is not None:
-            return self.data[self._index_name]
+            return self._column(self._index_name)
         else:  # No meaningful index to use: Index column not configured, and _set_index_from_dataframe_index is False
             return
 
@@ -676,7 +808,7 @@ class Dataset:
         if self._set_datetime_from_dataframe_index is True:
             return self._datetime_column
         elif self._datetime_name is not None:
-            return self.data[self._datetime_name]
+            return self._column(self._datetime_name)
         else:  # No meaningful Datetime to use: Datetime column not configured, and _set_datetime_from_dataframe_index
             # is False
             return
@@ -712,6 +844,8 @@ class Dataset:
         pd.DataFrame
         """
         self.assert_features()
+        if self._data is None:
+            return self._take_from_source(self.features)
         return self.data[self.features]
 
     @property
@@ -723,7 +857,7 @@ class Dataset:
         pd.Series
         """
         self.assert_label()
-        return self.data[self.label_name]
+        return self._column(self.label_name)
 
     @property
     def cat_features(self) -> t.List[Hashable]:
@@ -747,7 +881,7 @@ class Dataset:
             Sorted classes
         """
         if self.label_name is not None:
-            return tuple(sorted(self.data[self.label_name].dropna().unique().tolist()))
+            return tuple(sorted(self._column(self.label_name).dropna().unique().tolist()))
         return tuple()
 
     @property
@@ -760,7 +894,8 @@ class Dataset:
            Directory of a column and its role
         """
         columns = {}
-        for column in self.data.columns:
+        source, _, view_columns = self._source()
+        for column in (view_columns if view_columns is not None else source.columns):
             if column == self._index_name:
                 value = 'index'
             elif column == self._datetime_name:
@@ -849,11 +984,14 @@ class Dataset:
         if keep_label and columns and self.label_name not in columns:
             columns.append(self.label_name)
 
-        new_data = select_from_dataframe(self._data, columns, ignore_columns)
-        if new_data.equals(self.data):
+        source, _, view_columns = self._source()
+        all_columns = pd.Index(view_columns) if view_columns is not None else source.columns
+        # Selecting from an empty frame with the same columns validates the names and keeps the columns order
+        new_columns = list(select_from_dataframe(pd.DataFrame(columns=all_columns), columns, ignore_columns).columns)
+        if new_columns == list(all_columns):
             return self
         else:
-            return self.copy(new_data)
+            return self._view(columns=new_columns)
 
     @classmethod
     def ensure_not_empty_dataset(cls, obj: t.Any) -> 'Dataset':
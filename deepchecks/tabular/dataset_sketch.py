@@ -0,0 +1,202 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing the DatasetSketch class, a mergeable summary of the distributions of a dataset."""
+import pickle
+import typing as t
+
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksValueError, DatasetValidationError
+from deepchecks.tabular.dataset import Dataset
+from deepchecks.utils.distribution.sketch import NumericSketch, CategoricalSketch
+from deepchecks.utils.typing import Hashable
+
+
+__all__ = ['DatasetSketch']
+
+
+TDatasetSketch = t.TypeVar('TDatasetSketch', bound='DatasetSketch')
+
+
+class DatasetSketch:
+    """Mergeable sketch of the distribution of each column of a dataset, used by drift checks in place of a Dataset.
+
+    The sketch is built chunk by chunk, so datasets which do not fit in memory can be summarized, for example from
+    an iterator over parquet row groups or over `pd.read_csv(..., chunksize=...)`. Numeric columns are summarized by
+    quantile sketches, and categorical columns by the counts of their most common values. Sketches of different
+    chunks can be merged, and a sketch can be saved and loaded to be reused as a reference by later runs.
+
+    Parameters
+    ----------
+    label : Hashable , default: None
+        name of the label column.
+    features : List[Hashable] , default: None
+        names of the feature columns. If None, all the columns except the label.
+    cat_features : List[Hashable] , default: None
+        names of the categorical features. If None, inferred from the first chunk, as done by Dataset.
+    label_type : str , default: None
+        'classification_label' or 'regression_label'. If None, inferred from the first chunk, as done by Dataset.
+    numeric_sketch_size : int , default: 1000
+        number of centroids kept by the sketch of each numeric column.
+    categorical_sketch_capacity : int , default: 10_000
+        number of most common values counted by the sketch of each categorical column. Should be larger than the
+        max_num_categories of the drift checks.
+    """
+
+    def __init__(
+        self,
+        label: Hashable = None,
+        features: t.Optional[t.List[Hashable]] = None,
+        cat_features: t.Optional[t.List[Hashable]] = None,
+        label_type: str = None,
+        numeric_sketch_size: int = 1000,
+        categorical_sketch_capacity: int = 10_000
+    ):
+        self._label_name = label
+        self._features = list(features) if features is not None else None
+        self._cat_features = list(cat_features) if cat_features is not None else None
+        self._label_type = label_type
+        self._numeric_sketch_size = numeric_sketch_size
+        self._categorical_sketch_capacity = categorical_sketch_capacity
+        self._sketches = None
+        self._n_samples = 0
+
+    @classmethod
+    def from_chunks(cls: t.Type[TDatasetSketch], chunks: t.Iterable[pd.DataFrame], **kwargs) -> TDatasetSketch:
+        """Create sketch of the dataset given as an iterable of dataframe chunks.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.DataFrame]
+            chunks of the dataset, such as `pd.read_csv(path, chunksize=100_000)`.
+        **kwargs
+            arguments of the DatasetSketch.
+        """
+        sketch = cls(**kwargs)
+        for chunk in chunks:
+            sketch.update(chunk)
+        return sketch
+
+    @classmethod
+    def from_dataset(cls: t.Type[TDatasetSketch], dataset: Dataset, **kwargs) -> TDatasetSketch:
+        """Create sketch of a dataset, with the same features, categorical features and label.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            the dataset to summarize.
+        **kwargs
+            arguments of the sketches sizes.
+        """
+        sketch = cls(label=dataset.label_name, features=dataset.features, cat_features=dataset.cat_features,
+                     label_type=dataset.label_type, **kwargs)
+        return sketch.update(dataset.data)
+
+    def like(self, data: t.Union[Dataset, pd.DataFrame]) -> 'DatasetSketch':
+        """Create sketch of other data, with the same columns roles and sketches sizes as this sketch."""
+        if self._sketches is None:
+            raise DeepchecksValueError('Can\'t create sketch like an empty sketch')
+        sketch = DatasetSketch(self._label_name, self._features, self._cat_features, self._label_type,
+                               self._numeric_sketch_size, self._categorical_sketch_capacity)
+        return sketch.update(data.data if isinstance(data, Dataset) else data)
+
+    def update(self, chunk: pd.DataFrame) -> 'DatasetSketch':
+        """Add the rows of a chunk of the dataset to the sketch."""
+        if self._sketches is None:
+            self._init_sketches(chunk)
+        columns = list(self._sketches)
+        missing_columns = set(columns) - set(chunk.columns)
+        if missing_columns:
+            raise DatasetValidationError(f'Chunk is missing the columns: {sorted(map(str, missing_columns))}')
+        for column in columns:
+            self._sketches[column].update(chunk[column])
+        self._n_samples += len(chunk)
+        return self
+
+    def _init_sketches(self, chunk: pd.DataFrame):
+        # Infer the missing columns roles from the first chunk, as done by Dataset
+        if self._features is None or self._cat_features is None or \
+                (self._label_name is not None and self._label_type is None):
+            dataset = Dataset(chunk, label=self._label_name, features=self._features,
+                              cat_features=self._cat_features, label_type=self._label_type)
+            self._features = dataset.features
+            self._cat_features = dataset.cat_features
+            self._label_type = dataset.label_type
+
+        self._sketches = {column: self._new_column_sketch(column in self._cat_features)
+                          for column in self._features}
+        if self._label_name is not None:
+            self._sketches[self._label_name] = self._new_column_sketch(self._label_type == 'classification_label')
+
+    def _new_column_sketch(self, is_categorical: bool) -> t.Union[NumericSketch, CategoricalSketch]:
+        if is_categorical:
+            return CategoricalSketch(self._categorical_sketch_capacity)
+        return NumericSketch(self._numeric_sketch_size)
+
+    def merge(self, other: 'DatasetSketch') -> 'DatasetSketch':
+        """Return new sketch of the rows of both sketches, which should have the same columns roles."""
+        if (self._features, self._cat_features, self._label_name) != \
+                (other._features, other._cat_features, other._label_name):
+            raise DeepchecksValueError('Can\'t merge sketches with different features, categorical features or label')
+        merged = DatasetSketch(self._label_name, self._features, self._cat_features, self._label_type,
+                               self._numeric_sketch_size, self._categorical_sketch_capacity)
+        if self._sketches is not None and other._sketches is not None:
+            merged._sketches = {column: sketch.merge(other._sketches[column])
+                                for column, sketch in self._sketches.items()}
+        else:
+            merged._sketches = self._sketches if self._sketches is not None else other._sketches
+        merged._n_samples = self._n_samples + other._n_samples
+        return merged
+
+    def save(self, path: str):
+        """Save the sketch to a file."""
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'DatasetSketch':
+        """Load sketch saved by `save`."""
+        with open(path, 'rb') as f:
+            sketch = pickle.load(f)
+        if not isinstance(sketch, cls):
+            raise DeepchecksValueError(f'File does not contain a {cls.__name__}')
+        return sketch
+
+    @property
+    def n_samples(self) -> int:
+        """Return number of rows summarized by the sketch."""
+        return self._n_samples
+
+    @property
+    def features(self) -> t.List[Hashable]:
+        """Return list of feature names."""
+        return list(self._features or [])
+
+    @property
+    def cat_features(self) -> t.List[Hashable]:
+        """Return list of categorical feature names."""
+        return list(self._cat_features or [])
+
+    @property
+    def label_name(self) -> t.Optional[Hashable]:
+        """Return name of the label column."""
+        return self._label_name
+
+    @property
+    def label_type(self) -> t.Optional[str]:
+        """Return type of the label."""
+        return self._label_type
+
+    def column_sketch(self, column: Hashable) -> t.Union[NumericSketch, CategoricalSketch]:
+        """Return sketch of the distribution of the column."""
+        if self._sketches is None or column not in self._sketches:
+            raise DeepchecksValueError(f'Sketch does not contain column: {column}')
+        return self._sketches[column]
@@ -10,7 +10,11 @@
 #
 """Module for base tabular abstractions."""
 # pylint: disable=broad-except
-from typing import Callable, Union, Tuple, Mapping, Optional
+import copy
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Callable, Union, Tuple, Mapping, Optional, List
 
 import pandas as pd
 
@@ -18,10 +22,11 @@ from deepchecks.tabular.dataset import Dataset
 from deepchecks.tabular.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
 from deepchecks.tabular.context import Context
 from deepchecks.utils.typing import BasicModel
-from deepchecks.core.check_result import CheckFailure
+from deepchecks.utils.feature_importance_cache import FeatureImportanceCache
+from deepchecks.core.check_result import CheckResult, CheckFailure
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.core.display_suite import ProgressBar
-from deepchecks.core.errors import DeepchecksNotSupportedError
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
 
 
 __all__ = [
@@ -29,6 +34,52 @@ __all__ = [
 ]
 
 
+_BACKENDS = ('thread', 'process')
+
+# Context of the suite run, set once in every worker process of the process backend
+_process_context: Optional[Context] = None
+
+
+def _run_check_logic(check, context: Context, dataset_type: Optional[str] = None, edit_header: bool = False):
+    """Run a single invocation of the check, returning CheckFailure in case of an exception."""
+    if dataset_type is None:
+        try:
+            return check.run_logic(context)
+        except Exception as exp:
+            return CheckFailure(check, exp)
+
+    # In case of train & test, doesn't want to skip test if train fails. so have to explicitly wrap it in try/except
+    header_suffix = f' - {dataset_type.capitalize()} Dataset'
+    try:
+        check_result = check.run_logic(context, dataset_type=dataset_type)
+        if edit_header:
+            check_result.header = f'{check_result.get_header()}{header_suffix}'
+        return check_result
+    except Exception as exp:
+        return CheckFailure(check, exp, header_suffix)
+
+
+def _run_check_invocations(check, context: Context, invocations: List[Tuple[Optional[str], bool]]) -> List:
+    """Run the invocations of the check one after the other, as they share the state of the check."""
+    return [_run_check_logic(check, context, *invocation) for invocation in invocations]
+
+
+def _init_process_worker(context: Context):
+    global _process_context  # pylint: disable=global-statement
+    _process_context = context
+
+
+def _run_check_invocations_in_process(check, invocations: List[Tuple[Optional[str], bool]]) -> List:
+    return _run_check_invocations(check, _process_context, invocations)
+
+
+def _without_conditions(check):
+    """Return copy of the check without its conditions, which are usually local functions that can't be pickled."""
+    check_copy = copy.copy(check)
+    check_copy._conditions = OrderedDict()  # pylint: disable=protected-access
+    return check_copy
+
+
 class Suite(BaseSuite):
     """Tabular suite to run checks of types: TrainTestCheck, SingleDatasetCheck, ModelOnlyCheck."""
 
@@ -46,7 +97,10 @@ class Suite(BaseSuite):
             feature_importance_force_permutation: bool = False,
             feature_importance_timeout: int = None,
             scorers: Mapping[str, Union[str, Callable]] = None,
-            scorers_per_class: Mapping[str, Union[str, Callable]] = None
+            scorers_per_class: Mapping[str, Union[str, Callable]] = None,
+            n_jobs: int = 1,
+            backend: str = 'thread',
+            feature_importance_cache: Union[str, FeatureImportanceCache] = None
     ) -> SuiteResult:
         """Run all checks.
 
@@ -71,72 +125,146 @@ class Suite(BaseSuite):
             See <a href=
             "https://scikit-learn.org/stable/modules/model_evaluation.html#from-binary-to-multiclass-and-multilabel">
             scikit-learn docs</a>
+        n_jobs : int , default 1
+            number of check invocations to run concurrently. -1 means using all processors. When 1, checks are run
+            sequentially
+        backend : str , default 'thread'
+            the pool used when n_jobs is not 1, one of 'thread' or 'process'. With 'process' the context is copied
+            to every worker process, so lazily computed properties (such as features importance) are computed
+            by each worker. The checks are sent to the workers without their conditions, which are processed in the
+            main process
+        feature_importance_cache : Union[str, FeatureImportanceCache] , default None
+            persistent cache of the calculated features importance, or a path of a directory to use as cache.
+            Features importance calculated in previous runs on equal model and dataset is read from the cache
         Returns
         -------
         SuiteResult
             All results by all initialized checks
         """
+        if backend not in _BACKENDS:
+            raise DeepchecksValueError(f'backend must be one of {list(_BACKENDS)}, but got: {backend}')
+        if not isinstance(n_jobs, int) or n_jobs == 0:
+            raise DeepchecksValueError(f'n_jobs must be a non-zero integer, but got: {n_jobs}')
+
         context = Context(train_dataset, test_dataset, model,
                           features_importance=features_importance,
                           feature_importance_force_permutation=feature_importance_force_permutation,
                           feature_importance_timeout=feature_importance_timeout,
                           scorers=scorers,
-                          scorers_per_class=scorers_per_class)
+                          scorers_per_class=scorers_per_class,
+                          feature_importance_cache=feature_importance_cache)
         # Create progress bar
         progress_bar = ProgressBar(self.name, len(self.checks), 'Check')
 
-        # Run all checks
-        results = []
-        for check in self.checks.values():
-            try:
+        # Plan the invocations of every check. Each planned item is either an already known result (an unsupported
+        # check) or the arguments of a single run_logic call
+        planned = [
+            self._plan_check(check, train_dataset is not None, test_dataset is not None, model is not None)
+            for check in self.checks.values()
+        ]
+
+        n_jobs = os.cpu_count() if n_jobs < 0 else n_jobs
+        if n_jobs == 1:
+            results = []
+            for check, invocations in zip(self.checks.values(), planned):
                 progress_bar.set_text(check.name())
-                if isinstance(check, TrainTestCheck):
-                    if train_dataset is not None and test_dataset is not None:
-                        check_result = check.run_logic(context)
-                        results.append(check_result)
-                    else:
-                        msg = 'Check is irrelevant if not supplied with both train and test datasets'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, SingleDatasetCheck):
-                    if train_dataset is not None:
-                        # In case of train & test, doesn't want to skip test if train fails. so have to explicitly
-                        # wrap it in try/except
-                        try:
-                            check_result = check.run_logic(context)
-                            # In case of single dataset not need to edit the header
-                            if test_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Train Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Train Dataset')
-                        results.append(check_result)
-                    if test_dataset is not None:
-                        try:
-                            check_result = check.run_logic(context, dataset_type='test')
-                            # In case of single dataset not need to edit the header
-                            if train_dataset is not None:
-                                check_result.header = f'{check_result.get_header()} - Test Dataset'
-                        except Exception as exp:
-                            check_result = CheckFailure(check, exp, ' - Test Dataset')
-                        results.append(check_result)
-                    if train_dataset is None and test_dataset is None:
-                        msg = 'Check is irrelevant if dataset is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                elif isinstance(check, ModelOnlyCheck):
-                    if model is not None:
-                        check_result = check.run_logic(context)
-                        results.append(check_result)
+                for invocation in invocations:
+                    if isinstance(invocation, CheckFailure):
+                        results.append(invocation)
                     else:
-                        msg = 'Check is irrelevant if model is not supplied'
-                        results.append(Suite._get_unsupported_failure(check, msg))
-                else:
-                    raise TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.')
-            except Exception as exp:
-                results.append(CheckFailure(check, exp))
-            progress_bar.inc_progress()
+                        results.append(_run_check_logic(check, context, *invocation))
+                progress_bar.inc_progress()
+        else:
+            results = self._run_concurrently(context, planned, n_jobs, backend, progress_bar)
 
         progress_bar.close()
         return SuiteResult(self.name, results)
 
+    @classmethod
+    def _plan_check(cls, check, have_train: bool, have_test: bool,
+                    have_model: bool) -> List[Union[CheckFailure, Tuple[Optional[str], bool]]]:
+        """Return the invocations needed for the given check, in the order their results should be shown."""
+        if isinstance(check, TrainTestCheck):
+            if have_train and have_test:
+                return [(None, False)]
+            msg = 'Check is irrelevant if not supplied with both train and test datasets'
+            return [cls._get_unsupported_failure(check, msg)]
+        elif isinstance(check, SingleDatasetCheck):
+            invocations = []
+            # In case of single dataset not need to edit the header
+            if have_train:
+                invocations.append(('train', have_test))
+            if have_test:
+                invocations.append(('test', have_train))
+            if not invocations:
+                msg = 'Check is irrelevant if dataset is not supplied'
+                invocations.append(cls._get_unsupported_failure(check, msg))
+            return invocations
+        elif isinstance(check, ModelOnlyCheck):
+            if have_model:
+                return [(None, False)]
+            msg = 'Check is irrelevant if model is not supplied'
+            return [cls._get_unsupported_failure(check, msg)]
+        return [CheckFailure(check, TypeError(f'Don\'t know how to handle type {check.__class__.__name__} in suite.'))]
+
+    def _run_concurrently(self, context: Context, planned: List, n_jobs: int, backend: str,
+                          progress_bar: ProgressBar) -> List[Union[CheckResult, CheckFailure]]:
+        """Run the planned checks on a pool of workers, returning the results in the planned order.
+
+        Every check is a single task running its invocations one after the other, so the train and test
+        invocations of a check never run concurrently.
+        """
+        checks = list(self.checks.values())
+        results = [list(invocations) for invocations in planned]
+        futures = {}
+
+        if backend == 'process':
+            # The context is sent once to every worker process, and not with every check
+            executor = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_process_worker, initargs=(context,))
+        else:
+            executor = ThreadPoolExecutor(max_workers=n_jobs)
+
+        with executor:
+            for check_index, (check, invocations) in enumerate(zip(checks, planned)):
+                invocation_indices = [index for index, invocation in enumerate(invocations)
+                                      if not isinstance(invocation, CheckFailure)]
+                if not invocation_indices:
+                    # Checks without any invocation to run are done right away
+                    progress_bar.inc_progress()
+                    continue
+                to_run = [invocations[index] for index in invocation_indices]
+                if backend == 'process':
+                    # The conditions are processed here when the results are back, as they can't be pickled
+                    future = executor.submit(_run_check_invocations_in_process, _without_conditions(check), to_run)
+                else:
+                    future = executor.submit(_run_check_invocations, check, context, to_run)
+                futures[future] = (check_index, invocation_indices)
+
+            for future in as_completed(futures):
+                check_index, invocation_indices = futures[future]
+                check = checks[check_index]
+                try:
+                    check_results = future.result()
+                    if backend == 'process':
+                        for result in check_results:
+                            # Results coming from another process hold a copy of the check, point them back to the
+                            # original
+                            result.check = check
+                            if isinstance(result, CheckResult):
+                                result.process_conditions()
+                except Exception as exp:
+                    check_results = []
+                    for invocation_index in invocation_indices:
+                        dataset_type, _ = planned[check_index][invocation_index]
+                        suffix = f' - {dataset_type.capitalize()} Dataset' if dataset_type else ''
+                        check_results.append(CheckFailure(check, exp, suffix))
+                for invocation_index, result in zip(invocation_indices, check_results):
+                    results[check_index][invocation_index] = result
+                progress_bar.set_text(check.name())
+                progress_bar.inc_progress()
+
+        return [result for check_results in results for result in check_results]
+
     @classmethod
     def _get_unsupported_failure(cls, check, msg):
         return CheckFailure(check, DeepchecksNotSupportedError(msg))
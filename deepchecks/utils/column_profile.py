@@ -0,0 +1,156 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing the ColumnProfile class, memoized statistics of a single column."""
+import typing as t
+
+import pandas as pd
+from pandas.core.dtypes.common import is_categorical_dtype, is_float_dtype
+
+from deepchecks.utils.strings import is_string_column
+
+
+__all__ = ['ColumnProfile']
+
+
+class ColumnProfile:
+    """Statistics of a single column, each computed once when it is first requested.
+
+    The unique values statistics are all derived from the counts of the values of the column, so the column is
+    scanned once for all of them.
+
+    Parameters
+    ----------
+    column : pd.Series
+        the column to profile. Should not be changed after the profile is created.
+    """
+
+    def __init__(self, column: pd.Series):
+        self._column = column
+        self._cache = {}
+
+    def _cached(self, name: str, calculate: t.Callable[[], t.Any]) -> t.Any:
+        if name not in self._cache:
+            self._cache[name] = calculate()
+        return self._cache[name]
+
+    @property
+    def value_counts(self) -> pd.Series:
+        """Return counts of the values of the column including nulls, sorted by count in descending order."""
+        return self._cached('value_counts', lambda: self._column.value_counts(dropna=False))
+
+    @property
+    def unique_values(self) -> pd.Index:
+        """Return the values appearing in the column including nulls, sorted by count in descending order."""
+        # Counts of categorical columns include categories which don't appear in the column
+        return self._cached('unique_values', lambda: self.value_counts.index[self.value_counts.to_numpy() > 0])
+
+    @property
+    def n_samples(self) -> int:
+        """Return number of values in the column."""
+        return len(self._column)
+
+    @property
+    def n_nulls(self) -> int:
+        """Return number of null values in the column."""
+        return self._cached('n_nulls', lambda: int(self.value_counts[self.value_counts.index.isna()].sum()))
+
+    @property
+    def n_unique(self) -> int:
+        """Return number of unique non-null values in the column."""
+        return self._cached('n_unique', lambda: int(self.unique_values.notna().sum()))
+
+    @property
+    def n_unique_with_nulls(self) -> int:
+        """Return number of unique values in the column, counting every kind of null (such as None and NaN)."""
+        return len(self.unique_values)
+
+    def n_unique_up_to(self, limit: int, chunk_size: int = 100_000) -> int:
+        """Return number of unique non-null values in the column if it is at most limit, or a larger number otherwise.
+
+        The column is scanned in chunks, and the scan stops once more than limit unique values are found. An evenly
+        spaced sample of the column is checked first, so columns with many unique values are rejected after reading
+        a small part of them even if they are sorted. If the whole column is scanned, its number of unique values and
+        of nulls are kept in the profile.
+
+        Parameters
+        ----------
+        limit : int
+            number of unique values to count up to
+        chunk_size : int , default: 100_000
+            number of values to read at a time
+
+        Returns
+        -------
+        int
+            number of unique non-null values if it is at most limit, otherwise a lower bound of it larger than limit
+        """
+        if 'n_unique' in self._cache or 'value_counts' in self._cache or is_categorical_dtype(self._column):
+            return self.n_unique
+
+        column = self._column
+        if len(column) > chunk_size:
+            n_sample_unique = column.iloc[::len(column) // chunk_size].nunique(dropna=True)
+            if n_sample_unique > limit:
+                return n_sample_unique
+
+        unique_values = column.iloc[:0]
+        n_nulls = 0
+        for start in range(0, len(column), chunk_size):
+            chunk = column.iloc[start:start + chunk_size]
+            n_nulls += int(chunk.isna().sum())
+            chunk_unique_values = chunk.drop_duplicates()
+            unique_values = pd.concat([unique_values, chunk_unique_values[chunk_unique_values.notna()]])
+            unique_values = unique_values.drop_duplicates()
+            if len(unique_values) > limit:
+                return len(unique_values)
+
+        self._cache['n_unique'] = len(unique_values)
+        self._cache['n_nulls'] = n_nulls
+        return len(unique_values)
+
+    @property
+    def is_string(self) -> bool:
+        """Return whether the column is of string type."""
+        return self._cached('is_string', lambda: is_string_column(self._column))
+
+    def is_categorical(
+        self,
+        max_categorical_ratio: float = 0.01,
+        max_categories: int = 30,
+        max_float_categories: int = 5,
+        bounded: bool = False
+    ) -> bool:
+        """Check if uniques are few enough to count as categorical.
+
+        Parameters
+        ----------
+        max_categorical_ratio : float , default: 0.01
+        max_categories : int , default: 30
+        max_float_categories : int , default: 5
+        bounded : bool , default: False
+            whether to count the unique values only up to the max number of categories, using `n_unique_up_to`,
+            instead of counting all the values of the column. The result is the same, but columns with many unique
+            values are checked without scanning all of them.
+
+        Returns
+        -------
+        bool
+            True if is categorical according to input numbers
+        """
+        is_float = is_float_dtype(self._column)
+        if bounded:
+            limit = max_float_categories if is_float else max_categories
+            if self.n_unique_up_to(limit) > limit:
+                return False
+        if is_float:
+            return self.n_unique <= max_float_categories
+        return self.n_unique / (self.n_samples - self.n_nulls) < max_categorical_ratio and \
+            self.n_unique <= max_categories
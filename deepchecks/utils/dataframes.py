@@ -19,7 +19,7 @@ from deepchecks.utils.validation import ensure_hashable_or_mutable_sequence
 from deepchecks.core.errors import DeepchecksValueError
 
 
-__all__ = ['validate_columns_exist', 'select_from_dataframe', 'un_numpy']
+__all__ = ['validate_columns_exist', 'select_from_dataframe', 'un_numpy', 'hash_rows', 'group_identical_rows']
 
 
 def un_numpy(val):
@@ -127,3 +127,82 @@ def select_from_dataframe(
         return df.drop(labels=ignore_columns, axis='columns')
     else:
         return df
+
+
+def _hash_column(column: pd.Series) -> np.ndarray:
+    """Return 64-bit hash of each value of the column, where equal values (including nulls) have equal hash."""
+    if pd.api.types.is_float_dtype(column.dtype):
+        # Floats are hashed by their bits, so normalize the values which are equal but have different bits
+        values = column.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0  # -0.0 to 0.0
+        values[np.isnan(values)] = np.nan
+        column = pd.Series(values)
+    return pd.util.hash_pandas_object(column, index=False).to_numpy()
+
+
+def hash_rows(df: pd.DataFrame) -> np.ndarray:
+    """Return 64-bit hash of each row of the dataframe, ignoring the index.
+
+    Identical rows (null values are considered equal to each other) have the same hash. Columns are hashed one by
+    one, so no copy of the whole dataframe is made.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        dataframe to hash
+
+    Returns
+    -------
+    np.ndarray
+        array of uint64 hash per row
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for i in range(df.shape[1]):
+        # Combine the hashes order dependently, relying on uint64 wraparound
+        hashes = (hashes * np.uint64(1000003)) ^ _hash_column(df.iloc[:, i])
+    return hashes
+
+
+def group_identical_rows(df: pd.DataFrame) -> np.ndarray:
+    """Return group code of each row of the dataframe, where rows have the same code if and only if they are identical.
+
+    Rows are grouped by their hash, and the rows of groups with more than one row are verified against the first row
+    of their group, so hash collisions are detected and resolved by exact grouping of the colliding rows only.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        dataframe to group, ignoring its index. Null values are considered equal to each other.
+
+    Returns
+    -------
+    np.ndarray
+        array of group code per row. Codes are consecutive integers starting from 0, numbered by the order of first
+        appearance of the group
+    """
+    codes, _ = pd.factorize(hash_rows(df))
+    counts = np.bincount(codes)
+    duplicated_rows = np.flatnonzero(counts[codes] > 1)
+    if len(duplicated_rows) == 0:
+        return codes
+
+    # Codes are numbered by first appearance, so the first row of each code is found in that order
+    _, first_rows = np.unique(codes, return_index=True)
+    duplicated_codes = codes[duplicated_rows]
+    reference_rows = first_rows[duplicated_codes]
+    mismatch = np.zeros(len(duplicated_rows), dtype=bool)
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i].to_numpy()
+        rows_values, reference_values = values[duplicated_rows], values[reference_rows]
+        mismatch |= ~((rows_values == reference_values) | (pd.isna(rows_values) & pd.isna(reference_values)))
+
+    if mismatch.any():
+        colliding = np.isin(codes, duplicated_codes[mismatch])
+        colliding_df = df[colliding]
+        # Pandas have bug with groupby on category dtypes, so change dtypes manually
+        category_columns = colliding_df.dtypes[colliding_df.dtypes == 'category'].index.tolist()
+        colliding_df = colliding_df.astype({c: 'object' for c in category_columns})
+        exact_codes = colliding_df.groupby(list(colliding_df.columns), dropna=False, sort=False).ngroup().to_numpy()
+        codes = codes.copy()
+        codes[colliding] = exact_codes + len(counts)
+        codes, _ = pd.factorize(codes)
+    return codes
@@ -10,9 +10,8 @@
 #
 """Common utilities for distribution checks."""
 
-from typing import Tuple, Union, Hashable, Callable
+from typing import Tuple, Union, Hashable, Callable, Dict
 
-from scipy.stats import wasserstein_distance
 import numpy as np
 import pandas as pd
 
@@ -25,9 +24,13 @@ from deepchecks.core.errors import DeepchecksValueError
 
 
 PSI_MIN_PERCENTAGE = 0.01
+# Maximal number of values to process at once when calculating the drift of multiple columns
+DRIFT_BATCH_SIZE = 2_000_000
 
+_SCORER_NAMES = {'numerical': "Earth Mover's Distance", 'categorical': 'PSI'}
 
-__all__ = ['calc_drift_and_plot']
+
+__all__ = ['calc_drift_and_plot', 'calc_drift_score', 'calc_drift_scores', 'plot_drift']
 
 
 def psi(expected_percents: np.ndarray, actual_percents: np.ndarray):
@@ -48,24 +51,22 @@ def psi(expected_percents: np.ndarray, actual_percents: np.ndarray):
         The PSI score
 
     """
-    psi_value = 0
-    for i in range(len(expected_percents)):
-        # In order for the value not to diverge, we cap our min percentage value
-        e_perc = max(expected_percents[i], PSI_MIN_PERCENTAGE)
-        a_perc = max(actual_percents[i], PSI_MIN_PERCENTAGE)
-        value = (e_perc - a_perc) * np.log(e_perc / a_perc)
-        psi_value += value
-
-    return psi_value
+    # In order for the value not to diverge, we cap our min percentage value
+    expected_percents = np.maximum(expected_percents, PSI_MIN_PERCENTAGE)
+    actual_percents = np.maximum(actual_percents, PSI_MIN_PERCENTAGE)
+    return np.sum((expected_percents - actual_percents) * np.log(expected_percents / actual_percents))
 
 
-def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series]):
+def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndarray, pd.Series],
+                          dist1_weights: np.ndarray = None, dist2_weights: np.ndarray = None,
+                          assume_sorted: bool = False):
     """
     Calculate the Earth Movers Distance (Wasserstein distance).
 
     See https://en.wikipedia.org/wiki/Wasserstein_metric
 
-    Function is for numerical data only.
+    Function is for numerical data only. The distance is the integral of the absolute difference between the CDFs of
+    the two distributions, calculated on the merged sorted values of both, after scaling the values to [0, 1].
 
     Parameters
     ----------
@@ -73,33 +74,182 @@ def earth_movers_distance(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.n
         array of numberical values.
     dist2 : Union[np.ndarray, pd.Series]
         array of numberical values to compare dist1 to.
+    dist1_weights : np.ndarray , default: None
+        weight of each value of dist1, such as the counts of values summarized by a sketch or of pre-binned values.
+        If None, each value has equal weight.
+    dist2_weights : np.ndarray , default: None
+        weight of each value of dist2.
+    assume_sorted : bool , default: False
+        whether dist1 and dist2 are already sorted in ascending order, which saves sorting them.
     Returns
     -------
     Any
         the Wasserstein distance between the two distributions.
 
     """
-    unique1 = np.unique(dist1)
-    unique2 = np.unique(dist2)
-
-    sample_space = list(set(unique1).union(set(unique2)))
+    dist1 = np.asarray(dist1, dtype='float').reshape(-1)
+    dist2 = np.asarray(dist2, dtype='float').reshape(-1)
 
-    val_max = max(sample_space)
-    val_min = min(sample_space)
+    if assume_sorted:
+        val_min, val_max = min(dist1[0], dist2[0]), max(dist1[-1], dist2[-1])
+    else:
+        val_min, val_max = min(dist1.min(), dist2.min()), max(dist1.max(), dist2.max())
 
     if val_max == val_min:
         return 0
 
-    dist1 = (dist1 - val_min) / (val_max - val_min)
-    dist2 = (dist2 - val_min) / (val_max - val_min)
+    if not assume_sorted:
+        dist1, dist1_weights = _sort_values(dist1, dist1_weights)
+        dist2, dist2_weights = _sort_values(dist2, dist2_weights)
+    # Merging two sorted arrays is linear with a stable sort
+    all_values = np.concatenate([dist1, dist2])
+    order = np.argsort(all_values, kind='stable')
+    from_dist1 = order < len(dist1)
+    deltas = np.diff(all_values[order])
+    del all_values
+    # CDFs of both distributions at each of the merged values (except the last). At tied values the CDFs are partial,
+    # but the following delta is 0 so they don't affect the distance
+    cdf1 = _merged_cdf(from_dist1, dist1_weights)
+    cdf2 = _merged_cdf(~from_dist1, dist2_weights)
+
+    return np.dot(np.abs(cdf1 - cdf2), deltas) / (val_max - val_min)
+
+
+def _sort_values(values: np.ndarray, weights: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    if weights is None:
+        return np.sort(values), None
+    order = np.argsort(values)
+    return values[order], np.asarray(weights, dtype='float')[order]
+
+
+def _merged_cdf(is_member: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+    """Return the CDF of a distribution at the merged sorted values, given which of them belong to it."""
+    if weights is None:
+        cumulative = np.cumsum(is_member[:-1])
+        return cumulative / np.count_nonzero(is_member)
+    merged_weights = np.zeros(len(is_member))
+    merged_weights[is_member] = weights
+    cumulative = np.cumsum(merged_weights[:-1])
+    return cumulative / merged_weights.sum()
+
+
+def _earth_movers_distances(dist1: np.ndarray, dist2: np.ndarray) -> np.ndarray:
+    """Calculate the Earth Movers Distance between the columns of two 2D arrays, ignoring NaN values.
+
+    Equivalent to `earth_movers_distance` on every pair of columns, where each column has at least one non-NaN value.
+    The distance is the integral of the absolute difference between the two empirical CDFs, which is calculated on
+    the merged sorted values of both distributions.
+    """
+    val_min = np.minimum(np.nanmin(dist1, axis=0), np.nanmin(dist2, axis=0))
+    val_range = np.maximum(np.nanmax(dist1, axis=0), np.nanmax(dist2, axis=0)) - val_min
+    constant = val_range == 0
+    val_range[constant] = 1
+
+    values = (np.concatenate([dist1, dist2]) - val_min) / val_range
+    # Sort the merged values of each column, NaN values are last
+    order = np.argsort(values, axis=0, kind='stable')
+    values = np.take_along_axis(values, order, axis=0)
+    from_dist1 = order < len(dist1)
+    n1 = np.count_nonzero(~np.isnan(dist1), axis=0)
+    n2 = np.count_nonzero(~np.isnan(dist2), axis=0)
+    # Empirical CDFs of both distributions at each of the merged values
+    cdf1 = np.cumsum(from_dist1 & ~np.isnan(values), axis=0)[:-1] / n1
+    cdf2 = np.cumsum(~from_dist1 & ~np.isnan(values), axis=0)[:-1] / n2
+    deltas = np.nan_to_num(np.diff(values, axis=0))
+
+    distances = np.sum(np.abs(cdf1 - cdf2) * deltas, axis=0)
+    distances[constant] = 0
+    return distances
+
+
+def calc_drift_score(train_column: pd.Series, test_column: pd.Series, column_type: str,
+                     max_num_categories: int = 10) -> Tuple[float, str]:
+    """
+    Calculate drift score of a column.
 
-    return wasserstein_distance(dist1, dist2)
+    Parameters
+    ----------
+    train_column : pd.Series
+        column from train dataset
+    test_column : pd.Series
+        same column from test dataset
+    column_type : str
+        type of column (either "numerical" or "categorical")
+    max_num_categories : int , default: 10
+        Max number of allowed categories. If there are more, they are binned into an "Other" category.
+    Returns
+    -------
+    Tuple[float, str]
+        drift score of the difference between the two columns' distributions (Earth movers distance for
+        numerical, PSI for categorical), and the name of the score
+    """
+    train_dist = train_column.dropna().values.reshape(-1)
+    test_dist = test_column.dropna().values.reshape(-1)
 
+    if column_type == 'numerical':
+        score = earth_movers_distance(dist1=train_dist.astype('float'), dist2=test_dist.astype('float'))
+    elif column_type == 'categorical':
+        expected_percents, actual_percents, _ = \
+            preprocess_2_cat_cols_to_same_bins(dist1=train_dist, dist2=test_dist, max_num_categories=max_num_categories)
+        score = psi(expected_percents=expected_percents, actual_percents=actual_percents)
+    else:
+        # Should never reach here
+        raise DeepchecksValueError(f'Unsupported column type for drift: {column_type}')
 
-def calc_drift_and_plot(train_column: pd.Series, test_column: pd.Series, plot_title: Hashable,
-                        column_type: str, max_num_categories: int = 10) -> Tuple[float, str, Callable]:
+    return score, _SCORER_NAMES[column_type]
+
+
+def calc_drift_scores(train_df: pd.DataFrame, test_df: pd.DataFrame, column_types: Dict[Hashable, str],
+                      max_num_categories: int = 10) -> Dict[Hashable, Tuple[float, str]]:
     """
-    Calculate drift score per column.
+    Calculate drift scores of multiple columns at once.
+
+    The Earth Movers Distance of the numerical columns is calculated as array operations on batches of columns,
+    instead of column by column.
+
+    Parameters
+    ----------
+    train_df : pd.DataFrame
+        train dataset
+    test_df : pd.DataFrame
+        test dataset, with the same columns
+    column_types : Dict[Hashable, str]
+        type of each column to calculate the drift score of (either "numerical" or "categorical")
+    max_num_categories : int , default: 10
+        Max number of allowed categories. If there are more, they are binned into an "Other" category.
+    Returns
+    -------
+    Dict[Hashable, Tuple[float, str]]
+        drift score and name of the score for each column, in the order of column_types
+    """
+    scores = {}
+    numerical_columns = []
+    for column, column_type in column_types.items():
+        if column_type == 'numerical':
+            numerical_columns.append(column)
+        else:
+            scores[column] = calc_drift_score(train_df[column], test_df[column], column_type, max_num_categories)
+
+    batch_columns = max(1, DRIFT_BATCH_SIZE // max(len(train_df) + len(test_df), 1))
+    for start in range(0, len(numerical_columns), batch_columns):
+        columns = numerical_columns[start:start + batch_columns]
+        train_values = train_df[columns].to_numpy(dtype='float', na_value=np.nan)
+        test_values = test_df[columns].to_numpy(dtype='float', na_value=np.nan)
+        # Columns without values in one of the datasets are calculated separately, as the distance is not defined
+        has_values = (~np.isnan(train_values).all(axis=0)) & (~np.isnan(test_values).all(axis=0))
+        distances = _earth_movers_distances(train_values[:, has_values], test_values[:, has_values])
+        for column, distance in zip(np.array(columns, dtype=object)[has_values], distances):
+            scores[column] = (float(distance), _SCORER_NAMES['numerical'])
+        for column in np.array(columns, dtype=object)[~has_values]:
+            scores[column] = calc_drift_score(train_df[column], test_df[column], 'numerical')
+
+    return {column: scores[column] for column in column_types}
+
+
+def plot_drift(train_column: pd.Series, test_column: pd.Series, plot_title: Hashable, column_type: str,
+               score: float, max_num_categories: int = 10) -> go.Figure:
+    """
+    Create the graph of the drift of a column, comparing the two distributions.
 
     Parameters
     ----------
@@ -111,35 +261,23 @@ def calc_drift_and_plot(train_column: pd.Series, test_column: pd.Series, plot_ti
         title of plot
     column_type : str
         type of column (either "numerical" or "categorical")
+    score : float
+        the drift score of the column, see `calc_drift_score`
     max_num_categories : int , default: 10
         Max number of allowed categories. If there are more, they are binned into an "Other" category.
     Returns
     -------
-    Tuple[float, str, Callable]
-        drift score of the difference between the two columns' distributions (Earth movers distance for
-        numerical, PSI for categorical)
+    go.Figure
         graph comparing the two distributions (density for numerical, stack bar for categorical)
     """
     train_dist = train_column.dropna().values.reshape(-1)
     test_dist = test_column.dropna().values.reshape(-1)
 
     if column_type == 'numerical':
-        scorer_name = "Earth Mover's Distance"
-
-        train_dist = train_dist.astype('float')
-        test_dist = test_dist.astype('float')
-
-        score = earth_movers_distance(dist1=train_dist, dist2=test_dist)
-
         bar_traces, bar_x_axis, bar_y_axis = drift_score_bar_traces(score)
-        dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(train_dist, test_dist)
-
+        dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(train_dist.astype('float'),
+                                                                            test_dist.astype('float'))
     elif column_type == 'categorical':
-        scorer_name = 'PSI'
-        expected_percents, actual_percents, _ = \
-            preprocess_2_cat_cols_to_same_bins(dist1=train_dist, dist2=test_dist, max_num_categories=max_num_categories)
-        score = psi(expected_percents=expected_percents, actual_percents=actual_percents)
-
         bar_traces, bar_x_axis, bar_y_axis = drift_score_bar_traces(score, bar_max=1)
         dist_traces, dist_x_axis, dist_y_axis = feature_distribution_traces(train_dist, test_dist, is_categorical=True,
                                                                             max_num_categories=max_num_categories)
@@ -149,7 +287,7 @@ def calc_drift_and_plot(train_column: pd.Series, test_column: pd.Series, plot_ti
 
     fig = make_subplots(rows=2, cols=1, vertical_spacing=0.2, shared_yaxes=False, shared_xaxes=False,
                         row_heights=[0.1, 0.9],
-                        subplot_titles=[f'Drift Score ({scorer_name})', 'Distribution Plot'])
+                        subplot_titles=[f'Drift Score ({_SCORER_NAMES[column_type]})', 'Distribution Plot'])
 
     fig.add_traces(bar_traces, rows=[1] * len(bar_traces), cols=[1] * len(bar_traces))
     fig.add_traces(dist_traces, rows=[2] * len(dist_traces), cols=[1] * len(dist_traces))
@@ -170,4 +308,33 @@ def calc_drift_and_plot(train_column: pd.Series, test_column: pd.Series, plot_ti
 
     fig.update_layout(shared_layout)
 
+    return fig
+
+
+def calc_drift_and_plot(train_column: pd.Series, test_column: pd.Series, plot_title: Hashable,
+                        column_type: str, max_num_categories: int = 10) -> Tuple[float, str, Callable]:
+    """
+    Calculate drift score per column.
+
+    Parameters
+    ----------
+    train_column : pd.Series
+        column from train dataset
+    test_column : pd.Series
+        same column from test dataset
+    plot_title : Hashable
+        title of plot
+    column_type : str
+        type of column (either "numerical" or "categorical")
+    max_num_categories : int , default: 10
+        Max number of allowed categories. If there are more, they are binned into an "Other" category.
+    Returns
+    -------
+    Tuple[float, str, Callable]
+        drift score of the difference between the two columns' distributions (Earth movers distance for
+        numerical, PSI for categorical)
+        graph comparing the two distributions (density for numerical, stack bar for categorical)
+    """
+    score, scorer_name = calc_drift_score(train_column, test_column, column_type, max_num_categories)
+    fig = plot_drift(train_column, test_column, plot_title, column_type, score, max_num_categories)
     return score, scorer_name, fig
@@ -15,7 +15,7 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from typing import List, Tuple
+from typing import List, Tuple, Mapping
 
 with warnings.catch_warnings():
     warnings.simplefilter(action='ignore', category=FutureWarning)
@@ -27,7 +27,7 @@ from deepchecks.utils.typing import Hashable
 from deepchecks.utils.distribution.rare_category_encoder import RareCategoryEncoder
 
 
-__all__ = ['ScaledNumerics', 'preprocess_2_cat_cols_to_same_bins']
+__all__ = ['ScaledNumerics', 'preprocess_2_cat_cols_to_same_bins', 'preprocess_2_cat_counts_to_same_bins']
 
 
 class ScaledNumerics(TransformerMixin, BaseEstimator):
@@ -138,23 +138,54 @@ def preprocess_2_cat_cols_to_same_bins(dist1: np.ndarray, dist2: np.ndarray, max
         list of all categories that the percentages represent.
 
     """
-    all_categories = list(set(dist1).union(set(dist2)))
+    return preprocess_2_cat_counts_to_same_bins(Counter(dist1), Counter(dist2), max_num_categories)
+
+
+def preprocess_2_cat_counts_to_same_bins(dist1_counter: Mapping[Hashable, int], dist2_counter: Mapping[Hashable, int],
+                                         max_num_categories, dist1_total: int = None, dist2_total: int = None
+                                         ) -> Tuple[np.ndarray, np.ndarray, List]:
+    """
+    Preprocess distributions given as counts of their values to the same bins, see preprocess_2_cat_cols_to_same_bins.
+
+    Parameters
+    ----------
+    dist1_counter : Mapping[Hashable, int]
+        count of each value in the first distribution, treated as the expected distribution
+    dist2_counter : Mapping[Hashable, int]
+        count of each value in the second distribution, treated as the actual distribution
+    max_num_categories
+        max number of allowed categories. If there are more, they are binned into an "Other" category.
+        If max_num_categories=None, there is no limit.
+    dist1_total : int , default: None
+        total number of values in the first distribution, if larger than the sum of the counts (when counts of rare
+        values are not kept). If None, the sum of the counts is used.
+    dist2_total : int , default: None
+        total number of values in the second distribution.
+    Returns
+    -------
+    dist1_percents
+        array of percentages of each value in the first distribution.
+    dist2_percents
+        array of percentages of each value in the second distribution.
+    categories_list
+        list of all categories that the percentages represent.
+    """
+    dist1_total = sum(dist1_counter.values()) if dist1_total is None else dist1_total
+    dist2_total = sum(dist2_counter.values()) if dist2_total is None else dist2_total
+    all_categories = list(set(dist1_counter).union(set(dist2_counter)))
 
     if max_num_categories is not None and len(all_categories) > max_num_categories:
-        dist1_counter = dict(Counter(dist1).most_common(max_num_categories))
-        dist1_counter['Other rare categories'] = len(dist1) - sum(dist1_counter.values())
+        dist1_counter = dict(Counter(dist1_counter).most_common(max_num_categories))
+        dist1_counter['Other rare categories'] = dist1_total - sum(dist1_counter.values())
         categories_list = list(dist1_counter.keys())
 
-        dist2_counter = Counter(dist2)
-        dist2_counter = {k: dist2_counter[k] for k in categories_list}
-        dist2_counter['Other rare categories'] = len(dist2) - sum(dist2_counter.values())
+        dist2_counter = {k: dist2_counter.get(k, 0) for k in categories_list}
+        dist2_counter['Other rare categories'] = dist2_total - sum(dist2_counter.values())
 
     else:
-        dist1_counter = Counter(dist1)
-        dist2_counter = Counter(dist2)
         categories_list = all_categories
 
-    dist1_percents = np.array([dist1_counter[k] for k in categories_list]) / len(dist1)
-    dist2_percents = np.array([dist2_counter[k] for k in categories_list]) / len(dist2)
+    dist1_percents = np.array([dist1_counter.get(k, 0) for k in categories_list]) / dist1_total
+    dist2_percents = np.array([dist2_counter.get(k, 0) for k in categories_list]) / dist2_total
 
     return dist1_percents, dist2_percents, categories_list
@@ -0,0 +1,177 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing mergeable sketches of column distributions, used to calculate drift without the full data."""
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from deepchecks.core.errors import DeepchecksValueError
+from deepchecks.utils.distribution.drift import earth_movers_distance, psi
+from deepchecks.utils.distribution.preprocessing import preprocess_2_cat_counts_to_same_bins
+
+
+__all__ = ['NumericSketch', 'CategoricalSketch', 'calc_sketch_drift_score']
+
+
+class NumericSketch:
+    """Mergeable quantile sketch of a numeric column.
+
+    The sketch summarizes the values as up to `size` weighted centroids, each holding the mean of consecutive sorted
+    values and their count, so the rank error of any quantile is at most about 1 / size of the values.
+
+    Parameters
+    ----------
+    size : int , default: 1000
+        maximal number of centroids to keep
+    """
+
+    def __init__(self, size: int = 1000):
+        self.size = size
+        self.values = np.empty(0)
+        self.weights = np.empty(0)
+        self.n_nulls = 0
+
+    @property
+    def count(self) -> int:
+        """Return number of non-null values summarized by the sketch."""
+        return int(self.weights.sum())
+
+    def update(self, values: t.Union[np.ndarray, pd.Series]) -> 'NumericSketch':
+        """Add values to the sketch."""
+        values = np.asarray(values, dtype='float').reshape(-1)
+        nulls = np.isnan(values)
+        self.n_nulls += int(nulls.sum())
+        self._compress(np.concatenate([self.values, values[~nulls]]),
+                       np.concatenate([self.weights, np.ones(len(values) - nulls.sum())]))
+        return self
+
+    def merge(self, other: 'NumericSketch') -> 'NumericSketch':
+        """Return new sketch summarizing the values of both sketches."""
+        merged = NumericSketch(max(self.size, other.size))
+        merged.n_nulls = self.n_nulls + other.n_nulls
+        merged._compress(np.concatenate([self.values, other.values]),  # pylint: disable=protected-access
+                         np.concatenate([self.weights, other.weights]))
+        return merged
+
+    def _compress(self, values: np.ndarray, weights: np.ndarray):
+        values, inverse = np.unique(values, return_inverse=True)
+        weights = np.bincount(inverse, weights=weights, minlength=len(values))
+        if len(values) > self.size:
+            # The minimum and maximum are kept exactly. The sorted values between them are split to bins of equal
+            # total weight, and each bin is replaced by its weighted mean
+            inner_values, inner_weights = values[1:-1], weights[1:-1]
+            n_bins = max(self.size - 2, 1)
+            cumulative_weights = np.cumsum(inner_weights)
+            bins = np.minimum(
+                ((cumulative_weights - inner_weights / 2) / cumulative_weights[-1] * n_bins).astype(int), n_bins - 1
+            )
+            bin_weights = np.bincount(bins, weights=inner_weights)
+            non_empty = bin_weights > 0
+            inner_values = np.bincount(bins, weights=inner_values * inner_weights)[non_empty] / bin_weights[non_empty]
+            values = np.concatenate([values[:1], inner_values, values[-1:]])
+            weights = np.concatenate([weights[:1], bin_weights[non_empty], weights[-1:]])
+        self.values, self.weights = values, weights
+
+    def sample(self, n_samples: int = 10_000) -> np.ndarray:
+        """Return values distributed approximately as the summarized values, to be used in plots."""
+        if self.count == 0:
+            return np.empty(0)
+        return np.repeat(self.values, np.round(self.weights / self.count * n_samples).astype(int))
+
+
+class CategoricalSketch:
+    """Mergeable sketch of the counts of values of a categorical column.
+
+    Keeps the counts of the most common values. Once there are more than twice `capacity` distinct values, the
+    rarest are dropped, and their total count is kept so percentages of the kept values remain exact.
+
+    Parameters
+    ----------
+    capacity : int , default: 10_000
+        number of most common values to keep counts of
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = capacity
+        self.counts = {}
+        self.n_dropped = 0
+        self.n_nulls = 0
+
+    @property
+    def count(self) -> int:
+        """Return number of non-null values summarized by the sketch."""
+        return sum(self.counts.values()) + self.n_dropped
+
+    def update(self, values: t.Union[np.ndarray, pd.Series]) -> 'CategoricalSketch':
+        """Add values to the sketch."""
+        values = pd.Series(np.asarray(values).reshape(-1))
+        self.n_nulls += int(values.isna().sum())
+        self._add_counts(values.value_counts(dropna=True).to_dict())
+        return self
+
+    def merge(self, other: 'CategoricalSketch') -> 'CategoricalSketch':
+        """Return new sketch summarizing the values of both sketches."""
+        merged = CategoricalSketch(max(self.capacity, other.capacity))
+        merged.counts = dict(self.counts)
+        merged.n_dropped = self.n_dropped + other.n_dropped
+        merged.n_nulls = self.n_nulls + other.n_nulls
+        merged._add_counts(other.counts)  # pylint: disable=protected-access
+        return merged
+
+    def _add_counts(self, counts: t.Mapping[t.Hashable, int]):
+        for value, count in counts.items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+        if len(self.counts) > 2 * self.capacity:
+            most_common = pd.Series(self.counts).nlargest(self.capacity, keep='first')
+            self.n_dropped += self.count - self.n_dropped - int(most_common.sum())
+            self.counts = most_common.to_dict()
+
+    def sample(self, n_samples: int = 10_000) -> np.ndarray:
+        """Return values distributed approximately as the summarized values, to be used in plots."""
+        if self.count == 0:
+            return np.empty(0, dtype=object)
+        values = np.empty(len(self.counts), dtype=object)
+        values[:] = list(self.counts)
+        counts = np.array(list(self.counts.values()))
+        return np.repeat(values, np.round(counts / self.count * n_samples).astype(int))
+
+
+def calc_sketch_drift_score(
+    expected: t.Union[NumericSketch, CategoricalSketch],
+    actual: t.Union[NumericSketch, CategoricalSketch],
+    max_num_categories: int = 10
+) -> t.Tuple[float, str]:
+    """Calculate drift score between the distributions summarized by two sketches.
+
+    Parameters
+    ----------
+    expected : Union[NumericSketch, CategoricalSketch]
+        sketch of the expected (train) distribution
+    actual : Union[NumericSketch, CategoricalSketch]
+        sketch of the actual (test) distribution, of the same type
+    max_num_categories : int , default: 10
+        Max number of allowed categories. If there are more, they are binned into an "Other" category.
+    Returns
+    -------
+    Tuple[float, str]
+        drift score (Earth movers distance for numeric sketches, PSI for categorical) and the name of the score
+    """
+    if isinstance(expected, NumericSketch) and isinstance(actual, NumericSketch):
+        score = earth_movers_distance(expected.values, actual.values, expected.weights, actual.weights)
+        return score, "Earth Mover's Distance"
+    if isinstance(expected, CategoricalSketch) and isinstance(actual, CategoricalSketch):
+        expected_percents, actual_percents, _ = preprocess_2_cat_counts_to_same_bins(
+            expected.counts, actual.counts, max_num_categories, dist1_total=expected.count, dist2_total=actual.count
+        )
+        return psi(expected_percents, actual_percents), 'PSI'
+    raise DeepchecksValueError(f'Can\'t calculate drift between sketches of types {type(expected).__name__} and '
+                               f'{type(actual).__name__}')
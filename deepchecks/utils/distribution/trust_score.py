@@ -28,11 +28,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 # pylint: disable=invalid-name
+import os
 import warnings
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 import numpy as np
-from sklearn.neighbors import KDTree, KNeighborsClassifier
+from sklearn.neighbors import BallTree, KDTree, KNeighborsClassifier
+from sklearn.random_projection import GaussianRandomProjection
+
+from deepchecks.core.errors import DeepchecksValueError
 
 __all__ = ['TrustScore']
 
@@ -57,11 +62,32 @@ class TrustScore:
     dist_filter_type : str , default: point
         Use either the distance to the k-nearest point (dist_filter_type = 'point') or
         the average distance from the first to the k-nearest point in the data (dist_filter_type = 'mean').
+    algorithm : str , default: kd_tree
+        Nearest neighbors tree to build for each class; either 'kd_tree' or 'ball_tree'. Ball trees scale better
+        with the number of dimensions.
+    n_projection_components : int , default: None
+        If given, the data is projected with a gaussian random projection to this number of dimensions before the
+        trees are built and queried. The nearest neighbors distances are then approximate, but the queries are much
+        faster on data with many dimensions.
+    n_jobs : int , default: 1
+        Number of threads used to query the trees. Negative value means the number of CPUs.
+    chunk_size : int , default: 10_000
+        Number of instances queried at once by each thread, which bounds the memory used by the queries.
+    random_state : int , default: 42
+        Random state of the random projection.
     """
 
     def __init__(self, k_filter: int = 10, alpha: float = 0., filter_type: str = 'distance_knn',
-                 leaf_size: int = 40, metric: str = 'euclidean', dist_filter_type: str = 'point') -> None:
+                 leaf_size: int = 40, metric: str = 'euclidean', dist_filter_type: str = 'point',
+                 algorithm: str = 'kd_tree', n_projection_components: Optional[int] = None, n_jobs: int = 1,
+                 chunk_size: int = 10_000, random_state: int = 42) -> None:
         super().__init__()
+        if algorithm not in ('kd_tree', 'ball_tree'):
+            raise DeepchecksValueError(f'algorithm must be one of ["kd_tree", "ball_tree"], but got: {algorithm}')
+        if not isinstance(n_jobs, int) or n_jobs == 0:
+            raise DeepchecksValueError(f'n_jobs must be a non-zero integer, but got: {n_jobs}')
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise DeepchecksValueError(f'chunk_size must be a positive integer, but got: {chunk_size}')
         self.k_filter = k_filter
         self.alpha = alpha
         self.filter = filter_type
@@ -69,6 +95,32 @@ class TrustScore:
         self.leaf_size = leaf_size
         self.metric = metric
         self.dist_filter_type = dist_filter_type
+        self.algorithm = algorithm
+        self.n_projection_components = n_projection_components
+        self.n_jobs = os.cpu_count() if n_jobs < 0 else n_jobs
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+        self.projection = None
+
+    def _build_tree(self, X: np.ndarray):
+        tree_class = KDTree if self.algorithm == 'kd_tree' else BallTree
+        return tree_class(X, leaf_size=self.leaf_size, metric=self.metric)
+
+    def _query(self, tree, X: np.ndarray, k: int) -> np.ndarray:
+        """Return distances of the instances to their k nearest neighbors in the tree, querying chunks in parallel."""
+        if len(X) <= self.chunk_size:
+            return tree.query(X, k=k)[0]
+        chunks = (X[start:start + self.chunk_size] for start in range(0, len(X), self.chunk_size))
+        if self.n_jobs == 1:
+            return np.concatenate([tree.query(chunk, k=k)[0] for chunk in chunks])
+        # The trees release the GIL while querying, so threads query the chunks in parallel without copying the tree
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            return np.concatenate(list(executor.map(lambda chunk: tree.query(chunk, k=k)[0], chunks)))
+
+    def _project(self, X: np.ndarray) -> np.ndarray:
+        if self.projection is None:
+            return X
+        return self.projection.transform(X)
 
     def filter_by_distance_knn(self, X: np.ndarray) -> np.ndarray:
         """Filter out instances with low kNN density.
@@ -85,9 +137,9 @@ class TrustScore:
         np.ndarray
             Filtered data
         """
-        kdtree = KDTree(X, leaf_size=self.leaf_size, metric=self.metric)
+        kdtree = self._build_tree(X)
         k = min(self.k_filter + 1, len(X))
-        knn_r = kdtree.query(X, k=k)[0]  # distances from 0 to k-nearest points
+        knn_r = self._query(kdtree, X, k)  # distances from 0 to k-nearest points
         if self.dist_filter_type == 'point':
             knn_r = knn_r[:, -1]
         elif self.dist_filter_type == 'mean':
@@ -115,7 +167,8 @@ class TrustScore:
                           'be >1, otherwise the prediction probabilities are either 0 or 1 making '
                           'probability filtering useless.')
         # fit kNN classifier and make predictions on X
-        clf = KNeighborsClassifier(n_neighbors=self.k_filter, leaf_size=self.leaf_size, metric=self.metric)
+        clf = KNeighborsClassifier(n_neighbors=self.k_filter, algorithm=self.algorithm, leaf_size=self.leaf_size,
+                                   metric=self.metric, n_jobs=self.n_jobs)
         clf.fit(X, Y)
         preds_proba = clf.predict_proba(X)
         # define cutoff and instances to keep
@@ -140,6 +193,12 @@ class TrustScore:
                           'be built.')
             X = X.reshape(X.shape[0], -1)
 
+        if self.n_projection_components is not None and self.n_projection_components < X.shape[1]:
+            self.projection = GaussianRandomProjection(self.n_projection_components, random_state=self.random_state)
+            X = self.projection.fit_transform(X)
+        else:
+            self.projection = None
+
         # make sure Y represents predicted classes, not one-hot encodings
         if len(Y.shape) > 1:
             Y = np.argmax(Y, axis=1)
@@ -171,8 +230,7 @@ class TrustScore:
                 elif no_x_fit:
                     warnings.warn(f'Filtered all the instances for class {c}. Lower alpha or check data.')
             else:
-                self.kdtrees[c] = KDTree(X_fit, leaf_size=self.leaf_size,
-                                         metric=self.metric)  # build KDTree for class c
+                self.kdtrees[c] = self._build_tree(X_fit)  # build tree for class c
                 self.X_kdtree[c] = X_fit
 
     def score(self, X: np.ndarray, Y: np.ndarray, k: int = 2, dist_type: str = 'point') \
@@ -204,18 +262,17 @@ class TrustScore:
         # KDTree needs 2D data
         if len(X.shape) > 2:
             X = X.reshape(X.shape[0], -1)
+        X = self._project(X)
 
-        d = np.tile(None, (X.shape[0], self.classes))  # init distance matrix: [nb instances, nb classes]
+        d = np.full((X.shape[0], self.classes), np.inf)  # init distance matrix: [nb instances, nb classes]
 
         for c in range(self.classes):
-            if (self.kdtrees[c] is None) or (self.kdtrees[c].data.shape[0] < k):
-                d[:, c] = np.inf
-            else:
-                d_tmp = self.kdtrees[c].query(X, k=k)[0]  # get k nearest neighbors for each class
+            if (self.kdtrees[c] is not None) and (self.kdtrees[c].data.shape[0] >= k):
+                d_tmp = self._query(self.kdtrees[c], X, k)  # get k nearest neighbors for each class
                 if dist_type == 'point':
                     d[:, c] = d_tmp[:, -1]
                 elif dist_type == 'mean':
-                    d[:, c] = np.nanmean(d_tmp[np.isfinite(d_tmp)], axis=1)
+                    d[:, c] = np.nanmean(np.where(np.isfinite(d_tmp), d_tmp, np.nan), axis=1)
 
         sorted_d = np.sort(d, axis=1)  # sort distance each instance in batch over classes
         # get distance to predicted and closest other class and calculate trust score
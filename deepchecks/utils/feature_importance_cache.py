@@ -0,0 +1,157 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module containing persistent caches of calculated features importance."""
+import hashlib
+import os
+import pickle
+import tempfile
+import typing as t
+
+import pandas as pd
+
+from deepchecks import tabular
+from deepchecks.core.errors import DeepchecksValueError
+
+
+__all__ = [
+    'FeatureImportanceCache',
+    'DirectoryFeatureImportanceCache',
+    'get_feature_importance_cache',
+    'feature_importance_cache_key'
+]
+
+
+class FeatureImportanceCache:
+    """Base class for caches of calculated features importance, which are kept between runs.
+
+    Implementations store the features importance and its calculation type by a key, which is a hex string computed
+    by `feature_importance_cache_key` from the content of the model, the dataset and the calculation arguments.
+    """
+
+    def get(self, key: str) -> t.Optional[t.Tuple[pd.Series, str]]:
+        """Return the cached features importance and calculation type of the key, or None if not cached."""
+        raise NotImplementedError()
+
+    def set(self, key: str, importance: pd.Series, calculation_type: str):
+        """Cache the features importance and calculation type under the key."""
+        raise NotImplementedError()
+
+
+class DirectoryFeatureImportanceCache(FeatureImportanceCache):
+    """Cache of features importance stored as files in a local directory.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to keep the cached features importance in. Created if doesn't exist.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def get(self, key: str) -> t.Optional[t.Tuple[pd.Series, str]]:
+        """Return the cached features importance and calculation type of the key, or None if not cached."""
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def set(self, key: str, importance: pd.Series, calculation_type: str):
+        """Cache the features importance and calculation type under the key."""
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first, so concurrent runs never read a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((importance, calculation_type), f)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+def get_feature_importance_cache(
+    cache: t.Union[str, FeatureImportanceCache, None]
+) -> t.Optional[FeatureImportanceCache]:
+    """Return cache object from either a cache object or a directory path.
+
+    Parameters
+    ----------
+    cache : Union[str, FeatureImportanceCache, None]
+        a cache object, or a path of a directory to use as cache
+    """
+    if cache is None or isinstance(cache, FeatureImportanceCache):
+        return cache
+    if isinstance(cache, (str, os.PathLike)):
+        return DirectoryFeatureImportanceCache(os.fspath(cache))
+    raise DeepchecksValueError(f'feature_importance_cache must be a directory path or a FeatureImportanceCache, '
+                               f'but got: {type(cache).__name__}')
+
+
+def _pickle_digest(obj) -> t.Optional[bytes]:
+    try:
+        return hashlib.sha256(pickle.dumps(obj)).digest()
+    except (TypeError, AttributeError, pickle.PicklingError):
+        # Objects such as local functions can't be pickled
+        return None
+
+
+def _data_digest(dataset: t.Union['tabular.Dataset', pd.DataFrame]) -> t.Optional[bytes]:
+    if isinstance(dataset, tabular.Dataset):
+        df = dataset.data
+        roles = (dataset.label_name, dataset.features, dataset.cat_features, dataset.index_name,
+                 dataset.datetime_name)
+    else:
+        df = dataset
+        roles = ()
+    hasher = hashlib.sha256(repr((list(df.columns), [str(dtype) for dtype in df.dtypes], roles)).encode())
+    try:
+        hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Data with unhashable values, such as lists
+        return None
+    return hasher.digest()
+
+
+def feature_importance_cache_key(
+    model: t.Any,
+    dataset: t.Union['tabular.Dataset', pd.DataFrame],
+    force_permutation: bool,
+    permutation_kwargs: t.Dict[str, t.Any]
+) -> t.Optional[str]:
+    """Return a key of the features importance calculation, based on the content of its inputs.
+
+    The key depends on the pickled model (its type, parameters and fitted state), the hash of the dataset data and
+    its columns roles, and the calculation arguments including the scorer, so it is the same for equal inputs
+    created in different runs.
+
+    Returns
+    -------
+    Optional[str]
+        hex string key, or None if one of the inputs can't be fingerprinted (and therefore the result can't be cached)
+    """
+    digests = [_pickle_digest(model), _data_digest(dataset), repr(force_permutation).encode()]
+    for name in sorted(permutation_kwargs):
+        value = permutation_kwargs[name]
+        digests.append(name.encode())
+        # Values such as the alternative scorer are fingerprinted by their content
+        digests.append(repr(value).encode() if isinstance(value, (int, float, str, bool, type(None)))
+                       else _pickle_digest(value))
+    if any(digest is None for digest in digests):
+        return None
+    hasher = hashlib.sha256(b'features importance')
+    for digest in digests:
+        hasher.update(digest)
+    return hasher.hexdigest()
@@ -13,15 +13,16 @@
 
 # TODO: move tabular functionality to the tabular sub-package
 
+import os
 import time
 import typing as t
 import warnings
 from warnings import warn
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
-from pandas.core.dtypes.common import is_float_dtype
 from sklearn.inspection import permutation_importance
 
 from deepchecks import tabular
@@ -29,7 +30,9 @@ from deepchecks.core import errors
 from deepchecks.utils import validation
 from deepchecks.utils.metrics import DeepcheckScorer, get_default_scorers, task_type_check, init_validate_scorers
 from deepchecks.utils.typing import Hashable
+from deepchecks.utils.column_profile import ColumnProfile
 from deepchecks.utils.model import get_model_of_pipeline
+from deepchecks.utils.feature_importance_cache import FeatureImportanceCache, feature_importance_cache_key
 
 
 __all__ = [
@@ -51,6 +54,7 @@ def calculate_feature_importance_or_none(
     dataset: t.Union['tabular.Dataset', pd.DataFrame],
     force_permutation: bool = False,
     permutation_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
+    cache: t.Optional[FeatureImportanceCache] = None
 ) -> t.Tuple[t.Optional[pd.Series], t.Optional[str]]:
     """Calculate features effect on the label or None if the input is incorrect.
 
@@ -64,6 +68,8 @@ def calculate_feature_importance_or_none(
         force permutation importance calculation
     permutation_kwargs : t.Optional[t.Dict[str, t.Any]] , default: None
         kwargs for permutation importance calculation
+    cache : t.Optional[FeatureImportanceCache] , default: None
+        persistent cache to read the features importance from, and to store it in after calculating it
 
     Returns
     -------
@@ -81,6 +87,7 @@ def calculate_feature_importance_or_none(
             dataset=dataset,
             force_permutation=force_permutation,
             permutation_kwargs=permutation_kwargs,
+            cache=cache
         )
 
         return fi, calculation_type
@@ -110,6 +117,7 @@ def calculate_feature_importance(
     dataset: t.Union['tabular.Dataset', pd.DataFrame],
     force_permutation: bool = False,
     permutation_kwargs: t.Dict[str, t.Any] = None,
+    cache: t.Optional[FeatureImportanceCache] = None
 ) -> t.Tuple[pd.Series, str]:
     """Calculate features effect on the label.
 
@@ -123,11 +131,16 @@ def calculate_feature_importance(
         force permutation importance calculation
     permutation_kwargs : t.Dict[str, t.Any] , default: None
         kwargs for permutation importance calculation
+    cache : t.Optional[FeatureImportanceCache] , default: None
+        persistent cache to read the features importance from, and to store it in after calculating it. The
+        importance is cached by the content of the model, the dataset and the calculation arguments, so it is reused
+        by later runs on equal inputs
 
     Returns
     -------
     Tuple[Series, str]:
-        first item - feature importance normalized to 0-1 indexed by feature names,
+        first item - feature importance normalized to 0-1 indexed by feature names (NaN for features which were not
+        permuted, if the permutation importance calculation was stopped by the timeout),
         second item - type of feature importance calculation (types: `permutation_importance`,
         `feature_importances_`, `coef_`)
 
@@ -146,9 +159,18 @@ def calculate_feature_importance(
     permutation_kwargs = permutation_kwargs or {}
     permutation_kwargs['random_state'] = permutation_kwargs.get('random_state') or 42
     validation.validate_model(dataset, model)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = feature_importance_cache_key(model, dataset, force_permutation, permutation_kwargs)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            return cached
+
     permutation_failure = None
     calc_type = None
     importance = None
+    is_partial = False
 
     if force_permutation:
         if isinstance(dataset, pd.DataFrame):
@@ -156,7 +178,7 @@ def calculate_feature_importance(
                                   ' built-in model\'s feature importance instead'
         else:
             try:
-                importance = _calc_permutation_importance(model, dataset, **permutation_kwargs)
+                importance, is_partial = _calc_permutation_importance(model, dataset, **permutation_kwargs)
                 calc_type = 'permutation_importance'
             except errors.DeepchecksTimeoutError as e:
                 permutation_failure = f'{e.message}\n using model\'s built-in feature importance instead'
@@ -172,7 +194,7 @@ def calculate_feature_importance(
 
     # If there was no permutation failure and no importance on the model, using permutation anyway
     if importance is None and permutation_failure is None and isinstance(dataset, tabular.Dataset):
-        importance = _calc_permutation_importance(model, dataset, **permutation_kwargs)
+        importance, is_partial = _calc_permutation_importance(model, dataset, **permutation_kwargs)
         calc_type = 'permutation_importance'
         warnings.warn('Could not find built-in feature importance on the model, using '
                       'permutation feature importance calculation')
@@ -181,7 +203,14 @@ def calculate_feature_importance(
     if importance is None:
         # FIXME: better message
         raise errors.DeepchecksValueError("Was not able to calculate features importance")
-    return importance.fillna(0), calc_type
+    # Importance calculated until the timeout is partial, and is not cached so following runs calculate it again.
+    # In it, features which were not permuted keep NaN importance rather than being presented as unimportant
+    if is_partial:
+        return importance, calc_type
+    importance = importance.fillna(0)
+    if cache_key is not None:
+        cache.set(cache_key, importance, calc_type)
+    return importance, calc_type
 
 
 def _built_in_importance(
@@ -216,8 +245,12 @@ def _calc_permutation_importance(
     random_state: int = 42,
     n_samples: int = 10_000,
     alternative_scorer: t.Optional[DeepcheckScorer] = None,
-    timeout: int = None
-) -> pd.Series:
+    timeout: int = None,
+    adaptive: bool = False,
+    min_repeats: int = 3,
+    tolerance: float = 0.05,
+    n_jobs: int = -1
+) -> t.Tuple[pd.Series, bool]:
     """Calculate permutation feature importance. Return nonzero value only when std doesn't mask signal.
 
     Parameters
@@ -237,17 +270,32 @@ def _calc_permutation_importance(
         The number of samples to draw from X to compute feature importance
         in each repeat (without replacement).
     alternative_scorer : t.Optional[DeepcheckScorer] , default: None
+    timeout : int , default: None
+        Number of seconds the calculation is allowed to take. If not adaptive, raises error if the calculation is
+        projected to take longer. If adaptive, stops after this time and returns the importance calculated so far.
+    adaptive : bool , default: False
+        If true, permutes the features in rounds and stops repeating the permutation of a feature once the
+        confidence interval of its importance is narrow enough, instead of permuting every feature n_repeats times.
+    min_repeats : int , default: 3
+        Minimal number of times to permute a feature before it can be stopped. Relevant only if adaptive.
+    tolerance : float , default: 0.05
+        A feature is stopped when the half width of the 95% confidence interval of its importance is below this
+        ratio of the largest absolute importance. Relevant only if adaptive.
+    n_jobs : int , default: -1
+        Number of features to permute in parallel. If negative, the number of CPUs is used.
 
     Returns
     -------
-    pd.Series
-        feature importance normalized to 0-1 indexed by feature names
+    Tuple[pd.Series, bool]
+        feature importance normalized to 0-1 indexed by feature names, and whether the calculation was stopped by
+        the timeout before it finished (in which case the importance is partial, and is NaN for features which were
+        not permuted)
     """
     if dataset.label_name is None:
         raise errors.DatasetValidationError("Expected dataset with label.")
 
     if len(dataset.features) == 1:
-        return pd.Series([1], index=dataset.features)
+        return pd.Series([1], index=dataset.features), False
 
     dataset_sample = dataset.sample(n_samples, drop_na_label=True, random_state=random_state)
 
@@ -261,46 +309,143 @@ def _calc_permutation_importance(
         single_scorer_dict = {scorer_name: default_scorers[scorer_name]}
         scorer = init_validate_scorers(single_scorer_dict, model, dataset, model_type=task_type)[0]
 
-    if timeout is not None:
-        start_time = time.time()
-        scorer(model, dataset_sample)
-        calc_time = time.time() - start_time
-
-        if calc_time * n_repeats * len(dataset.features) > timeout:
-            raise errors.DeepchecksTimeoutError('Permutation importance calculation was not projected to finish in'
-                                                f' {timeout} seconds.')
+    if adaptive:
+        importances_mean, importances_std, timed_out = _adaptive_permutation_importance(
+            model, dataset_sample, scorer, n_repeats, min_repeats, tolerance, random_state, timeout, n_jobs
+        )
     else:
-        warnings.warn('Calculating permutation feature importance without time limit')
-
-    r = permutation_importance(
-        model,
-        dataset_sample.features_columns,
-        dataset_sample.label_col,
-        n_repeats=n_repeats,
-        random_state=random_state,
-        n_jobs=-1,
-        scoring=scorer.scorer
-    )
+        if timeout is not None:
+            start_time = time.time()
+            scorer(model, dataset_sample)
+            calc_time = time.time() - start_time
+
+            if calc_time * n_repeats * len(dataset.features) > timeout:
+                raise errors.DeepchecksTimeoutError('Permutation importance calculation was not projected to finish'
+                                                    f' in {timeout} seconds.')
+        else:
+            warnings.warn('Calculating permutation feature importance without time limit')
+
+        r = permutation_importance(
+            model,
+            dataset_sample.features_columns,
+            dataset_sample.label_col,
+            n_repeats=n_repeats,
+            random_state=random_state,
+            n_jobs=n_jobs,
+            scoring=scorer.scorer
+        )
+        importances_mean, importances_std = r.importances_mean, r.importances_std
+        timed_out = False
 
     significance_mask = (
-        r.importances_mean - r.importances_std > 0
+        importances_mean - importances_std > 0
         if mask_high_variance_features
-        else r.importances_mean > 0
+        else importances_mean > 0
     )
 
-    feature_importances = r.importances_mean * significance_mask
-    total = feature_importances.sum()
+    # Features which were not permuted before the timeout have no importance, and are kept as NaN
+    feature_importances = np.where(significance_mask, importances_mean, 0)
+    feature_importances[np.isnan(importances_mean)] = np.nan
+    total = np.nansum(feature_importances)
 
     if total != 0:
         feature_importances = feature_importances / total
 
-    return pd.Series(feature_importances, index=dataset.features)
+    return pd.Series(feature_importances, index=dataset.features), timed_out
+
+
+def _adaptive_permutation_importance(
+    model: t.Any,
+    dataset: 'tabular.Dataset',
+    scorer: DeepcheckScorer,
+    n_repeats: int,
+    min_repeats: int,
+    tolerance: float,
+    random_state: int,
+    timeout: t.Optional[int],
+    n_jobs: int
+) -> t.Tuple[np.ndarray, np.ndarray, bool]:
+    """Calculate permutation importance by permuting the features in rounds, until their importance stabilizes.
+
+    In each round every feature which is not yet stable is permuted once. A feature is stable once it was permuted
+    at least min_repeats times, and the confidence interval of its importance is narrow relative to the largest
+    importance. If the timeout is reached, returns the importance calculated so far, where features which were not
+    permuted even once have NaN importance.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, bool]
+        mean and std of the importance of each feature, and whether the timeout was reached
+    """
+    deadline = time.time() + timeout if timeout is not None else None
+    rng = np.random.RandomState(random_state)
+    features_df = dataset.features_columns
+    label = dataset.label_col
+    baseline_score = scorer.scorer(model, features_df, label)
+
+    def permutation_importance_of(feature_index: int, permutation: np.ndarray) -> t.Optional[float]:
+        # Each permutation is scored on its own copy of the features, so features are permuted in parallel
+        if deadline is not None and time.time() > deadline:
+            return None
+        permuted_df = features_df.copy()
+        permuted_df.iloc[:, feature_index] = permuted_df.iloc[permutation, feature_index].to_numpy()
+        return baseline_score - scorer.scorer(model, permuted_df, label)
+
+    n_features = features_df.shape[1]
+    importances_sum = np.zeros(n_features)
+    importances_squares_sum = np.zeros(n_features)
+    counts = np.zeros(n_features, dtype=int)
+    active = np.ones(n_features, dtype=bool)
+    timed_out = False
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count() if n_jobs < 0 else n_jobs) as executor:
+        for _ in range(n_repeats):
+            # In each round the active features are permuted in parallel, with permutations drawn in order from
+            # the random state so the result does not depend on the scheduling of the threads
+            round_features = np.flatnonzero(active)
+            permutations = [rng.permutation(len(features_df)) for _ in round_features]
+            round_importances = executor.map(permutation_importance_of, round_features, permutations)
+            for feature_index, importance in zip(round_features, round_importances):
+                if importance is None:
+                    timed_out = True
+                    continue
+                importances_sum[feature_index] += importance
+                importances_squares_sum[feature_index] += importance ** 2
+                counts[feature_index] += 1
+            if timed_out:
+                break
+
+            means = importances_sum / counts
+            variances = np.maximum(importances_squares_sum / counts - means ** 2, 0)
+            # Half width of 95% confidence interval of the mean, using the sample variance
+            ci_half_width = 1.96 * np.sqrt(variances / np.maximum(counts - 1, 1))
+            scale = max(np.abs(means).max(), np.finfo(float).eps)
+            active &= ~((counts >= min_repeats) & (ci_half_width <= tolerance * scale))
+            if not active.any():
+                break
+
+    if counts.sum() == 0:
+        raise errors.DeepchecksTimeoutError('Permutation importance calculation did not finish a single permutation'
+                                            f' in {timeout} seconds.')
+    if timed_out:
+        message = f'Permutation importance calculation stopped after {timeout} seconds, the importance is ' \
+                  f'based on {counts.min()} to {counts.max()} permutations per feature'
+        if (counts == 0).any():
+            not_permuted = list(features_df.columns[counts == 0])
+            message += f'. The importance of features which were not permuted is NaN: {not_permuted}'
+        warnings.warn(message)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = importances_sum / counts
+        stds = np.sqrt(np.maximum(importances_squares_sum / counts - means ** 2, 0))
+    return means, stds, timed_out
 
 
 def get_importance(name: str, feature_importances: pd.Series, ds: 'tabular.Dataset') -> int:
     """Return importance based on feature importance or label/date/index first."""
     if name in feature_importances.keys():
-        return feature_importances[name]
+        # Features without importance (not permuted before the timeout) are sorted with the unimportant ones
+        return 0 if pd.isna(feature_importances[name]) else feature_importances[name]
     if name in [ds.label_name, ds.datetime_name, ds.index_name]:
         return 1
     return 0
@@ -386,6 +531,9 @@ def infer_categorical_features(
     max_categories: int = 30,
     max_float_categories: int = 5,
     columns: t.Optional[t.List[Hashable]] = None,
+    column_profile: t.Optional[t.Callable[[Hashable], ColumnProfile]] = None,
+    bounded: bool = False,
+    n_jobs: int = 1
 ) -> t.List[Hashable]:
     """Infers which features are categorical by checking types and number of unique values.
 
@@ -397,6 +545,15 @@ def infer_categorical_features(
     max_categories : int , default: 30
     max_float_categories : int , default: 5
     columns : t.Optional[t.List[Hashable]] , default: None
+    column_profile : t.Optional[t.Callable[[Hashable], ColumnProfile]] , default: None
+        function returning the profile of a column of the dataframe, such as Dataset.column_profile. If given, the
+        unique values of the columns are taken from their profiles.
+    bounded : bool , default: False
+        whether to count the unique values of each column only up to the max number of categories, stopping once it
+        is exceeded. The inferred features are the same, but columns with many unique values are checked without
+        scanning all of them, which is much faster on large dataframes.
+    n_jobs : int , default: 1
+        number of threads checking columns in parallel. If negative, the number of CPUs is used.
 
     Returns
     -------
@@ -413,16 +570,30 @@ def infer_categorical_features(
     else:
         dataframe_columns = df.columns
 
-    return [
-        column
-        for column in dataframe_columns
-        if is_categorical(
-            t.cast(pd.Series, df[column]),
+    if not isinstance(n_jobs, int) or n_jobs == 0:
+        raise errors.DeepchecksValueError(f'n_jobs must be a non-zero integer, but got: {n_jobs}')
+
+    if column_profile is None:
+        def column_profile(column):
+            return ColumnProfile(t.cast(pd.Series, df[column]))
+
+    def check_column(column):
+        return column_profile(column).is_categorical(
             max_categorical_ratio,
             max_categories,
-            max_float_categories
+            max_float_categories,
+            bounded=bounded
         )
-    ]
+
+    n_jobs = os.cpu_count() if n_jobs < 0 else n_jobs
+    if n_jobs == 1:
+        is_categorical_column = [check_column(column) for column in dataframe_columns]
+    else:
+        # Counting the values of numeric columns releases the GIL, so columns are checked in parallel by threads
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            is_categorical_column = list(executor.map(check_column, dataframe_columns))
+
+    return [column for column, is_cat in zip(dataframe_columns, is_categorical_column) if is_cat]
 
 
 def is_categorical(
@@ -446,10 +617,4 @@ def is_categorical(
     bool
         True if is categorical according to input numbers
     """
-    n_unique = column.nunique(dropna=True)
-    n_samples = len(column.dropna())
-
-    if is_float_dtype(column):
-        return n_unique <= max_float_categories
-
-    return n_unique / n_samples < max_categorical_ratio and n_unique <= max_categories
+    return ColumnProfile(column).is_categorical(max_categorical_ratio, max_categories, max_float_categories)
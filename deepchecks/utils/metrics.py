@@ -120,8 +120,7 @@ class DeepcheckScorer:
     @classmethod
     def filter_nulls(cls, dataset: 'tabular.Dataset') -> 'tabular.Dataset':
         """Return data of dataset without null labels."""
-        valid_idx = dataset.data[dataset.label_name].notna()
-        return dataset.copy(dataset.data[valid_idx])
+        return dataset.select_rows(dataset.label_col.notna().to_numpy())
 
     def _run_score(self, model, dataset: 'tabular.Dataset'):
         return self.scorer(model, dataset.features_columns, dataset.label_col)
@@ -151,8 +150,8 @@ class DeepcheckScorer:
         dataset = self.filter_nulls(dataset)
         if should_return_array:
             # In order for scorer to return array in right length need to pass him samples from all labels
-            single_label_data = dataset.data.groupby(dataset.label_name).head(1)
-            result = self._run_score(model, dataset.copy(single_label_data))
+            single_label_data = dataset.select_rows(~dataset.label_col.duplicated().to_numpy())
+            result = self._run_score(model, single_label_data)
             if not isinstance(result, np.ndarray):
                 raise errors.DeepchecksValueError(f'Expected scorer {self.name} to return np.ndarray '
                                                   f'but got: {type(result).__name__}')
@@ -171,8 +170,8 @@ class DeepcheckScorer:
 
         else:
             # In order for scorer to run, it must have at least one sample of each label.
-            single_label_data = dataset.data.groupby(dataset.label_name).head(1)
-            result = self._run_score(model, dataset.copy(single_label_data))
+            single_label_data = dataset.select_rows(~dataset.label_col.duplicated().to_numpy())
+            result = self._run_score(model, single_label_data)
             if not isinstance(result, Number):
                 raise errors.DeepchecksValueError(f'Expected scorer {self.name} to return number '
                                                   f'but got: {type(result).__name__}')
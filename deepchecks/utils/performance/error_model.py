@@ -232,13 +232,10 @@ def error_model_display(error_fi: pd.Series,
                 threshold = tree_partitioner.tree_.threshold[0]
                 color_col = data[feature].ge(threshold)
 
-                sampled_dataset = dataset.data.iloc[sampling_idx]
+                sampled_dataset = dataset.select_rows(sampling_idx)
                 if scorer:
-                    segment1_text, segment1_details = get_segment_details(model, scorer, dataset.copy(sampled_dataset),
-                                                                          color_col)
-                    segment2_text, segment2_details = get_segment_details(model, scorer,
-                                                                          dataset.copy(sampled_dataset),
-                                                                          ~color_col)
+                    segment1_text, segment1_details = get_segment_details(model, scorer, sampled_dataset, color_col)
+                    segment2_text, segment2_details = get_segment_details(model, scorer, sampled_dataset, ~color_col)
                 else:
                     # If there is not scorer, we use the error calculation to describe the segments
                     # Colors are flipped, because lower error is better
@@ -272,10 +269,8 @@ def error_model_display(error_fi: pd.Series,
 def get_segment_details(model: Any, scorer: Callable, dataset: tabular.Dataset,
                         segment_condition_col: pd.Series) -> Tuple[str, Dict[str, float]]:
     """Return details about the data segment using the scorer and model."""
-    performance = scorer(
-        model,
-        dataset.copy(dataset.data[segment_condition_col.values]))
-    n_samples = dataset.data[segment_condition_col].shape[0]
+    performance = scorer(model, dataset.select_rows(segment_condition_col.values))
+    n_samples = int(segment_condition_col.values.sum())
     segment_label = \
         f'{scorer.name}: {format_number(performance)}, ' \
         f'Samples: {n_samples} ({format_percent(n_samples / len(dataset))})'
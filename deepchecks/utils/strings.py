@@ -18,6 +18,7 @@ from collections import defaultdict
 from decimal import Decimal
 from copy import copy
 
+import numpy as np
 import pandas as pd
 from pandas.core.dtypes.common import is_numeric_dtype
 
@@ -28,7 +29,9 @@ from deepchecks.utils.typing import Hashable
 
 __all__ = [
     'string_baseform',
+    'strings_baseform',
     'get_base_form_to_variants_dict',
+    'get_base_form_to_variants_counts',
     'split_camel_case',
     'split_and_keep',
     'split_by_order',
@@ -164,6 +167,25 @@ def string_baseform(string: str) -> str:
     return re.sub('[^A-Za-z0-9]+', '', string).lower()
 
 
+def strings_baseform(strings: pd.Series) -> pd.Series:
+    """Remove special characters from all the strings in the series at once, see `string_baseform`.
+
+    Parameters
+    ----------
+    strings : pd.Series
+        series of values, which are usually the unique values of a column
+    Returns
+    -------
+    pd.Series
+        series of the strings without special characters, in which values that are not strings are left as is
+    """
+    strings = strings.astype(object)
+    is_str = strings.map(type) == str
+    result = strings.copy()
+    result[is_str] = strings[is_str].str.replace('[^A-Za-z0-9]+', '', regex=True).str.lower()
+    return result
+
+
 def is_string_column(column: pd.Series) -> bool:
     """Determine whether a pandas series is string type."""
     if is_numeric_dtype(column):
@@ -219,6 +241,37 @@ def get_base_form_to_variants_dict(uniques: t.Iterable[str]) -> t.Dict[str, t.Se
     return base_form_to_variants
 
 
+def get_base_form_to_variants_counts(column: pd.Series) -> t.Dict[str, t.List[t.Tuple[str, int]]]:
+    """Create dict of base-form to the counts of its variants in the column, for base-forms with multiple variants.
+
+    The values are counted once for the whole column, and the base-forms are calculated once per unique value.
+
+    Parameters
+    ----------
+    column : pd.Series
+        column of strings
+    Returns
+    -------
+    Dict[str, List[Tuple[str, int]]]
+        dictionary of base-form to list of its variants and their counts, sorted by count in descending order.
+        Includes only base-forms with more than one variant
+    """
+    counts = column.value_counts()
+    base_forms = strings_baseform(pd.Series(counts.index, dtype=object))
+    has_variants = base_forms.duplicated(keep=False).to_numpy()
+    codes, uniques = pd.factorize(base_forms[has_variants])
+    # Sort the variants by their base-form, keeping the order by count within each base-form
+    order = np.argsort(codes, kind='stable')
+    variants = counts.index.to_numpy(dtype=object)[has_variants][order]
+    variants_counts = counts.to_numpy()[has_variants][order]
+    boundaries = np.cumsum(np.bincount(codes))[:-1]
+    return {
+        base_form: list(zip(group_variants.tolist(), group_counts.tolist()))
+        for base_form, group_variants, group_counts
+        in zip(uniques, np.split(variants, boundaries), np.split(variants_counts, boundaries))
+    }
+
+
 def str_min_find(s: str, substr_list: t.Iterable[str]) -> t.Tuple[int, str]:
     """
     Find the minimal first occurence of a substring in a string, and return both the index and substring.
@@ -61,8 +61,8 @@ class SingleDatasetCheck(SingleDatasetBaseCheck):
         self.initialize_run(context, DatasetKind.TRAIN)
 
         context.train.init_cache()
-        for batch in context.train:
-            batch = Batch(batch, context, DatasetKind.TRAIN)
+        for batch_index, batch in enumerate(context.train):
+            batch = Batch(batch, context, DatasetKind.TRAIN, batch_index)
             context.train.update_cache(batch.labels)
             self.update(context, batch, DatasetKind.TRAIN)
 
@@ -109,14 +109,14 @@ class TrainTestCheck(TrainTestBaseCheck):
         self.initialize_run(context)
 
         context.train.init_cache()
-        for batch in context.train:
-            batch = Batch(batch, context, DatasetKind.TRAIN)
+        for batch_index, batch in enumerate(context.train):
+            batch = Batch(batch, context, DatasetKind.TRAIN, batch_index)
             context.train.update_cache(batch.labels)
             self.update(context, batch, DatasetKind.TRAIN)
 
         context.test.init_cache()
-        for batch in context.test:
-            batch = Batch(batch, context, DatasetKind.TEST)
+        for batch_index, batch in enumerate(context.test):
+            batch = Batch(batch, context, DatasetKind.TEST, batch_index)
             context.test.update_cache(batch.labels)
             self.update(context, batch, DatasetKind.TEST)
 
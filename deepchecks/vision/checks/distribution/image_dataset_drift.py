@@ -17,7 +17,8 @@ import pandas as pd
 from deepchecks.core import CheckResult, DatasetKind
 from deepchecks.vision import Context, TrainTestCheck, Batch
 from deepchecks.vision.utils import image_properties
-from deepchecks.core.check_utils.whole_dataset_drift_utils import run_whole_dataset_drift
+from deepchecks.core.check_utils.whole_dataset_drift_utils import (run_whole_dataset_drift,
+                                                                   validate_feature_importance_method)
 
 
 __all__ = ['ImageDatasetDrift']
@@ -57,6 +58,14 @@ class ImageDatasetDrift(TrainTestCheck):
         Fraction of the combined datasets to use for the evaluation of the domain classifier.
     min_meaningful_drift_score : float , default 0.05
         Minimum drift score for displaying drift in check. Under that score, check will display "nothing found".
+    feature_importance_method : str , default: 'permutation'
+        Method of calculating the feature importance of the domain classifier. 'permutation' for permutation
+        importance, 'split_gain' for the total gain of the splits on each feature in the fitted trees, or
+        'drop_column' for the decrease in AUC when replacing each feature with missing values. 'split_gain' and
+        'drop_column' are much faster than 'permutation', which predicts on 10 permutations of each feature.
+    early_stopping : bool , default: False
+        Whether to stop fitting the domain classifier once its loss on a validation part of the training data stops
+        improving.
     """
 
     def __init__(
@@ -66,7 +75,9 @@ class ImageDatasetDrift(TrainTestCheck):
             min_feature_importance: float = 0.05,
             sample_size: int = 10_000,
             test_size: float = 0.3,
-            min_meaningful_drift_score: float = 0.05
+            min_meaningful_drift_score: float = 0.05,
+            feature_importance_method: str = 'permutation',
+            early_stopping: bool = False
     ):
         super().__init__()
         if alternative_image_properties:
@@ -80,6 +91,9 @@ class ImageDatasetDrift(TrainTestCheck):
         self.sample_size = sample_size
         self.test_size = test_size
         self.min_meaningful_drift_score = min_meaningful_drift_score
+        validate_feature_importance_method(feature_importance_method)
+        self.feature_importance_method = feature_importance_method
+        self.early_stopping = early_stopping
 
         self._train_properties = defaultdict(list)
         self._test_properties = defaultdict(list)
@@ -92,8 +106,8 @@ class ImageDatasetDrift(TrainTestCheck):
             properties = self._test_properties
         images = batch.images
 
-        for single_property in self.image_properties:
-            properties[single_property['name']].extend(single_property['method'](images))
+        for property_name, values in image_properties.calc_properties(images, self.image_properties).items():
+            properties[property_name].extend(values)
 
     def compute(self, context: Context) -> CheckResult:
         """Train a Domain Classifier on image property data that was collected during update() calls.
@@ -132,7 +146,8 @@ class ImageDatasetDrift(TrainTestCheck):
             cat_features=categorical_features, sample_size=sample_size, random_state=context.random_state,
             test_size=self.test_size, n_top_columns=self.n_top_properties,
             min_feature_importance=self.min_feature_importance, max_num_categories=None,
-            min_meaningful_drift_score=self.min_meaningful_drift_score
+            min_meaningful_drift_score=self.min_meaningful_drift_score,
+            feature_importance_method=self.feature_importance_method, early_stopping=self.early_stopping
         )
 
         if displays:
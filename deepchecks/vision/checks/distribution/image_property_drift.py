@@ -81,8 +81,8 @@ class ImagePropertyDrift(TrainTestCheck):
 
         images = batch.images
 
-        for single_property in self.image_properties:
-            properties[single_property['name']].extend(single_property['method'](images))
+        for property_name, values in image_properties.calc_properties(images, self.image_properties).items():
+            properties[property_name].extend(values)
 
     def compute(self, context: Context) -> CheckResult:
         """Calculate drift score between train and test datasets for the collected image properties.
@@ -123,8 +123,8 @@ class SimpleFeatureContribution(TrainTestCheck):
             raise DeepchecksValueError(
                 f'Check {self.__class__.__name__} does not support task type {dataset.task_type}')
 
-        for single_property in self.image_properties:
-            properties[single_property['name']].extend(single_property['method'](imgs))
+        for property_name, values in image_properties.calc_properties(imgs, self.image_properties).items():
+            properties[property_name].extend(values)
 
     def compute(self, context: Context) -> CheckResult:
         """Calculate the PPS between each property and the label.
@@ -86,9 +86,9 @@ class ImageSegmentPerformance(SingleDatasetCheck):
 
         # Initialize a list of all properties per image sample
         batch_properties = [{} for _ in range(len(images))]
-        for single_property in self.image_properties:
-            for index, image_result in enumerate(single_property['method'](images)):
-                batch_properties[index][single_property['name']] = image_result
+        for property_name, values in image_properties.calc_properties(images, self.image_properties).items():
+            for index, image_result in enumerate(values):
+                batch_properties[index][property_name] = image_result
 
         batch_data = zip(labels, predictions, batch_properties)
         # If we already defined bins, add the current data to them
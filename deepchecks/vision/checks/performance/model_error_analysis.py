@@ -109,8 +109,8 @@ class ModelErrorAnalysis(TrainTestCheck):
         predictions = batch.predictions
         labels = batch.labels
 
-        for single_property in self.image_properties:
-            properties[single_property['name']].extend(single_property['method'](images))
+        for property_name, values in image_properties.calc_properties(images, self.image_properties).items():
+            properties[property_name].extend(values)
 
         if dataset.task_type == TaskType.CLASSIFICATION:
             def scoring_func(predictions, labels):
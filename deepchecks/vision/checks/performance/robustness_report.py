@@ -10,6 +10,7 @@
 #
 """Module containing robustness report check."""
 from collections import defaultdict
+from copy import deepcopy
 from typing import TypeVar, List, Optional, Sized, Dict, Sequence
 
 import imgaug
@@ -17,6 +18,7 @@ import albumentations
 import numpy as np
 import pandas as pd
 import torch
+from torch.utils.data import BatchSampler, DataLoader, Dataset
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from ignite.metrics import Metric
@@ -49,14 +51,26 @@ class RobustnessReport(SingleDatasetCheck):
     augmentations : List, default: None
         A list of augmentations to test on the data. If none are given default augmentations are used.
         Supported augmentations are of albumentations and imgaug.
+    single_pass : bool, default: False
+        If True, the augmented data is loaded and inferred for all augmentations in a single pass over the data,
+        instead of a pass per augmentation. Each batch of samples is loaded with all the augmentations, and the model
+        infers on all of them as a single stacked batch, so the batches are larger by the number of augmentations.
+        The random augmentations are different than those of separate passes, so the results are slightly different.
+    n_samples_per_augmentation : int, default: None
+        Used only if single_pass is True. Max number of samples to test each augmentation on. The metrics of the
+        original data are then calculated on the same samples, in the same pass. If None, all samples are used.
     """
 
     def __init__(self,
                  alternative_metrics: Optional[Dict[str, Metric]] = None,
-                 augmentations: List = None):
+                 augmentations: List = None,
+                 single_pass: bool = False,
+                 n_samples_per_augmentation: Optional[int] = None):
         super().__init__()
         self.alternative_metrics = alternative_metrics
         self.augmentations = augmentations
+        self.single_pass = single_pass
+        self.n_samples_per_augmentation = n_samples_per_augmentation
         self._state = None
 
     def initialize_run(self, context: Context, dataset_kind):
@@ -96,19 +110,21 @@ class RobustnessReport(SingleDatasetCheck):
         base_mean_results: dict = self._calc_median_metrics(base_results)
         # Get augmentations
         augmentations = self.augmentations or transforms_handler.get_robustness_augmentations(dataset.data_dimension)
-        aug_all_data = {}
-        for augmentation_func in augmentations:
-            aug_dataset = dataset.get_augmented_dataset(augmentation_func)
-            # The metrics have saved state, but they are reset inside `calculate_metrics`
-            metrics = self._state['metrics']
-            # The augmentations are pseudo-random and affected by the seeds.
-            # Setting it here to have fixed state just before the augmentations are run
-            set_seeds(context.random_state)
-            # Return dataframe of (Class, Metric, Value)
-            aug_results = metric_results_to_df(
-                calculate_metrics(metrics, aug_dataset, model, context.device),
-                aug_dataset
+        aug_datasets = [dataset.get_augmented_dataset(augmentation_func) for augmentation_func in augmentations]
+        if self.single_pass:
+            sampled_base_results, augmentations_results = self._calc_augmentations_results_single_pass(
+                context, dataset, aug_datasets
             )
+            if sampled_base_results is not None:
+                base_results = sampled_base_results
+                base_mean_results = self._calc_median_metrics(base_results)
+        else:
+            # Calculated lazily, a pass over the data per augmentation
+            augmentations_results = (self._calc_augmentation_results(context, aug_dataset)
+                                     for aug_dataset in aug_datasets)
+
+        aug_all_data = {}
+        for augmentation_func, aug_dataset, aug_results in zip(augmentations, aug_datasets, augmentations_results):
             # Return dict of {metric: {'score': mean score, 'diff': diff from base}, ... }
             metrics_diff_dict = self._calc_performance_diff(base_mean_results, aug_results)
             # Return dict of metric to list {metric: [{'class': x, 'value': y, 'diff': z, 'samples': w}, ...], ...}
@@ -137,6 +153,67 @@ class RobustnessReport(SingleDatasetCheck):
             display=[info_message, *figures]
         )
 
+    def _calc_augmentation_results(self, context: Context, aug_dataset: VisionData) -> pd.DataFrame:
+        # The metrics have saved state, but they are reset inside `calculate_metrics`
+        metrics = self._state['metrics']
+        # The augmentations are pseudo-random and affected by the seeds.
+        # Setting it here to have fixed state just before the augmentations are run
+        set_seeds(context.random_state)
+        # Return dataframe of (Class, Metric, Value)
+        return metric_results_to_df(
+            calculate_metrics(metrics, aug_dataset, context.model, context.device),
+            aug_dataset
+        )
+
+    def _calc_augmentations_results_single_pass(self, context: Context, dataset: VisionData,
+                                                aug_datasets: List[VisionData]):
+        """Calculate the metrics of all augmentations in a single pass over the data.
+
+        Returns
+        -------
+        Tuple[Optional[pd.DataFrame], List[pd.DataFrame]]
+            The results of the original data if it was sampled (otherwise None), and the results of each augmentation.
+        """
+        data_loader = dataset.data_loader
+        batch_sampler = data_loader.batch_sampler
+        versions = [aug_dataset.data_loader.dataset for aug_dataset in aug_datasets]
+
+        indices = [index for batch in batch_sampler for index in batch]
+        sampled = self.n_samples_per_augmentation is not None and self.n_samples_per_augmentation < len(indices)
+        if sampled:
+            positions = np.random.RandomState(context.random_state).choice(
+                len(indices), self.n_samples_per_augmentation, replace=False
+            )
+            batch_sampler = BatchSampler([indices[i] for i in sorted(positions)], batch_sampler.batch_size,
+                                         drop_last=False)
+            # The original data is loaded in the same pass, to compare the augmentations to the same samples
+            versions = [data_loader.dataset] + versions
+
+        versions_loader = DataLoader(_VersionsDataset(versions), batch_sampler=batch_sampler,
+                                     collate_fn=_VersionsCollate(data_loader.collate_fn),
+                                     num_workers=data_loader.num_workers, pin_memory=data_loader.pin_memory)
+        versions_metrics = [{name: deepcopy(metric) for name, metric in self._state['metrics'].items()}
+                            for _ in versions]
+        for metrics in versions_metrics:
+            for metric in metrics.values():
+                metric.reset()
+
+        # The augmentations are pseudo-random and affected by the seeds.
+        set_seeds(context.random_state)
+        for batch, batch_size in versions_loader:
+            predictions = dataset.infer_on_batch(batch, context.model, context.device)
+            labels = dataset.batch_to_labels(batch)
+            for version_index, metrics in enumerate(versions_metrics):
+                version_slice = slice(version_index * batch_size, (version_index + 1) * batch_size)
+                for metric in metrics.values():
+                    metric.update((predictions[version_slice], labels[version_slice]))
+
+        results = [metric_results_to_df({name: metric.compute() for name, metric in metrics.items()}, dataset)
+                   for metrics in versions_metrics]
+        if sampled:
+            return results[0], results[1:]
+        return None, results
+
     def add_condition_degradation_not_greater_than(self, ratio: float = 0.02):
         """Add condition which validates augmentations doesn't degrade the model metrics by given amount."""
         def condition(result):
@@ -317,6 +394,31 @@ class RobustnessReport(SingleDatasetCheck):
         return fig
 
 
+class _VersionsDataset(Dataset):
+    """Dataset returning the samples of a few versions (such as augmentations) of the same dataset together."""
+
+    def __init__(self, datasets: List[Dataset]):
+        self.datasets = datasets
+
+    def __getitem__(self, index):
+        return [dataset[index] for dataset in self.datasets]
+
+    def __len__(self):
+        return len(self.datasets[0])
+
+
+class _VersionsCollate:
+    """Collate the samples of all versions to a single batch ordered by version, returned with the number of samples."""
+
+    def __init__(self, collate_fn):
+        self.collate_fn = collate_fn
+
+    def __call__(self, items):
+        n_versions = len(items[0])
+        samples = [item[version_index] for version_index in range(n_versions) for item in items]
+        return self.collate_fn(samples), len(items)
+
+
 def augmentation_name(aug):
     if isinstance(aug, imgaug.augmenters.Augmenter):
         name = aug.name
@@ -345,7 +447,7 @@ def get_random_image_pairs_from_dataset(original_dataset: VisionData,
     for class_id in classes:
         # Takes the dataset index of a sample of the given class. The order in the dataset is equal for both original
         # and augmented dataset, so can use it on both
-        dataset_class_index = original_dataset.classes_indices[class_id][0]
+        dataset_class_index = int(original_dataset.classes_indices[class_id][0])
 
         sample_base = original_dataset.data_loader.dataset[dataset_class_index]
         sample_aug = augmented_dataset.data_loader.dataset[dataset_class_index]
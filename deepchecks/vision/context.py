@@ -10,7 +10,7 @@
 #
 """Module for base vision context."""
 import logging
-from typing import Mapping, Union, Iterable, Any, Tuple
+from typing import Mapping, Union, Iterable, Any, Tuple, Optional
 
 import torch
 from torch import nn
@@ -19,6 +19,7 @@ from ignite.metrics import Metric
 from deepchecks.core import DatasetKind
 from deepchecks.vision.vision_data import VisionData, TaskType
 from deepchecks.vision.utils.validation import apply_to_tensor
+from deepchecks.vision.utils.inference_cache import InferenceCache
 from deepchecks.core.errors import (
     DatasetValidationError, DeepchecksNotImplementedError, ModelValidationError,
     DeepchecksNotSupportedError, DeepchecksValueError
@@ -31,18 +32,58 @@ __all__ = ['Context']
 logger = logging.getLogger('deepchecks')
 
 
+def _to_device(tensor: torch.Tensor, device: torch.device) -> torch.Tensor:
+    """Move tensor to the device, copying host tensors to cuda asynchronously through pinned memory."""
+    if tensor.device == device:
+        return tensor
+    if device.type == 'cuda' and tensor.device.type == 'cpu':
+        if not tensor.is_pinned():
+            tensor = tensor.pin_memory()
+        return tensor.to(device, non_blocking=True)
+    return tensor.to(device)
+
+
+def _tensors_device(obj) -> Optional[torch.device]:
+    """Return device of the first tensor in a (possibly nested) batch object, or None if it has no tensors."""
+    if isinstance(obj, torch.Tensor):
+        return obj.device
+    if isinstance(obj, (list, tuple)):
+        items = obj
+    elif isinstance(obj, dict):
+        items = obj.values()
+    else:
+        return None
+    for item in items:
+        device = _tensors_device(item)
+        if device is not None:
+            return device
+    return None
+
+
 class Batch:
-    """Represents dataset batch returned by the dataloader during iteration."""
+    """Represents dataset batch returned by the dataloader during iteration.
+
+    If the context uses lazy device transfer, the batch is kept as returned by the dataloader, and is moved to the
+    device only when the predictions are first requested. The predictions are then moved back to the device of the
+    batch, as the labels and images are computed from it. Otherwise, the batch is moved to the device on creation.
+    """
 
     def __init__(
         self,
         batch: Tuple[Iterable[Any], Iterable[Any]],
         context: 'Context',
-        dataset_kind: DatasetKind
+        dataset_kind: DatasetKind,
+        batch_index: Optional[int] = None
     ):
         self._context = context
         self._dataset_kind = dataset_kind
-        self._batch = apply_to_tensor(batch, lambda it: it.to(self._context.device))
+        self._batch_index = batch_index
+        if context.lazy_device_transfer:
+            self._batch = batch
+            self._device_batch = None
+        else:
+            self._batch = apply_to_tensor(batch, lambda it: it.to(self._context.device))
+            self._device_batch = self._batch
         self._labels = None
         self._predictions = None
         self._images = None
@@ -57,8 +98,23 @@ class Batch:
     @property
     def predictions(self):
         if self._predictions is None:
+            if self._device_batch is None:
+                self._device_batch = apply_to_tensor(self._batch, lambda it: _to_device(it, self._context.device))
             dataset = self._context.get_data_by_kind(self._dataset_kind)
-            self._predictions = dataset.infer_on_batch(self._batch, self._context.model, self._context.device)
+            inference_cache = self._context.inference_cache
+            if inference_cache is not None and self._batch_index is not None:
+                self._predictions = inference_cache.infer_on_batch(dataset, self._device_batch,
+                                                                   dataset.indices_of_batch(self._batch_index),
+                                                                   self._context.model, self._context.device)
+            else:
+                self._predictions = dataset.infer_on_batch(self._device_batch, self._context.model,
+                                                           self._context.device)
+            if self._device_batch is not self._batch:
+                # The labels are computed from the batch as returned by the dataloader, so the predictions are moved
+                # back to its device, to be used together with the labels (for example, by metrics)
+                host_device = _tensors_device(self._batch)
+                if host_device is not None:
+                    self._predictions = apply_to_tensor(self._predictions, lambda it: it.to(host_device))
         return self._predictions
 
     @property
@@ -97,6 +153,16 @@ class Context:
     random_state : int
         A seed to set for pseudo-random functions
     n_samples : int, default: None
+    inference_cache_dir : str , default: None
+        directory of a cache of the model predictions. If given, predictions computed in previous runs with the same
+        model and data are read from the cache instead of running the model. The data is identified by its length
+        and a sample of its samples, so changes to other samples are not detected; use a new directory when the data
+        changes
+    lazy_device_transfer : bool , default: False
+        if True, batches are moved to the device only when the model predictions on them are requested, so labels
+        and images are computed from the batches as returned by the data loader, and the predictions are moved back to
+        the device of these batches. Checks which use only labels or images then don't move the data to the device
+        at all
     """
 
     def __init__(self,
@@ -108,7 +174,9 @@ class Context:
                  scorers_per_class: Mapping[str, Metric] = None,
                  device: Union[str, torch.device, None] = 'cpu',
                  random_state: int = 42,
-                 n_samples: int = None
+                 n_samples: int = None,
+                 inference_cache_dir: str = None,
+                 lazy_device_transfer: bool = False
                  ):
         # Validations
         if train is None and test is None and model is None:
@@ -145,6 +213,8 @@ class Context:
         self._user_scorers = scorers
         self._user_scorers_per_class = scorers_per_class
         self._model_name = model_name
+        self._inference_cache = InferenceCache(inference_cache_dir) if inference_cache_dir else None
+        self._lazy_device_transfer = lazy_device_transfer
         self.random_state = random_state
 
     # Properties
@@ -176,6 +246,16 @@ class Context:
         """Return model name."""
         return self._model_name
 
+    @property
+    def inference_cache(self) -> Optional[InferenceCache]:
+        """Return the cache of the model predictions, or None if not caching."""
+        return self._inference_cache
+
+    @property
+    def lazy_device_transfer(self) -> bool:
+        """Return whether batches are moved to the device only when predictions are requested."""
+        return self._lazy_device_transfer
+
     @property
     def device(self) -> torch.device:
         """Return device specified by the user."""
@@ -16,22 +16,7 @@ from ignite.metrics import Metric
 from ignite.metrics.metric import sync_all_reduce, reinit__is_reduced
 import torch
 import numpy as np
-from .iou_utils import compute_pairwise_ious, build_class_bounding_box
-
-
-def _dict_conc(test_list):
-    result = defaultdict(list)
-
-    for i in range(len(test_list)):
-        current = test_list[i]
-        for key, value in current.items():
-            if isinstance(value, list):
-                for j in range(len(value)):
-                    result[key].append(value[j])
-            else:
-                result[key].append(value)
-
-    return result
+from .iou_utils import bounding_boxes_to_array, compute_pairwise_ious, build_class_bounding_box
 
 
 class AveragePrecision(Metric):
@@ -52,7 +37,7 @@ class AveragePrecision(Metric):
                  return_option: int = 0, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self._evals = defaultdict(lambda: {"scores": [], "matched": [], "NP": []})
+        self._evals = defaultdict(lambda: {"scores": [], "matched": [], "ignored": [], "NP": []})
         self.return_option = return_option
         if self.return_option is not None:
             max_dets = [max_dets[-1]]
@@ -68,7 +53,7 @@ class AveragePrecision(Metric):
     def reset(self):
         """Reset metric state."""
         super().reset()
-        self._evals = defaultdict(lambda: {"scores": [], "matched": [], "NP": []})
+        self._evals = defaultdict(lambda: {"scores": [], "matched": [], "ignored": [], "NP": []})
         self.i = 0
 
     @reinit__is_reduced
@@ -88,13 +73,7 @@ class AveragePrecision(Metric):
     @sync_all_reduce("_evals")
     def compute(self):
         """Compute metric value."""
-        # now reduce accumulations
         sorted_classes = sorted(self._evals.keys())
-        for class_id in sorted_classes:
-            acc = self._evals[class_id]
-            acc["scores"] = _dict_conc(acc["scores"])
-            acc["matched"] = _dict_conc(acc["matched"])
-            acc["NP"] = _dict_conc(acc["NP"])
         reses = {"precision": -np.ones((len(self.iou_thresholds),
                                         len(self.area_ranges_names),
                                         len(self.max_detections_per_class),
@@ -103,22 +82,22 @@ class AveragePrecision(Metric):
                                      len(self.area_ranges_names),
                                      len(self.max_detections_per_class),
                                      len(self._evals.keys())))}
-        for iou_i, min_iou in enumerate(self.iou_thresholds):
+        for class_i, class_id in enumerate(sorted_classes):
+            ev = self._evals[class_id]
+            n_positives = np.sum(ev["NP"], axis=0)
             for dets_i, dets in enumerate(self.max_detections_per_class):
-                for area_i, area_size in enumerate(self.area_ranges_names):
-                    precision_list = []
-                    recall_list = []
-                    # run ap calculation per-class
-                    for class_id in sorted_classes:
-                        ev = self._evals[class_id]
-                        precision, recall = \
-                            self._compute_ap_recall(np.array(ev["scores"][(area_size, dets, min_iou)]),
-                                                    np.array(ev["matched"][(area_size, dets, min_iou)]),
-                                                    np.sum(np.array(ev["NP"][(area_size, dets, min_iou)])))
-                        precision_list.append(precision)
-                        recall_list.append(recall)
-                    reses["precision"][iou_i, area_i, dets_i] = np.array(precision_list)
-                    reses["recall"][iou_i, area_i, dets_i] = np.array(recall_list)
+                # concatenate the top detections of all the images
+                scores = np.concatenate([image_scores[:dets] for image_scores in ev["scores"]])
+                matched = np.concatenate([image_matched[..., :dets] for image_matched in ev["matched"]], axis=-1)
+                ignored = np.concatenate([image_ignored[..., :dets] for image_ignored in ev["ignored"]], axis=-1)
+                for area_i in range(len(self.area_ranges_names)):
+                    for iou_i in range(len(self.iou_thresholds)):
+                        not_ignored = ~ignored[area_i, iou_i]
+                        precision, recall = self._compute_ap_recall(scores[not_ignored],
+                                                                    matched[area_i, iou_i][not_ignored],
+                                                                    n_positives[area_i])
+                        reses["precision"][iou_i, area_i, dets_i, class_i] = precision
+                        reses["recall"][iou_i, area_i, dets_i, class_i] = recall
         if self.return_option == 0:
             return torch.tensor(self.get_classes_scores_at(reses["precision"],
                                                            max_dets=self.max_detections_per_class[0],
@@ -133,94 +112,76 @@ class AveragePrecision(Metric):
 
     def _group_detections(self, detected, ground_truth):
         """Group gts and dts on a imageXclass basis."""
+        detected = bounding_boxes_to_array(detected, 6)
+        ground_truth = bounding_boxes_to_array(ground_truth, 5)
         # Calculating pairwise IoUs on classes
-        bb_info = build_class_bounding_box(detected, ground_truth)
-        ious = {k: compute_pairwise_ious(v["detected"], v["ground_truth"]) for k, v in bb_info.items()}
-
-        for class_id in ious.keys():
-            image_evals = self._evaluate_image(
-                bb_info[class_id]["detected"],
-                bb_info[class_id]["ground_truth"],
-                ious[class_id]
-            )
+        for class_id, bounding_boxes in build_class_bounding_box(detected, ground_truth).items():
+            class_detected, class_ground_truth = bounding_boxes["detected"], bounding_boxes["ground_truth"]
+            image_evals = self._evaluate_image(class_detected, class_ground_truth,
+                                               compute_pairwise_ious(class_detected, class_ground_truth))
 
             acc = self._evals[class_id]
-            acc["scores"].append(image_evals["scores"])
-            acc["matched"].append(image_evals["matched"])
-            acc["NP"].append(image_evals["NP"])
+            for key, value in image_evals.items():
+                acc[key].append(value)
 
     def _evaluate_image(self, detections, ground_truths, ious):
-        """Det - [x, y, w, h, confidence, label], gt - [label, x, y, w, h]."""
-        # Sort detections by increasing confidence
-
-        detections = [self.Prediction(d) for d in detections]
-        sorted_detection_ids = np.argsort([-d.confidence for d in detections], kind="stable")
-        orig_ious = ious
-        orig_gt = ground_truths
-        ground_truth_area = np.array([g[3] * g[4] for g in orig_gt])
-
-        scores = {}
-        matched = {}
-        n_gts = {}
-        for min_iou in self.iou_thresholds:
-            for top_n_detections in self.max_detections_per_class:
-                for area_size in self.area_ranges_names:
-                    # sort list of dts and chop by max dets
-                    dt = [detections[idx] for idx in sorted_detection_ids[:top_n_detections]]
-                    ious = orig_ious[sorted_detection_ids[:top_n_detections]]
-                    ground_truth_to_ignore = [self._is_ignore_area(gt_area, area_size) for gt_area in ground_truth_area]
-
-                    # sort gts by ignore last
-                    gt_sort = np.argsort(ground_truth_to_ignore, kind="stable")
-                    ground_truths = [orig_gt[idx] for idx in gt_sort]
-                    ground_truth_to_ignore = [ground_truth_to_ignore[idx] for idx in gt_sort]
-
-                    ious = ious[:, gt_sort]
-
-                    detection_matches = \
-                        self._get_best_matches(dt, min_iou, ground_truths, ground_truth_to_ignore, ious)
-
-                    # generate ignore list for dts
-                    detections_to_ignore = [
-                        ground_truth_to_ignore[detection_matches[d_idx]] if d_idx in detection_matches
-                        else self._is_ignore_area(d.bbox[2] * d.bbox[3], area_size)
-                        for d_idx, d in enumerate(dt)
-                    ]
-
-                    # get score for non-ignored dts
-                    scores[(area_size, top_n_detections, min_iou)] = \
-                        [dt[d_idx].confidence for d_idx in range(len(dt))
-                         if not detections_to_ignore[d_idx]]
-                    matched[(area_size, top_n_detections, min_iou)] = \
-                        [d_idx in detection_matches for d_idx in range(len(dt))
-                         if not detections_to_ignore[d_idx]]
-                    n_gts[(area_size, top_n_detections, min_iou)] = \
-                        len([g_idx for g_idx in range(len(ground_truths)) if not ground_truth_to_ignore[g_idx]])
-        return {"scores": scores, "matched": matched, "NP": n_gts}
-
-    def _get_best_matches(self, dt, min_iou, ground_truths, ground_truth_to_ignore, ious):
-        ground_truth_matched = {}
-        detection_matches = {}
-
-        for d_idx in range(len(dt)):
-            # information about best match so far (best_match=-1 -> unmatched)
-            best_iou = min(min_iou, 1 - 1e-10)
-            best_match = -1
-            for g_idx in range(len(ground_truths)):
-                # if this gt already matched, continue
-                if g_idx in ground_truth_matched:
-                    continue
-                # if dt matched and currently on ignore gt, stop
-                # this exists to allow for matching ignored ground truth, so that we ignore this detection
-                if best_match > -1 and ground_truth_to_ignore[g_idx]:
-                    break
-
-                if ious[d_idx, g_idx] >= best_iou:
-                    best_iou = ious[d_idx, g_idx]
-                    best_match = g_idx
-            if best_match != -1:
-                detection_matches[d_idx] = best_match
-                ground_truth_matched[best_match] = d_idx
+        """Det - [x, y, w, h, confidence, label], gt - [label, x, y, w, h].
+
+        Returns the scores of the top detections sorted by decreasing confidence, and for every area range and iou
+        threshold which of them are matched and which are ignored, as arrays of shape (areas, thresholds, detections).
+        The results for fewer max detections are the prefixes of these arrays, as the matching is greedy.
+        """
+        # Sort detections by decreasing confidence
+        sorted_detection_ids = np.argsort(-detections[:, 4], kind="stable")[:max(self.max_detections_per_class)]
+        detections = detections[sorted_detection_ids]
+        ious = ious[sorted_detection_ids]
+
+        ground_truth_to_ignore = np.stack([self._is_ignore_area(ground_truths[:, 3] * ground_truths[:, 4], area_size)
+                                           for area_size in self.area_ranges_names])
+        detection_area_to_ignore = np.stack([self._is_ignore_area(detections[:, 2] * detections[:, 3], area_size)
+                                             for area_size in self.area_ranges_names])
+
+        detection_matches = self._get_best_matches(ious, ground_truth_to_ignore)
+        matched = detection_matches > -1
+        # matched detections are ignored if their ground truth is ignored, and unmatched by their area
+        if len(ground_truths):
+            matched_ground_truth_ignored = np.take_along_axis(ground_truth_to_ignore[:, np.newaxis, :],
+                                                              np.maximum(detection_matches, 0), axis=2)
+        else:
+            matched_ground_truth_ignored = np.zeros(matched.shape, dtype=bool)
+        ignored = np.where(matched, matched_ground_truth_ignored, detection_area_to_ignore[:, np.newaxis, :])
+
+        return {"scores": detections[:, 4], "matched": matched, "ignored": ignored,
+                "NP": np.count_nonzero(~ground_truth_to_ignore, axis=1)}
+
+    def _get_best_matches(self, ious, ground_truth_to_ignore):
+        """Greedily match the detections, sorted by decreasing confidence, to the ground truths.
+
+        The matching is done for all area ranges and iou thresholds at once. Each detection is matched to the
+        unmatched ground truth with the highest iou above the threshold (the last one on ties), preferring ground
+        truths which aren't ignored. Returns the index of the matched ground truth of each detection, or -1, in
+        array of shape (areas, thresholds, detections).
+        """
+        n_detections, n_ground_truths = ious.shape
+        shape = (len(ground_truth_to_ignore), len(self.iou_thresholds))
+        detection_matches = -np.ones(shape + (n_detections,), dtype=int)
+        if n_ground_truths == 0:
+            return detection_matches
+
+        min_ious = np.minimum(self.iou_thresholds, 1 - 1e-10)[np.newaxis, :, np.newaxis]
+        ground_truth_to_ignore = ground_truth_to_ignore[:, np.newaxis, :]
+        ground_truth_matched = np.zeros(shape + (n_ground_truths,), dtype=bool)
+        ground_truth_ids = np.arange(n_ground_truths)
+        for d_idx in range(n_detections):
+            candidates_ious = np.where(~ground_truth_matched & (ious[d_idx] >= min_ious), ious[d_idx], -1)
+            # ignored ground truths are matched only if no other ground truth can be matched
+            not_ignored_ious = np.where(ground_truth_to_ignore, -1, candidates_ious)
+            candidates_ious = np.where(not_ignored_ious.max(axis=2, keepdims=True) > -1, not_ignored_ious,
+                                       candidates_ious)
+            best_match = n_ground_truths - 1 - np.argmax(candidates_ious[..., ::-1], axis=2)
+            has_match = np.take_along_axis(candidates_ious, best_match[..., np.newaxis], axis=2)[..., 0] > -1
+            detection_matches[..., d_idx] = np.where(has_match, best_match, -1)
+            ground_truth_matched |= has_match[..., np.newaxis] & (ground_truth_ids == best_match[..., np.newaxis])
         return detection_matches
 
     def _compute_ap_recall(self, scores, matched, n_positives, recall_thresholds=None):
@@ -252,20 +213,20 @@ class AveragePrecision(Metric):
             rec_idx = np.searchsorted(rc, recall_thresholds, side="left")
 
             # get interpolated precision values at the evaluation thresholds
-            i_pr = np.array([i_pr[r] if r < len(i_pr) else 0 for r in rec_idx])
+            i_pr = np.append(i_pr, 0)[np.minimum(rec_idx, len(i_pr))]
 
             return np.mean(i_pr), rc[-1]
         return 0, 0
 
-    def _is_ignore_area(self, area_bb, area_size):
+    def _is_ignore_area(self, area_bb: np.ndarray, area_size):
         """Generate ignored gt list by area_range."""
         if area_size == "small":
-            return not area_bb < self.area_range[0]
+            return ~(area_bb < self.area_range[0])
         if area_size == "medium":
-            return not self.area_range[0] <= area_bb <= self.area_range[1]
+            return ~((self.area_range[0] <= area_bb) & (area_bb <= self.area_range[1]))
         if area_size == "large":
-            return not area_bb > self.area_range[1]
-        return False
+            return ~(area_bb > self.area_range[1])
+        return np.zeros(len(area_bb), dtype=bool)
 
     def filter_res(self, res: np.array, iou: float = None, area: str = None, max_dets: int = None):
         """Get the value of a result by the filtering values.
@@ -328,12 +289,3 @@ class AveragePrecision(Metric):
         if zeroed_negative:
             res = res.clip(min=0)
         return res[0][0]
-
-    class Prediction:
-        """A class defining the prediction of a single image in an object detection task."""
-
-        def __init__(self, det):
-            det_cpu = det.cpu()
-            self.bbox = det_cpu[:4]
-            self.confidence = det_cpu[4]
-            self.label = det_cpu[5]
@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module for computing Intersection over Unions."""
-from collections import defaultdict
+from typing import Dict, Tuple
 
 import numpy as np
 import torch
@@ -41,40 +41,82 @@ def jaccard_iou(dt, gt):
     return float(intersection / (dt_area + gt_area - intersection))
 
 
+def bounding_boxes_to_array(boxes, n_columns: int) -> np.ndarray:
+    """Convert a tensor or a list of bounding boxes to a 2D array, with a box in each row.
+
+    The values keep their dtype, so calculations on them (such as areas) are the same as on the original tensors.
+    """
+    if isinstance(boxes, torch.Tensor):
+        boxes = boxes.detach().cpu().numpy()
+    elif len(boxes) > 0 and isinstance(boxes[0], torch.Tensor):
+        boxes = torch.stack(list(boxes)).detach().cpu().numpy()
+    boxes = np.asarray(boxes)
+    if boxes.size == 0:
+        return boxes.reshape(0, n_columns)
+    return boxes.reshape(len(boxes), -1)
+
+
+def jaccard_iou_matrix(detected: np.ndarray, ground_truth: np.ndarray) -> np.ndarray:
+    """Calculate the jaccard IoU of every pair of detection and ground truth boxes at once.
+
+    Parameters
+    ----------
+    detected : np.ndarray
+        array of detections, with a detection [x, y, w, h, ...] in each row.
+    ground_truth : np.ndarray
+        array of ground truth boxes, with a box [label, x, y, w, h] in each row.
+    Returns
+    -------
+    np.ndarray
+        matrix of the IoU of each detection (row) with each ground truth box (column).
+    """
+    detected, ground_truth = detected.astype(np.float64), ground_truth.astype(np.float64)
+    x_dt, y_dt, w_dt, h_dt = (detected[:, i, np.newaxis] for i in range(4))
+    x_gt, y_gt, w_gt, h_gt = (ground_truth[np.newaxis, :, i] for i in range(1, 5))
+
+    intersection_w = np.maximum(np.minimum(x_dt + w_dt, x_gt + w_gt) - np.maximum(x_dt, x_gt), 0)
+    intersection_h = np.maximum(np.minimum(y_dt + h_dt, y_gt + h_gt) - np.maximum(y_dt, y_gt), 0)
+    intersection = intersection_w * intersection_h
+    union = w_dt * h_dt + w_gt * h_gt - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
 def compute_pairwise_ious(detected, ground_truth):
     """Compute pairwise ious between detections and ground truth."""
-    ious = np.zeros((len(detected), len(ground_truth)))
-    for g_idx, g in enumerate(ground_truth):
-        for d_idx, d in enumerate(detected):
-            ious[d_idx, g_idx] = jaccard_iou(d, g)
-    return ious
+    return jaccard_iou_matrix(bounding_boxes_to_array(detected, 6), bounding_boxes_to_array(ground_truth, 5))
+
+
+def _class_indices(detected: np.ndarray, ground_truth: np.ndarray) -> Dict[float, Tuple[np.ndarray, np.ndarray]]:
+    """Return the indices of the detections and of the ground truth boxes of each class."""
+    detected_classes, ground_truth_classes = detected[:, 5], ground_truth[:, 0]
+    classes = np.unique(np.concatenate([detected_classes, ground_truth_classes]))
+    return {class_id: (np.flatnonzero(detected_classes == class_id), np.flatnonzero(ground_truth_classes == class_id))
+            for class_id in classes.tolist()}
+
+
+def _take(boxes, indices: np.ndarray, n_columns: int):
+    if isinstance(boxes, torch.Tensor):
+        boxes = boxes.reshape(0, n_columns) if boxes.numel() == 0 else boxes.reshape(len(boxes), -1)
+        return boxes[torch.from_numpy(indices)]
+    if isinstance(boxes, np.ndarray):
+        return bounding_boxes_to_array(boxes, n_columns)[indices]
+    return [boxes[i] for i in indices]
 
 
 def build_class_bounding_box(detected, ground_truth):
     """Group bounding box by class."""
-    class_bounding_boxes = defaultdict(lambda: {"detected": [], "ground_truth": []})
-
-    for d in detected:
-        if isinstance(d[5], torch.Tensor):
-            class_id = d[5].item()
-        else:
-            class_id = d[5]
-        class_bounding_boxes[class_id]["detected"].append(d)
-    for g in ground_truth:
-        if isinstance(g[0], torch.Tensor):
-            class_id = g[0].item()
-        else:
-            class_id = g[0]
-        class_bounding_boxes[class_id]["ground_truth"].append(g)
-    return class_bounding_boxes
+    class_indices = _class_indices(bounding_boxes_to_array(detected, 6), bounding_boxes_to_array(ground_truth, 5))
+    return {class_id: {"detected": _take(detected, detected_indices, 6),
+                       "ground_truth": _take(ground_truth, ground_truth_indices, 5)}
+            for class_id, (detected_indices, ground_truth_indices) in class_indices.items()}
 
 
 def compute_class_ious(detected, ground_truth):
     """Compute ious between bounding boxes of the same class."""
-    bb_info = build_class_bounding_box(detected, ground_truth)
-
+    detected, ground_truth = bounding_boxes_to_array(detected, 6), bounding_boxes_to_array(ground_truth, 5)
     # Calculating pairwise IoUs per class
-    return {class_id: compute_pairwise_ious(**bounding_boxes) for class_id, bounding_boxes in bb_info.items()}
+    return {class_id: jaccard_iou_matrix(detected[detected_indices], ground_truth[ground_truth_indices])
+            for class_id, (detected_indices, ground_truth_indices) in _class_indices(detected, ground_truth).items()}
 
 
 def per_sample_mean_iou(predictions, labels):
@@ -91,19 +133,11 @@ def per_sample_mean_iou(predictions, labels):
             mean_ious.append(0)
             continue
 
-        ious = compute_class_ious(detected, ground_truth)
-        count = 0
-        sum_iou = 0
-
-        for _, cls_ious in ious.items():
-            # Find best fit for each detection
-            for detection in cls_ious:
-                sum_iou += max(detection, default=0)
-                count += 1
-
-        if count:
-            mean_ious.append(sum_iou / count)
-        else:
-            mean_ious.append(0)
+        detected, ground_truth = bounding_boxes_to_array(detected, 6), bounding_boxes_to_array(ground_truth, 5)
+        ious = jaccard_iou_matrix(detected, ground_truth)
+        # Find best fit for each detection among the ground truth of its class
+        same_class = detected[:, 5, np.newaxis] == ground_truth[np.newaxis, :, 0]
+        best_ious = np.where(same_class, ious, 0).max(axis=1)
+        mean_ious.append(float(best_ious.mean()))
 
     return mean_ious
@@ -11,7 +11,9 @@
 """Module for base vision abstractions."""
 # pylint: disable=broad-except,not-callable
 import logging
-from typing import Tuple, Mapping, Optional, Union, Dict, List
+import queue
+import threading
+from typing import Tuple, Mapping, Optional, Union, Dict, List, Iterator
 from collections import OrderedDict
 
 import torch
@@ -22,7 +24,7 @@ from deepchecks.core.check_result import CheckFailure, CheckResult
 from deepchecks.core.checks import DatasetKind
 from deepchecks.core.suite import BaseSuite, SuiteResult
 from deepchecks.core.display_suite import ProgressBar
-from deepchecks.core.errors import DeepchecksNotSupportedError
+from deepchecks.core.errors import DeepchecksNotSupportedError, DeepchecksValueError
 from deepchecks.vision.base_checks import ModelOnlyCheck, SingleDatasetCheck, TrainTestCheck
 from deepchecks.vision.context import Context
 from deepchecks.vision.vision_data import VisionData
@@ -35,6 +37,71 @@ __all__ = ['Suite']
 
 logger = logging.getLogger('deepchecks')
 
+# Marks the end of the batches in the prefetch queue
+_END_OF_BATCHES = object()
+
+
+def _load_batch(batch, context: Context, dataset_kind: DatasetKind, batch_index: int) -> Batch:
+    """Create the Batch and compute its labels and predictions ahead of the check updates."""
+    batch = Batch(batch, context, dataset_kind, batch_index)
+    try:
+        _ = batch.labels
+        if context._model is not None:  # pylint: disable=protected-access
+            _ = batch.predictions
+    except Exception:
+        # Failures are raised again when the checks access the labels or predictions, as in the sequential mode
+        pass
+    return batch
+
+
+def _iterate_batches(context: Context, dataset_kind: DatasetKind, prefetch_batches: int) -> Iterator[Batch]:
+    """Iterate over the batches of the dataset, loading and inferring up to prefetch_batches ahead in the background.
+
+    A single background thread puts the batches into a bounded queue, so the batches are yielded in the order of
+    the data loader.
+    """
+    vision_data = context.get_data_by_kind(dataset_kind)
+    if prefetch_batches == 0:
+        for batch_index, batch in enumerate(vision_data):
+            yield Batch(batch, context, dataset_kind, batch_index)
+        return
+
+    batches_queue = queue.Queue(maxsize=prefetch_batches)
+    stop_event = threading.Event()
+
+    def put(item):
+        # Put with timeout, in order to stop if the consumer stopped iterating
+        while not stop_event.is_set():
+            try:
+                batches_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def worker():
+        try:
+            for batch_index, batch in enumerate(vision_data):
+                if stop_event.is_set():
+                    return
+                put(_load_batch(batch, context, dataset_kind, batch_index))
+            put(_END_OF_BATCHES)
+        except Exception as exp:
+            put(exp)
+
+    thread = threading.Thread(target=worker, name='deepchecks-batch-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = batches_queue.get()
+            if item is _END_OF_BATCHES:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
+        thread.join()
+
 
 class Suite(BaseSuite):
     """Tabular suite to run checks of types: TrainTestCheck, SingleDatasetCheck, ModelOnlyCheck."""
@@ -52,7 +119,10 @@ class Suite(BaseSuite):
             scorers: Mapping[str, Metric] = None,
             scorers_per_class: Mapping[str, Metric] = None,
             device: Union[str, torch.device, None] = 'cpu',
-            random_state: int = 42
+            random_state: int = 42,
+            prefetch_batches: int = 0,
+            inference_cache_dir: str = None,
+            lazy_device_transfer: bool = False
     ) -> SuiteResult:
         """Run all checks.
 
@@ -75,12 +145,26 @@ class Suite(BaseSuite):
             processing unit for use
         random_state : int
             A seed to set for pseudo-random functions
+        prefetch_batches : int , default: 0
+            number of batches to load and infer in a background thread, while the checks update on the current
+            batch. If 0, batches are loaded and inferred one at a time, when the checks use them
+        inference_cache_dir : str , default: None
+            directory of a cache of the model predictions on disk. If given, predictions of samples already computed
+            with the same model and data in previous runs are read from the cache instead of running the model. The
+            data is identified by its length and a sample of its samples, so changes to other samples are not
+            detected; use a new directory when the data changes
+        lazy_device_transfer : bool , default: False
+            if True, batches are moved to the device only when the model predictions on them are requested, so
+            suites of checks using only labels or images don't move the data to the device
 
         Returns
         -------
         SuiteResult
             All results by all initialized checks
         """
+        if not isinstance(prefetch_batches, int) or prefetch_batches < 0:
+            raise DeepchecksValueError(f'prefetch_batches must be a non-negative integer, but got: {prefetch_batches}')
+
         all_pbars = []
         progress_bar = ProgressBar('Validating Input', 1, unit='')
         all_pbars.append(progress_bar)
@@ -91,7 +175,9 @@ class Suite(BaseSuite):
             scorers=scorers,
             scorers_per_class=scorers_per_class,
             device=device,
-            random_state=random_state
+            random_state=random_state,
+            inference_cache_dir=inference_cache_dir,
+            lazy_device_transfer=lazy_device_transfer
         )
         progress_bar.inc_progress()
 
@@ -116,7 +202,8 @@ class Suite(BaseSuite):
                 run_train_test_checks=run_train_test_checks,
                 results=results,
                 dataset_kind=DatasetKind.TRAIN,
-                progress_bars=all_pbars
+                progress_bars=all_pbars,
+                prefetch_batches=prefetch_batches
             )
 
         if test_dataset is not None:
@@ -125,7 +212,8 @@ class Suite(BaseSuite):
                 run_train_test_checks=run_train_test_checks,
                 results=results,
                 dataset_kind=DatasetKind.TEST,
-                progress_bars=all_pbars
+                progress_bars=all_pbars,
+                prefetch_batches=prefetch_batches
             )
 
         # Need to compute only on not SingleDatasetCheck, since they computed inside the loop
@@ -159,7 +247,8 @@ class Suite(BaseSuite):
         run_train_test_checks: bool,
         results: Dict[Union[str, int], Union[CheckResult, CheckFailure]],
         dataset_kind: DatasetKind,
-        progress_bars: List
+        progress_bars: List,
+        prefetch_batches: int = 0
     ):
         type_suffix = ' - Test Dataset' if dataset_kind == DatasetKind.TEST else ' - Train Dataset'
         vision_data = context.get_data_by_kind(dataset_kind)
@@ -181,9 +270,8 @@ class Suite(BaseSuite):
         progress_bars.append(progress_bar)
 
         # Run on all the batches
-        for batch_id, batch in enumerate(vision_data):
+        for batch_id, batch in enumerate(_iterate_batches(context, dataset_kind, prefetch_batches)):
             progress_bar.set_text(f'{100 * batch_id / (1. * n_batches):.0f}%')
-            batch = Batch(batch, context, dataset_kind)
             vision_data.update_cache(batch.labels)
             for check_idx, check in self.checks.items():
                 # If index in results the check already failed before
@@ -9,7 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the image formatter class for the vision module."""
-from typing import Tuple, List
+from typing import Any, Callable, Dict, Tuple, List
 
 import numpy as np
 from skimage.color import rgb2gray
@@ -27,6 +27,8 @@ __all__ = ['default_image_properties',
            'get_size',
            'get_dimension',
            'validate_properties',
+           'calc_default_image_properties',
+           'calc_properties',
            'get_column_type']
 
 
@@ -42,18 +44,12 @@ def area(batch: List[np.ndarray]) -> List[int]:
 
 def brightness(batch: List[np.ndarray]) -> List[float]:
     """Calculate brightness on each image in the batch."""
-    if _is_grayscale(batch) is True:
-        return [img.mean() for img in batch]
-    else:
-        return [rgb2gray(img).mean() for img in batch]
+    return _calc_on_groups(batch, lambda images: _grayscale(images).mean(axis=(1, 2)))
 
 
 def rms_contrast(batch: List[np.array]) -> List[float]:
     """Return RMS contrast of image."""
-    if _is_grayscale(batch) is False:
-        batch = [rgb2gray(img) for img in batch]
-
-    return [img.std() for img in batch]
+    return _calc_on_groups(batch, lambda images: _grayscale(images).std(axis=(1, 2)))
 
 
 def normalized_red_mean(batch: List[np.ndarray]) -> List[float]:
@@ -87,8 +83,6 @@ def _normalized_rgb_mean(batch: List[np.ndarray]) -> List[Tuple[float, float, fl
     ----------
     batch: List[np.ndarray]
         A list of arrays, each arrays represents an image in the required deepchecks format.
-    sample_size_for_image_properties: int
-        The number of pixels to sample from each image.
 
     Returns
     -------
@@ -99,25 +93,128 @@ def _normalized_rgb_mean(batch: List[np.ndarray]) -> List[Tuple[float, float, fl
     if _is_grayscale(batch) is True:
         return [(None, None, None)] * len(batch)
 
-    return [_normalize_pixelwise(img).mean(axis=(1, 2)) for img in batch]
+    return _calc_on_groups(batch, lambda images: _normalize_pixelwise(images).mean(axis=(1, 2)))
 
 
-def _normalize_pixelwise(img: np.ndarray) -> np.ndarray:
-    """Normalize the pixel values of an image.
+def _normalize_pixelwise(images: np.ndarray) -> np.ndarray:
+    """Normalize the pixel values of a stack of same sized images.
 
     Parameters
     ----------
-    img: np.ndarray
-        The image to normalize.
+    images: np.ndarray
+        The images to normalize, of shape (N, H, W, C).
 
     Returns
     -------
     np.ndarray
-        The normalized image.
+        The normalized images, of shape (N, H, W, 3).
+    """
+    channels_sum = images.sum(axis=3, keepdims=True)
+    rgb = images[..., :3]
+    return np.divide(rgb, channels_sum, out=np.zeros(rgb.shape, dtype='float64'), where=channels_sum != 0)
+
+
+def _group_by_shape(batch: List[np.ndarray]) -> List[Tuple[List[int], np.ndarray]]:
+    """Stack images of the same shape into arrays of shape (N, H, W, C).
+
+    Returns
+    -------
+    List[Tuple[List[int], np.ndarray]]
+        For every distinct image shape, the positions of the images in the batch and the stacked images.
     """
-    s = img.sum(axis=2)
-    return np.array([np.divide(img[:, :, i], s, out=np.zeros_like(img[:, :, i], dtype='float64'), where=s != 0)
-                     for i in range(3)])
+    if isinstance(batch, np.ndarray) and batch.ndim == 4:
+        return [(list(range(len(batch))), batch)]
+    positions_by_shape = {}
+    for position, img in enumerate(batch):
+        positions_by_shape.setdefault(img.shape, []).append(position)
+    return [(positions, np.stack([batch[i] for i in positions]))
+            for positions in positions_by_shape.values()]
+
+
+def _calc_on_groups(batch: List[np.ndarray], func: Callable[[np.ndarray], np.ndarray]) -> list:
+    """Apply a function on stacks of same sized images, and return its results in the order of the batch."""
+    results = [None] * len(batch)
+    for positions, images in _group_by_shape(batch):
+        for position, value in zip(positions, func(images)):
+            results[position] = value
+    return results
+
+
+def _grayscale(images: np.ndarray) -> np.ndarray:
+    """Return grayscale of a stack of images, of shape (N, H, W)."""
+    if images.shape[3] == 1:
+        return images[..., 0]
+    return rgb2gray(images)
+
+
+def calc_default_image_properties(batch: List[np.ndarray]) -> Dict[Callable, list]:
+    """Calculate all the default image properties on the batch in a single pass.
+
+    Images of the same shape are stacked together, so the grayscale images and the channels sums are calculated
+    once per stack and shared between the properties.
+
+    Parameters
+    ----------
+    batch: List[np.ndarray]
+        A list of arrays, each arrays represents an image in the required deepchecks format.
+
+    Returns
+    -------
+    Dict[Callable, list]
+        Mapping of every default property method to its values on the batch.
+    """
+    n_images = len(batch)
+    results = {prop['method']: [None] * n_images for prop in default_image_properties}
+    is_grayscale = n_images > 0 and _is_grayscale(batch)
+
+    for positions, images in _group_by_shape(batch):
+        height, width = images.shape[1], images.shape[2]
+        gray = _grayscale(images)
+        group_results = {
+            aspect_ratio: [height / width] * len(positions),
+            area: [height * width] * len(positions),
+            brightness: gray.mean(axis=(1, 2)),
+            rms_contrast: gray.std(axis=(1, 2)),
+        }
+        if not is_grayscale:
+            normalized_means = _normalize_pixelwise(images).mean(axis=(1, 2))
+            group_results[normalized_red_mean] = normalized_means[:, 0]
+            group_results[normalized_green_mean] = normalized_means[:, 1]
+            group_results[normalized_blue_mean] = normalized_means[:, 2]
+        for method, values in group_results.items():
+            for position, value in zip(positions, values):
+                results[method][position] = value
+
+    return results
+
+
+def calc_properties(batch: List[np.ndarray], properties: List[Dict[str, Any]]) -> Dict[str, list]:
+    """Calculate the given image properties on the batch.
+
+    The default image properties are calculated together in a single pass over the batch, other properties are
+    calculated by calling their method.
+
+    Parameters
+    ----------
+    batch: List[np.ndarray]
+        A list of arrays, each arrays represents an image in the required deepchecks format.
+    properties: List[Dict[str, Any]]
+        The image properties to calculate, in the structure of default_image_properties.
+
+    Returns
+    -------
+    Dict[str, list]
+        Mapping of every property name to its values on the batch.
+    """
+    default_methods = {prop['method'] for prop in default_image_properties}
+    if sum(prop['method'] in default_methods for prop in properties) > 1:
+        calculated = calc_default_image_properties(batch)
+    else:
+        calculated = {}
+    return {
+        prop['name']: calculated[prop['method']] if prop['method'] in calculated else prop['method'](batch)
+        for prop in properties
+    }
 
 
 def _is_grayscale(batch):
@@ -0,0 +1,251 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Module for caching model predictions of vision data on disk, between runs."""
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import threading
+import typing as t
+
+import numpy as np
+import torch
+
+from deepchecks.vision.vision_data import VisionData
+
+
+__all__ = ['InferenceCache', 'model_fingerprint', 'data_fingerprint']
+
+
+logger = logging.getLogger('deepchecks')
+
+# Number of samples of the dataset hashed by data_fingerprint
+DATA_FINGERPRINT_SAMPLES = 32
+
+
+def _update_hash(hasher, obj):
+    """Update hasher with the content of a (possibly nested) batch object."""
+    if isinstance(obj, torch.Tensor):
+        obj = obj.detach().cpu().numpy()
+    if isinstance(obj, np.ndarray):
+        hasher.update(str((obj.dtype, obj.shape)).encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            _update_hash(hasher, item)
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            hasher.update(str(key).encode())
+            _update_hash(hasher, obj[key])
+    else:
+        hasher.update(repr(obj).encode())
+
+
+def model_fingerprint(model) -> str:
+    """Return fingerprint of the model, changing when the model weights change.
+
+    Parameters
+    ----------
+    model
+        The model. For torch modules the fingerprint is based on the state dict, for other models on their pickle.
+    """
+    hasher = hashlib.sha256(f'{type(model).__module__}.{type(model).__qualname__}'.encode())
+    if isinstance(model, torch.nn.Module):
+        _update_hash(hasher, dict(model.state_dict()))
+    else:
+        buffer = io.BytesIO()
+        torch.save(model, buffer, pickle_module=pickle)
+        hasher.update(buffer.getvalue())
+    return hasher.hexdigest()
+
+
+def data_fingerprint(vision_data: VisionData, n_samples: int = DATA_FINGERPRINT_SAMPLES) -> str:
+    """Return fingerprint of the underlying dataset of the vision data.
+
+    The fingerprint is based on the dataset type, its length and the content (after the dataset transforms) of
+    n_samples evenly spaced samples, including the first and the last, so it is independent of the sampling and order
+    of the vision data. Changes to other samples of the dataset don't change the fingerprint.
+
+    Parameters
+    ----------
+    vision_data : VisionData
+        The vision data.
+    n_samples : int , default: 32
+        Number of samples of the dataset to hash.
+    """
+    dataset = vision_data.data_loader.dataset
+    hasher = hashlib.sha256(f'{type(dataset).__module__}.{type(dataset).__qualname__}'.encode())
+    hasher.update(str(len(dataset)).encode())
+    if len(dataset) > 0:
+        for index in np.unique(np.linspace(0, len(dataset) - 1, min(n_samples, len(dataset))).round().astype(int)):
+            _update_hash(hasher, vision_data.to_batch(dataset[int(index)]))
+    return hasher.hexdigest()
+
+
+class _PredictionsStore:
+    """Per-sample predictions of a single model on a single dataset, kept in append-only files.
+
+    The predictions rows of all samples are appended to a values file which is read as memory-mapped array, and
+    every batch appends its (dataset index, first row, number of rows) triplets to an index file.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._values_path = os.path.join(directory, 'values.bin')
+        self._index_path = os.path.join(directory, 'index.bin')
+        self._meta_path = os.path.join(directory, 'meta.json')
+        self._lock = threading.Lock()
+        self._values = None
+        self._meta = None
+        self._rows = {}
+
+        if os.path.exists(self._meta_path) and os.path.exists(self._index_path):
+            with open(self._meta_path, 'r', encoding='utf8') as f:
+                self._meta = json.load(f)
+            index = np.fromfile(self._index_path, dtype=np.int64).reshape(-1, 3)
+            n_rows = os.path.getsize(self._values_path) // self._row_size()
+            # Ignore index entries of rows which weren't fully written
+            for dataset_index, start, length in index[index[:, 1] + index[:, 2] <= n_rows].tolist():
+                self._rows[dataset_index] = (start, length)
+
+    def _row_size(self) -> int:
+        return self._meta['n_columns'] * np.dtype(self._meta['dtype']).itemsize
+
+    def _get_values(self, needed_rows: int) -> np.ndarray:
+        # Re-map the file if rows were appended since it was mapped
+        if self._values is None or len(self._values) < needed_rows:
+            self._values = np.memmap(self._values_path, dtype=self._meta['dtype'], mode='r').reshape(
+                -1, self._meta['n_columns']
+            )
+        return self._values
+
+    def contains(self, indices: t.Sequence[int]) -> bool:
+        return all(index in self._rows for index in indices)
+
+    def get(self, indices: t.Sequence[int]) -> t.Union[torch.Tensor, t.List[torch.Tensor]]:
+        rows = [self._rows[index] for index in indices]
+        values = self._get_values(max(start + length for start, length in rows))
+        samples = [torch.from_numpy(np.array(values[start:start + length])) for start, length in rows]
+        if self._meta['stacked']:
+            return torch.cat(samples).reshape(len(samples), *self._meta['sample_shape'])
+        return samples
+
+    def add(self, indices: t.Sequence[int], predictions: t.Union[torch.Tensor, t.List[torch.Tensor]]):
+        stacked = isinstance(predictions, torch.Tensor)
+        samples = [p.detach().cpu().numpy() for p in predictions]
+        if not samples:
+            return
+        sample_shape = list(samples[0].shape)
+        # Every sample is kept as 2D array of rows. Stacked predictions have a single row per sample, and list
+        # predictions (such as detections) have a row per item
+        if stacked:
+            samples = [s.reshape(1, -1) for s in samples]
+        else:
+            samples = [s.reshape(len(s), -1) if s.ndim != 2 and s.size else s for s in samples]
+        n_columns = max((s.shape[1] for s in samples if s.ndim == 2), default=None)
+
+        with self._lock:
+            if self._meta is None:
+                if n_columns is None:
+                    # Can't know the predictions structure from empty predictions only
+                    return
+                os.makedirs(self._directory, exist_ok=True)
+                self._meta = {'dtype': str(samples[0].dtype), 'n_columns': n_columns, 'stacked': stacked,
+                              'sample_shape': sample_shape}
+                with open(self._meta_path, 'w', encoding='utf8') as f:
+                    json.dump(self._meta, f)
+            n_columns = self._meta['n_columns']
+            samples = [s.reshape(0, n_columns) if s.size == 0 else s for s in samples]
+            if stacked != self._meta['stacked'] or any(s.shape[1] != n_columns for s in samples):
+                logger.warning('Predictions structure is different from the cached predictions, not caching them')
+                return
+
+            row_size = self._row_size()
+            n_rows = os.path.getsize(self._values_path) // row_size if os.path.exists(self._values_path) else 0
+            index = []
+            start = n_rows
+            for dataset_index, sample in zip(indices, samples):
+                index.append((dataset_index, start, len(sample)))
+                start += len(sample)
+            # Values are written before the index, so an index entry always points to written rows
+            with open(self._values_path, 'ab') as f:
+                # Drop a partially written row, if a previous run was interrupted in the middle of writing
+                f.truncate(n_rows * row_size)
+                for sample in samples:
+                    f.write(np.ascontiguousarray(sample, dtype=self._meta['dtype']).tobytes())
+            with open(self._index_path, 'ab') as f:
+                f.write(np.array(index, dtype=np.int64).tobytes())
+            for dataset_index, row_start, length in index:
+                self._rows[dataset_index] = (row_start, length)
+
+
+class InferenceCache:
+    """Cache of model predictions stored on disk, so subsequent runs replay predictions without running the model.
+
+    Predictions are stored per sample, keyed by the fingerprint of the model and of the data, and the index of the
+    sample in the dataset. Therefore, they are reused across different samplings and orders of the same data.
+
+    The data fingerprint is calculated from a sample of the dataset samples (see `data_fingerprint`), so the cache
+    doesn't detect changes to the other samples, such as re-labelled or replaced images. Use a new directory when
+    the data changes.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to keep the cached predictions in. Created if doesn't exist.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._stores = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def _get_store(self, vision_data: VisionData, model) -> _PredictionsStore:
+        with self._lock:
+            # Fingerprints are calculated once per object, as the model and data are not changed during a run
+            for obj, fingerprint_func in ((model, model_fingerprint), (vision_data, data_fingerprint)):
+                if id(obj) not in self._fingerprints:
+                    self._fingerprints[id(obj)] = (obj, fingerprint_func(obj))
+            key = (self._fingerprints[id(model)][1], self._fingerprints[id(vision_data)][1])
+            if key not in self._stores:
+                self._stores[key] = _PredictionsStore(os.path.join(self.directory, *key))
+            return self._stores[key]
+
+    def infer_on_batch(self, vision_data: VisionData, batch, indices: t.Sequence[int], model,
+                       device: torch.device) -> t.Union[torch.Tensor, t.List[torch.Tensor]]:
+        """Return the predictions on the batch from the cache, or infer and cache them if not all are cached.
+
+        Parameters
+        ----------
+        vision_data : VisionData
+            The vision data the batch is from, used to infer on the batch.
+        batch
+            The batch of data.
+        indices : Sequence[int]
+            The indices in the dataset of the samples in the batch.
+        model
+            The model to use for inference.
+        device : torch.device
+            The device to use for inference, and to put the cached predictions on.
+        """
+        store = self._get_store(vision_data, model)
+        if store.contains(indices):
+            predictions = store.get(indices)
+            if isinstance(predictions, torch.Tensor):
+                return predictions.to(device)
+            return [p.to(device) for p in predictions]
+
+        predictions = vision_data.infer_on_batch(batch, model, device)
+        store.add(indices, predictions)
+        return predictions
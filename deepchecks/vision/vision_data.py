@@ -11,10 +11,11 @@
 """The vision/dataset module containing the vision Dataset class and its functions."""
 # pylint: disable=protected-access
 import random
-from collections import defaultdict
+from collections.abc import Mapping
 from copy import copy
 from abc import abstractmethod
 from enum import Enum
+from itertools import chain
 from typing import Any, List, Optional, Dict, TypeVar, Union, Iterator, Sequence
 
 import logging
@@ -30,7 +31,7 @@ from deepchecks.vision.utils.transformations import add_augmentation_in_start, g
 logger = logging.getLogger('deepchecks')
 VD = TypeVar('VD', bound='VisionData')
 
-__all__ = ['TaskType', 'VisionData']
+__all__ = ['TaskType', 'VisionData', 'ClassesIndex']
 
 
 class TaskType(Enum):
@@ -158,21 +159,22 @@ class VisionData:
     def update_cache(self, labels):
         """Get labels and update the classes' metadata info."""
         classes_per_label = self.get_classes(labels)
-        for batch_index, classes in enumerate(classes_per_label):
-            for single_class in classes:
-                real_index_in_dataset = self._sampler.index_at(self._current_index + batch_index)
-                self._classes_indices[single_class].append(real_index_in_dataset)
-        self._current_index += len(classes_per_label)
+        n_samples = len(classes_per_label)
+        batch_indices = self._sampler.indices[self._current_index:self._current_index + n_samples]
+        lengths = [len(classes) for classes in classes_per_label]
+        self._classes_indices.add(np.array(list(chain.from_iterable(classes_per_label))),
+                                  np.repeat(np.asarray(batch_indices, dtype=np.int64), lengths))
+        self._current_index += n_samples
 
     def init_cache(self):
         """Initialize the cache of the classes' metadata info."""
-        self._classes_indices = defaultdict(list)
+        self._classes_indices = ClassesIndex()
         self._current_index = 0
 
     @property
-    def classes_indices(self) -> Dict[int, List[int]]:
-        """Return dict of classes as keys, and list of corresponding indices (in Dataset) of samples that include this\
-        class (in the label)."""
+    def classes_indices(self) -> 'ClassesIndex':
+        """Return mapping of classes as keys, and array of corresponding indices (in Dataset) of samples that include\
+        this class (in the label)."""
         if self._classes_indices is None or self._current_index < len(self._sampler):
             raise DeepchecksValueError('Cached data is not computed on all the data yet.')
         return self._classes_indices
@@ -180,7 +182,7 @@ class VisionData:
     @property
     def n_of_samples_per_class(self) -> Dict[Any, int]:
         """Return a dictionary containing the number of samples per class."""
-        return {k: len(v) for k, v in self.classes_indices.items()}
+        return self.classes_indices.counts()
 
     @property
     def data_loader(self) -> DataLoader:
@@ -278,17 +280,23 @@ class VisionData:
         )
         new_vision_data._data_loader = copied_data_loader
         new_vision_data._sampler = copied_sampler
-        # If new data is sampled, then needs to re-calculate cache
+        # If new data is sampled, then the cache is derived from the cache of the full data, without iterating the data
         if n_samples and self._classes_indices is not None:
-            new_vision_data.init_cache()
-            for batch in new_vision_data:
-                new_vision_data.update_cache(self.batch_to_labels(batch))
+            if self._current_index < len(self._sampler):
+                raise DeepchecksValueError('Cached data is not computed on all the data yet.')
+            new_vision_data._classes_indices = self._classes_indices.subset(copied_sampler.indices)
+            new_vision_data._current_index = len(copied_sampler)
         return new_vision_data
 
     def to_batch(self, *samples):
         """Use the defined collate_fn to transform a few data items to batch format."""
         return self._data_loader.collate_fn(list(samples))
 
+    def indices_of_batch(self, batch_index: int) -> List[int]:
+        """Return the indices in the dataset of the samples in the batch at the given position of the data loader."""
+        batch_size = self._data_loader.batch_sampler.batch_size
+        return self._sampler.indices[batch_index * batch_size:(batch_index + 1) * batch_size]
+
     def batch_of_index(self, *indices):
         """Return batch samples of the given batch indices."""
         samples = []
@@ -441,6 +449,100 @@ class VisionData:
         return data_loader.__class__(**props), sampler
 
 
+class ClassesIndex(Mapping):
+    """Mapping of classes to the indices (in Dataset) of the samples that include them, stored as compact arrays.
+
+    The indices of all classes are kept in a single array grouped by class, with the offset of every class group
+    (as in CSR sparse matrices). Classes are ordered by their first appearance, and the indices of each class by the
+    order of the samples. A subset of the index for other samples of the data is derived without iterating the data,
+    and is computed only when accessed.
+    """
+
+    def __init__(self):
+        self._pending_classes = []
+        self._pending_indices = []
+        self._pending_subset = None
+        self._classes = np.empty(0)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        # Order in which every entry of the indices array was added, used to keep the order of subsets
+        self._sequence = np.empty(0, dtype=np.int32)
+
+    def add(self, classes: np.ndarray, indices: np.ndarray):
+        """Add classes appearances in samples, given as arrays of the classes and of the samples indices."""
+        if len(classes) > 0:
+            self._pending_classes.append(classes)
+            self._pending_indices.append(indices)
+
+    def subset(self, indices: Sequence[int]) -> 'ClassesIndex':
+        """Return index of only the given samples indices, ordered by their order in the given indices."""
+        subset_index = ClassesIndex()
+        subset_index._pending_subset = (self, indices)
+        return subset_index
+
+    def _compact(self):
+        if self._pending_subset is not None:
+            source, indices = self._pending_subset
+            self._pending_subset = None
+            source._compact()
+            classes = np.repeat(source._classes, np.diff(source._offsets))
+            sample_indices = source._indices
+            indices = np.asarray(indices, dtype=np.int64)
+            # Position of every sample index in the subset, or -1 if it's not in it
+            positions = np.full(max(indices.max(initial=-1), sample_indices.max(initial=-1)) + 1, -1, dtype=np.int64)
+            positions[indices] = np.arange(len(indices))
+            entry_positions = positions[sample_indices]
+            # Entries of the same sample are kept in the order they were added
+            order = np.lexsort((source._sequence, entry_positions))
+            order = order[entry_positions[order] >= 0]
+            self._pending_classes.append(classes[order])
+            self._pending_indices.append(sample_indices[order])
+
+        if not self._pending_classes:
+            return
+        n_entries = len(self._indices)
+        # Existing entries are grouped by class, in the order of the first appearance of the classes, so the
+        # grouping of the concatenated entries keeps both the order of the classes and the order of the entries
+        classes = np.concatenate([c for c in [np.repeat(self._classes, np.diff(self._offsets))] + self._pending_classes
+                                  if len(c) > 0])  # Empty arrays are not concatenated, so the classes type is kept
+        indices = np.concatenate([self._indices] + self._pending_indices)
+        sequence = np.concatenate([self._sequence, np.arange(n_entries, len(indices))])
+        self._pending_classes, self._pending_indices = [], []
+
+        unique_classes, first_appearance, inverse = np.unique(classes, return_index=True, return_inverse=True)
+        classes_order = np.argsort(first_appearance)
+        group_of_entry = np.argsort(classes_order)[inverse]
+        entries_order = np.argsort(group_of_entry, kind='stable')
+        index_dtype = np.int32 if max(indices.max(initial=0), len(indices)) <= np.iinfo(np.int32).max else np.int64
+        self._classes = unique_classes[classes_order]
+        self._indices = indices[entries_order].astype(index_dtype)
+        self._sequence = sequence[entries_order].astype(index_dtype)
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(group_of_entry, minlength=len(self._classes)))])
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Return array of the indices of the samples that include the class."""
+        self._compact()
+        location = np.flatnonzero(self._classes == key)
+        if len(location) == 0:
+            raise KeyError(key)
+        return self._indices[self._offsets[location[0]]:self._offsets[location[0] + 1]]
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the classes."""
+        self._compact()
+        return iter(self._classes.tolist())
+
+    def __len__(self) -> int:
+        """Return number of classes."""
+        self._compact()
+        return len(self._classes)
+
+    def counts(self) -> Dict[Any, int]:
+        """Return a dictionary of the number of appearances of every class."""
+        self._compact()
+        return dict(zip(self._classes.tolist(), np.diff(self._offsets).tolist()))
+
+
 class IndicesSequentialSampler(Sampler[int]):
     """Samples elements sequentially from a given list of indices, without replacement.
 
@@ -10,6 +10,8 @@
 #
 """suites tests"""
 import random
+import threading
+import time
 from hamcrest import assert_that, calling, raises, equal_to, is_
 
 from deepchecks.core import CheckResult
@@ -29,6 +31,25 @@ class SimpleTwoDatasetsCheck(TrainTestCheck):
         return CheckResult("Simple Check")
 
 
+class ConcurrencyCountingCheck(SingleDatasetCheck):
+    """Check recording the largest number of its invocations which ran at the same time."""
+
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def run_logic(self, context, dataset_type: str = 'train') -> CheckResult:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.2)
+        with self.lock:
+            self.running -= 1
+        return CheckResult(dataset_type)
+
+
 def test_suite_instantiation_with_incorrect_args():
     incorrect_check_suite_args = ("test suite", SimpleDatasetCheck(), object())
     assert_that(
@@ -147,3 +168,71 @@ def test_check_suite_instantiation_by_extending_another_check_suite():
         tabular_checks.MixedDataTypes,
         tabular_checks.PerformanceReport
     ]
+
+
+def test_run_suite_in_parallel_preserves_results_order(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    suite = Suite(
+        "parallel suite",
+        tabular_checks.IsSingleValue(),
+        tabular_checks.MixedNulls(),
+        tabular_checks.TrainTestFeatureDrift(),
+        tabular_checks.PerformanceReport()
+    )
+
+    sequential_result = suite.run(train, test, model)
+
+    for backend in ('thread', 'process'):
+        parallel_result = suite.run(train, test, model, n_jobs=2, backend=backend)
+        assert_that([r.get_header() for r in parallel_result.results],
+                    equal_to([r.get_header() for r in sequential_result.results]))
+        assert_that([type(r) for r in parallel_result.results],
+                    equal_to([type(r) for r in sequential_result.results]))
+        for parallel_check_result, check in zip(parallel_result.results, [0, 0, 1, 1, 2, 3]):
+            assert_that(parallel_check_result.check, is_(suite[check]))
+
+
+def test_run_suite_in_threads_runs_invocations_of_check_sequentially(iris_split_dataset_and_model):
+    # Arrange
+    train, test, model = iris_split_dataset_and_model
+    check = ConcurrencyCountingCheck()
+    suite = Suite("parallel suite", check, SimpleDatasetCheck())
+
+    # Act
+    result = suite.run(train, test, model, n_jobs=4, backend='thread')
+
+    # Assert
+    assert_that(check.max_running, equal_to(1))
+    assert_that([r.value for r in result.results[:2]], equal_to(['train', 'test']))
+
+
+def test_run_suite_in_process_pool_processes_conditions(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    suite = Suite(
+        "conditions suite",
+        tabular_checks.IsSingleValue().add_condition_not_single_value(),
+        tabular_checks.TrainTestFeatureDrift().add_condition_drift_score_not_greater_than()
+    )
+
+    sequential_result = suite.run(train, test, model)
+    parallel_result = suite.run(train, test, model, n_jobs=2, backend='process')
+
+    assert_that([type(r) for r in parallel_result.results], equal_to([CheckResult] * 3))
+    assert_that([[c.is_pass for c in r.conditions_results] for r in parallel_result.results],
+                equal_to([[c.is_pass for c in r.conditions_results] for r in sequential_result.results]))
+    assert_that([len(r.conditions_results) for r in parallel_result.results], equal_to([1, 1, 1]))
+    assert_that(len(suite[0].conditions_decision(parallel_result.results[0])), equal_to(1))
+
+
+def test_run_suite_with_incorrect_parallel_args(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    suite = Suite("test suite", SimpleDatasetCheck(), SimpleTwoDatasetsCheck())
+
+    assert_that(
+        calling(suite.run).with_args(train, test, model, n_jobs=0),
+        raises(DeepchecksValueError, 'n_jobs must be a non-zero integer, but got: 0')
+    )
+    assert_that(
+        calling(suite.run).with_args(train, test, model, n_jobs=2, backend='gpu'),
+        raises(DeepchecksValueError, r"backend must be one of \['thread', 'process'\], but got: gpu")
+    )
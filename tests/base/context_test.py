@@ -0,0 +1,89 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Tests for the tabular Context."""
+from collections import Counter
+from unittest.mock import patch
+
+import numpy as np
+from hamcrest import assert_that, equal_to, instance_of
+from sklearn.ensemble import AdaBoostClassifier
+
+from deepchecks.core import CheckResult
+from deepchecks.tabular import Context, Suite
+from deepchecks.tabular import checks as tabular_checks
+
+
+class CountingAdaBoost(AdaBoostClassifier):
+    """AdaBoost counting the number of rows predicted by each method."""
+
+    calls = Counter()
+
+    def predict(self, X):
+        CountingAdaBoost.calls['predict'] += len(X)
+        return super().predict(X)
+
+    def predict_proba(self, X):
+        CountingAdaBoost.calls['predict_proba'] += len(X)
+        return super().predict_proba(X)
+
+
+def test_cached_model_predictions_equal_model_predictions(iris_split_dataset_and_model):
+    train, test, model = iris_split_dataset_and_model
+    context = Context(train, test, model)
+    cached_model = context.get_cached_model('test')
+
+    subset = test.features_columns.sample(10, random_state=0)
+    assert_that(np.array_equal(cached_model.predict(test.features_columns), model.predict(test.features_columns)))
+    assert_that(np.array_equal(cached_model.predict(subset), model.predict(subset)))
+    assert_that(np.allclose(cached_model.predict_proba(subset), model.predict_proba(subset)))
+    # Data which isn't from the dataset is predicted by the model
+    assert_that(np.array_equal(cached_model.predict(subset.values), model.predict(subset.values)))
+    # Modified features of rows of the dataset are predicted by the model
+    modified = test.features_columns + 2
+    assert_that(np.allclose(cached_model.predict_proba(modified), model.predict_proba(modified)))
+    assert_that(np.allclose(cached_model.predict_proba(modified.iloc[:10]), model.predict_proba(modified.iloc[:10])))
+    assert_that(cached_model.classes_, instance_of(np.ndarray))
+
+
+def test_suite_predicts_each_dataset_once(iris_split_dataset_and_model):
+    train, test, _ = iris_split_dataset_and_model
+    model = CountingAdaBoost(random_state=0)
+    model.fit(train.features_columns, train.label_col)
+    suite = Suite(
+        'predictions suite',
+        tabular_checks.ConfusionMatrixReport(),
+        tabular_checks.RocReport(),
+        tabular_checks.CalibrationScore(),
+        tabular_checks.PerformanceReport()
+    )
+
+    CountingAdaBoost.calls.clear()
+    result = suite.run(train, test, model)
+
+    for check_result in result.results:
+        assert_that(check_result, instance_of(CheckResult))
+    # Apart from the small samples used to validate the model and the scorers, every dataset is predicted once
+    n_rows = train.n_samples + test.n_samples
+    assert_that(CountingAdaBoost.calls['predict'] < n_rows + 20, equal_to(True))
+    assert_that(CountingAdaBoost.calls['predict_proba'] < n_rows + 20, equal_to(True))
+
+
+def test_features_importance_read_from_persistent_cache(iris_split_dataset_and_model, tmp_path):
+    train, test, model = iris_split_dataset_and_model
+    importance = Context(train, test, model, feature_importance_force_permutation=True,
+                         feature_importance_cache=str(tmp_path)).features_importance
+
+    # Rebuild the datasets, as in a new run on the same data
+    train, test = train.copy(train.data.copy()), test.copy(test.data.copy())
+    with patch('deepchecks.utils.features._calc_permutation_importance', side_effect=AssertionError):
+        cached_context = Context(train, test, model, feature_importance_force_permutation=True,
+                                 feature_importance_cache=str(tmp_path))
+        assert_that(cached_context.features_importance.to_dict(), equal_to(importance.to_dict()))
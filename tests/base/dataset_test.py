@@ -1045,4 +1045,74 @@ def random_classification_dataframe(n_samples=100, n_features=5) -> pd.DataFrame
     x, y, *_ = make_classification(n_samples=n_samples, n_features=n_features)
     df = pd.DataFrame(x,columns=[f'X{i}'for i in range(n_features)])
     df['target'] = y
-    return df
\ No newline at end of file
+    return df
+
+def test_sample_and_select_are_equal_to_copies_of_the_sampled_data(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target', cat_features=[])
+    # Act
+    sample = dataset.sample(30, random_state=0)
+    selected = sample.select(ignore_columns=['petal length (cm)'])
+    # Assert
+    expected_sample = iris.sample(30, random_state=0)
+    assert_that(sample.data.equals(expected_sample), is_(True))
+    assert_that(sample.label_col.equals(expected_sample['target']), is_(True))
+    assert_that(selected.n_samples, equal_to(30))
+    assert_that(selected.features, equal_to(['sepal length (cm)', 'sepal width (cm)', 'petal width (cm)']))
+    assert_that(selected.features_columns.equals(expected_sample[selected.features]), is_(True))
+    assert_that(selected.data.equals(expected_sample.drop(columns=['petal length (cm)'])), is_(True))
+
+
+def test_derived_datasets_share_data_until_accessed(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    # Act
+    sample = dataset.sample(30, random_state=0)
+    selected = dataset.select(columns=['sepal length (cm)'], keep_label=True)
+    # Assert - the views take the label and columns from the data of the dataset, without taking the whole data
+    assert_that(sample._data, is_(None))
+    assert_that(sample.label_col.equals(dataset.data['target'].iloc[sample.label_col.index]), is_(True))
+    assert_that(sample._data, is_(None))
+    assert_that(selected._data, is_(None))
+    assert_that(selected.label_name, equal_to('target'))
+    assert_that(selected.cat_features, equal_to([]))
+    assert_that(list(selected.data.columns), equal_to(['sepal length (cm)', 'target']))
+
+
+def test_select_rows(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    mask = (iris['target'] == 1).to_numpy()
+    # Act & Assert
+    assert_that(dataset.select_rows(mask).data.equals(iris[mask]), is_(True))
+    assert_that(dataset.select_rows([3, 1]).data.equals(iris.iloc[[3, 1]]), is_(True))
+    assert_that(dataset.select_rows(np.ones(len(iris), dtype=bool)), is_(dataset))
+    assert_that(calling(dataset.select_rows).with_args(mask[:10]),
+                raises(DeepchecksValueError, 'Boolean mask of rows must have length of 150, but got: 10'))
+
+
+def test_select_rows_with_nullable_boolean_mask():
+    # Arrange
+    df = pd.DataFrame({'a': pd.array([1, 5, None, 3, 4, 2], dtype='Int64'), 'b': range(6)})
+    dataset = Dataset(df, cat_features=[])
+    mask = df['a'].ge(3)
+    # Act & Assert
+    assert_that(dataset.select_rows(mask).data['b'].tolist(), equal_to([1, 3, 4]))
+    assert_that(dataset.select_rows(mask.values).data['b'].tolist(), equal_to([1, 3, 4]))
+    assert_that(calling(dataset.select_rows).with_args(np.array([0.5, 1.0])),
+                raises(DeepchecksValueError, 'Rows must be either boolean mask or integer positions, but got values '
+                                             'of type: float64'))
+
+
+def test_column_profile_is_memoized_per_dataset(iris):
+    # Arrange
+    dataset = Dataset(iris, label='target')
+    # Act
+    profile = dataset.column_profile('target')
+    sample = dataset.sample(10, random_state=0)
+    # Assert
+    assert_that(dataset.column_profile('target'), is_(profile))
+    assert_that(profile.n_unique, equal_to(3))
+    assert_that(sample.column_profile('target').n_samples, equal_to(10))
+    assert_that(calling(dataset.column_profile).with_args('not a column'),
+                raises(DeepchecksValueError, 'Column not a column not found in dataset columns'))
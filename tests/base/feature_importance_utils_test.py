@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Test feature importance utils"""
+import time
 import warnings
 
 import pandas as pd
@@ -16,6 +17,7 @@ import pytest
 from sklearn.ensemble import AdaBoostClassifier
 from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.neural_network import MLPClassifier
+from sklearn.metrics import accuracy_score
 from hamcrest import (
     equal_to, assert_that, calling, raises, is_,
     close_to, not_none, none, has_length, any_of, contains_exactly, has_item
@@ -23,6 +25,8 @@ from hamcrest import (
 
 from deepchecks.core.errors import ModelValidationError, DeepchecksValueError
 from deepchecks.tabular.dataset import Dataset
+from deepchecks.utils.metrics import DeepcheckScorer
+from deepchecks.utils.feature_importance_cache import DirectoryFeatureImportanceCache
 from deepchecks.utils.features import (
     calculate_feature_importance, calculate_feature_importance_or_none,
     column_importance_sorter_df, column_importance_sorter_dict
@@ -211,3 +215,77 @@ def test_permutation_importance_with_nan_labels(iris_split_dataset_and_model):
     # Assert
     assert_that(feature_importances.sum(), close_to(1, 0.0001))
     assert_that(fi_type, is_('permutation_importance'))
+
+
+def test_adaptive_permutation_importance(iris_split_dataset_and_model):
+    train_ds, _, adaboost = iris_split_dataset_and_model
+    feature_importances, fi_type = calculate_feature_importance(adaboost, train_ds, force_permutation=True,
+                                                                permutation_kwargs={'timeout': 120, 'adaptive': True})
+    full_feature_importances, _ = calculate_feature_importance(adaboost, train_ds, force_permutation=True,
+                                                               permutation_kwargs={'timeout': 120})
+
+    assert_that(fi_type, is_('permutation_importance'))
+    assert_that(feature_importances.sum(), close_to(1, 0.000001))
+    assert_that(feature_importances.idxmax(), equal_to(full_feature_importances.idxmax()))
+
+
+def test_adaptive_permutation_importance_returns_partial_result_on_timeout(iris_split_dataset_and_model):
+    train_ds, _, adaboost = iris_split_dataset_and_model
+    scorer = DeepcheckScorer('accuracy', 'Accuracy')
+    original_scorer = scorer.scorer
+    scored_columns = []
+
+    def slow_scorer(model, features, label):
+        # Each score takes a second, so only the first feature is permuted before the timeout
+        scored_columns.append(features.columns)
+        time.sleep(1)
+        return original_scorer(model, features, label)
+
+    scorer.scorer = slow_scorer
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        feature_importances, _ = calculate_feature_importance(
+            adaboost, train_ds, force_permutation=True,
+            permutation_kwargs={'timeout': 1.5, 'adaptive': True, 'alternative_scorer': scorer, 'n_jobs': 1}
+        )
+        assert_that(str(w[-1].message), equal_to('Permutation importance calculation stopped after 1.5 seconds, '
+                                                 'the importance is based on 0 to 1 permutations per feature. The '
+                                                 'importance of features which were not permuted is NaN: '
+                                                 f'{train_ds.features[1:]}'))
+
+    assert_that(feature_importances, has_length(len(train_ds.features)))
+    assert_that(feature_importances[train_ds.features[0]], equal_to(1))
+    assert_that(feature_importances[train_ds.features[1:]].isna().all(), equal_to(True))
+
+
+def _slow_accuracy(model, features, label):
+    time.sleep(1)
+    return accuracy_score(label, model.predict(features))
+
+
+def test_partial_importance_on_timeout_is_not_cached(iris_split_dataset_and_model, tmp_path):
+    train_ds, _, adaboost = iris_split_dataset_and_model
+    cache = DirectoryFeatureImportanceCache(str(tmp_path))
+    permutation_kwargs = {'timeout': 1.5, 'adaptive': True,
+                          'alternative_scorer': DeepcheckScorer(_slow_accuracy, 'Accuracy')}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        calculate_feature_importance(adaboost, train_ds, force_permutation=True,
+                                     permutation_kwargs=permutation_kwargs, cache=cache)
+
+    assert_that(list(tmp_path.iterdir()), has_length(0))
+
+
+def test_calculate_importance_cache_is_keyed_by_content(iris_split_dataset_and_model, tmp_path):
+    train_ds, _, adaboost = iris_split_dataset_and_model
+    cache = DirectoryFeatureImportanceCache(str(tmp_path))
+    calculate_feature_importance(adaboost, train_ds, cache=cache)
+    calculate_feature_importance(adaboost, train_ds.copy(train_ds.data.copy()), cache=cache)
+    assert_that(list(tmp_path.iterdir()), has_length(1))
+
+    changed_data = train_ds.data.copy()
+    changed_data.iloc[0, 0] += 1
+    calculate_feature_importance(adaboost, train_ds.copy(changed_data), cache=cache)
+    calculate_feature_importance(adaboost, train_ds, cache=cache, permutation_kwargs={'n_repeats': 5})
+    assert_that(list(tmp_path.iterdir()), has_length(3))
@@ -12,6 +12,7 @@
 from hamcrest import assert_that, has_entries, close_to, equal_to
 
 from deepchecks.tabular.checks import TrainTestFeatureDrift
+from deepchecks.tabular.dataset_sketch import DatasetSketch
 from tests.checks.utils import equal_condition_result
 
 
@@ -114,3 +115,41 @@ def test_drift_max_drift_score_condition_pass_threshold(drifted_data_and_model):
         is_pass=True,
         name='PSI <= 1 and Earth Mover\'s Distance <= 1'
     ))
+
+
+def test_drift_with_sketches(drifted_data, tmp_path):
+    # Arrange
+    train, test = drifted_data
+    chunks = [train.data.iloc[i:i + 300] for i in range(0, train.n_samples, 300)]
+    train_sketch = DatasetSketch.from_chunks(chunks, label='target', cat_features=train.cat_features)
+    path = str(tmp_path / 'train.sketch')
+    train_sketch.save(path)
+    check = TrainTestFeatureDrift()
+
+    # Act
+    result = check.run(DatasetSketch.load(path), test)
+
+    # Assert
+    assert_that(train_sketch.n_samples, equal_to(train.n_samples))
+    assert_that(result.value, has_entries({
+        'numeric_without_drift': has_entries(
+            {'Drift score': close_to(0.01, 0.01),
+             'Method': equal_to('Earth Mover\'s Distance'),
+             'Importance': equal_to(None)}
+        ),
+        'numeric_with_drift': has_entries(
+            {'Drift score': close_to(0.25, 0.01),
+             'Method': equal_to('Earth Mover\'s Distance'),
+             'Importance': equal_to(None)}
+        ),
+        'categorical_without_drift': has_entries(
+            {'Drift score': close_to(0, 0.01),
+             'Method': equal_to('PSI'),
+             'Importance': equal_to(None)}
+        ),
+        'categorical_with_drift': has_entries(
+            {'Drift score': close_to(0.22, 0.01),
+             'Method': equal_to('PSI'),
+             'Importance': equal_to(None)}
+        ),
+    }))
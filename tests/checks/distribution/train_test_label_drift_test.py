@@ -12,6 +12,7 @@
 from hamcrest import assert_that, has_entries, close_to, equal_to
 
 from deepchecks.tabular.checks import TrainTestLabelDrift
+from deepchecks.tabular.dataset_sketch import DatasetSketch
 from tests.checks.utils import equal_condition_result
 
 
@@ -109,3 +110,22 @@ def test_drift_max_drift_score_condition_pass_threshold(non_drifted_classificati
         is_pass=True,
         name='PSI <= 1 and Earth Mover\'s Distance <= 1 for label drift'
     ))
+
+
+def test_drift_regression_label_with_merged_sketches(drifted_regression_label):
+    # Arrange
+    train, test = drifted_regression_label
+    half = train.n_samples // 2
+    first_sketch = DatasetSketch.from_dataset(train.copy(train.data.iloc[:half]))
+    second_sketch = first_sketch.like(train.data.iloc[half:])
+    check = TrainTestLabelDrift()
+
+    # Act
+    result = check.run(test.copy(test.data), first_sketch.merge(second_sketch))
+    expected = check.run(test, train)
+
+    # Assert
+    assert_that(result.value, has_entries(
+            {'Drift score': close_to(expected.value['Drift score'], 0.005),
+             'Method': equal_to('Earth Mover\'s Distance')}
+    ))
@@ -9,13 +9,15 @@
 # ----------------------------------------------------------------------------
 #
 """Test functions of trust score comparison."""
-from hamcrest import assert_that, has_entries, close_to, calling, raises
+import numpy as np
+from hamcrest import assert_that, has_entries, close_to, calling, raises, equal_to
 from sklearn.ensemble import AdaBoostClassifier
 
 from deepchecks.core import CheckResult, ConditionCategory
-from deepchecks.core.errors import ModelValidationError, DatasetValidationError
+from deepchecks.core.errors import ModelValidationError, DatasetValidationError, DeepchecksValueError
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.tabular.checks import TrustScoreComparison
+from deepchecks.utils.distribution.trust_score import TrustScore
 
 from tests.checks.utils import equal_condition_result
 
@@ -139,3 +141,61 @@ def test_regression_model_fail(diabetes_split_dataset_and_model):
             r'but received model of type \'regression\''
         )
     )
+
+
+def test_trust_score_comparison_ball_tree_with_threads(iris_split_dataset_and_model):
+    # Arrange
+    train, test, model = iris_split_dataset_and_model
+    check = TrustScoreComparison(min_test_samples=50, algorithm='ball_tree', n_jobs=2)
+
+    # Act
+    result = check.run(train, test, model)
+
+    # Assert - same as the serial kd tree scores
+    assert_that(result.value, has_entries({
+        'train': close_to(5.78, 0.01),
+        'test': close_to(4.49, 0.01)
+    }))
+
+
+def test_trust_score_chunked_parallel_query_equals_serial():
+    # Arrange
+    rng = np.random.RandomState(0)
+    x_train, y_train = rng.rand(500, 4), rng.randint(0, 3, 500)
+    x_test, y_test = rng.rand(300, 4), rng.randint(0, 3, 300)
+    serial = TrustScore(k_filter=5, alpha=0.01)
+    chunked = TrustScore(k_filter=5, alpha=0.01, n_jobs=3, chunk_size=7)
+
+    # Act
+    serial.fit(x_train, y_train)
+    chunked.fit(x_train, y_train)
+    serial_scores, serial_closest = serial.score(x_test, y_test)
+    chunked_scores, chunked_closest = chunked.score(x_test, y_test)
+
+    # Assert
+    np.testing.assert_array_equal(chunked_scores, serial_scores)
+    np.testing.assert_array_equal(chunked_closest, serial_closest)
+
+
+def test_trust_score_with_random_projection():
+    # Arrange
+    rng = np.random.RandomState(0)
+    y_train = rng.randint(0, 2, 400)
+    x_train = rng.rand(400, 50) + y_train.reshape(-1, 1)
+    trust_score = TrustScore(n_projection_components=10)
+
+    # Act
+    trust_score.fit(x_train, y_train)
+    correct_scores = trust_score.score(x_train, y_train)[0]
+    wrong_scores = trust_score.score(x_train, 1 - y_train)[0]
+
+    # Assert - predictions of the class the samples belong to are more trusted
+    assert_that(trust_score.kdtrees[0].data.shape[1], equal_to(10))
+    assert_that(np.all(correct_scores > wrong_scores), equal_to(True))
+
+
+def test_trust_score_invalid_algorithm():
+    assert_that(
+        calling(TrustScore).with_args(algorithm='brute'),
+        raises(DeepchecksValueError, r'algorithm must be one of \["kd_tree", "ball_tree"\], but got: brute')
+    )
@@ -9,10 +9,12 @@
 # ----------------------------------------------------------------------------
 #
 """Test functions of the whole dataset drift check."""
-from hamcrest import assert_that, has_entries, close_to
+from hamcrest import assert_that, has_entries, close_to, calling, raises
 
+from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.tabular.checks import WholeDatasetDrift
+from deepchecks.core.check_utils.whole_dataset_drift_utils import generate_model
 from tests.checks.utils import equal_condition_result
 
 
@@ -98,3 +100,43 @@ def test_max_drift_score_condition_fail(drifted_data):
         name='Drift value is not greater than 0.25',
         details='Found drift value of: 0.86, corresponding to a domain classifier AUC of: 0.93'
     ))
+
+
+def test_drift_with_fast_feature_importance_methods(drifted_data):
+    # Arrange
+    train_ds, test_ds = drifted_data
+
+    for method in ['split_gain', 'drop_column']:
+        check = WholeDatasetDrift(feature_importance_method=method, early_stopping=True)
+
+        # Act
+        result = check.run(train_ds, test_ds)
+
+        # Assert
+        assert_that(result.value, has_entries({
+            'domain_classifier_auc': close_to(0.93, 0.01),
+            'domain_classifier_drift_score': close_to(0.86, 0.02),
+            'domain_classifier_feature_importance': has_entries(
+                {'categorical_without_drift': close_to(0, 0.02),
+                 'numeric_without_drift': close_to(0, 0.02),
+                 'categorical_with_drift': close_to(0, 0.02),
+                 'numeric_with_drift': close_to(1, 0.02)
+                 }
+            ),
+        }))
+
+
+def test_unknown_feature_importance_method():
+    # Act & Assert
+    assert_that(calling(WholeDatasetDrift).with_args(feature_importance_method='shap'),
+                raises(DeepchecksValueError, 'feature_importance_method must be one of'))
+
+
+def test_domain_classifier_keeps_default_early_stopping():
+    # Act
+    default_model = generate_model(['a'], ['b']).named_steps['model']
+    early_stopping_model = generate_model(['a'], ['b'], early_stopping=True).named_steps['model']
+
+    # Assert
+    assert_that(default_model.get_params(), has_entries({'early_stopping': 'auto', 'n_iter_no_change': 10}))
+    assert_that(early_stopping_model.get_params(), has_entries({'early_stopping': True, 'n_iter_no_change': 2}))
@@ -16,6 +16,7 @@ from hamcrest import assert_that, close_to, equal_to, calling, raises, has_items
 from deepchecks.core import ConditionCategory
 from deepchecks.core.errors import DatasetValidationError
 from deepchecks.tabular.checks.integrity.data_duplicates import DataDuplicates
+from deepchecks.utils import dataframes
 
 from tests.checks.utils import equal_condition_result
 
@@ -139,3 +140,23 @@ def test_condition():
     assert_that(result, has_items(
         equal_condition_result(is_pass=True,
                                name='Duplicate data ratio is not greater than 0%')))
+
+
+def test_data_duplicates_display_instances():
+    duplicate_data = pd.DataFrame({'col1': [1.0, 2, -0.0, 2, np.nan, 0.0, np.nan],
+                                   'col2': ['a', 'b', 'c', 'b', None, 'c', None]},
+                                  index=[10, 11, 12, 13, 14, 15, 16])
+    result = DataDuplicates().run(duplicate_data)
+
+    assert_that(result.value, close_to(3 / 7, 0.001))
+    most_duplicates = result.display[2]
+    assert_that(most_duplicates.index.to_list(), equal_to([('11, 13', 2), ('12, 15', 2), ('14, 16', 2)]))
+    assert_that(most_duplicates['col2'].to_list(), equal_to(['b', 'c', None]))
+
+
+def test_group_identical_rows_resolves_hash_collisions(monkeypatch):
+    df = pd.DataFrame({'col1': [1, 2, 1, 3, 2], 'col2': ['a', 'b', 'a', 'c', 'b']})
+    # Make all rows collide on the same hash
+    monkeypatch.setattr(dataframes, 'hash_rows', lambda df: np.zeros(len(df), dtype=np.uint64))
+
+    assert_that(dataframes.group_identical_rows(df).tolist(), equal_to([0, 1, 0, 2, 1]))
@@ -12,7 +12,7 @@
 import numpy as np
 import pandas as pd
 
-from hamcrest import assert_that, has_length, has_entry, has_items, calling, raises
+from hamcrest import assert_that, has_length, has_entry, has_items, calling, raises, equal_to
 
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.tabular.checks.integrity.mixed_nulls import MixedNulls
@@ -207,3 +207,19 @@ def test_fi_n_top(diabetes_split_dataset_and_model):
     result = check.run(train, clf)
     # Assert - Display dataframe have only 3
     assert_that(result.display[1], has_length(3))
+
+
+def test_mixed_nulls_shared_values_across_columns():
+    # Arrange
+    data = {'col1': ['Null', 'NULL', 'a', np.nan, None],
+            'col2': ['Null', 'b', 'N/A', 'c', None],
+            'col3': ['a', 'b', 'c', 'd', 'e']}
+    dataframe = pd.DataFrame(data=data)
+    # Act
+    result = MixedNulls().run(dataframe)
+    # Assert - None is not a default null value
+    assert_that(result.value, equal_to({
+        'col1': {'Null': {'count': 1, 'percent': 0.2}, 'NULL': {'count': 1, 'percent': 0.2},
+                 np.nan: {'count': 1, 'percent': 0.2}},
+        'col2': {'Null': {'count': 1, 'percent': 0.2}, 'N/A': {'count': 1, 'percent': 0.2}}
+    }))
@@ -11,7 +11,7 @@
 """Contains unit tests for the string_mismatch check."""
 import numpy as np
 import pandas as pd
-from hamcrest import assert_that, has_length, has_entries, has_entry, has_items
+from hamcrest import assert_that, has_length, has_entries, has_entry, has_items, equal_to
 
 from deepchecks.core import ConditionCategory
 from deepchecks.tabular.dataset import Dataset
@@ -200,3 +200,17 @@ def test_invalid_column():
     result = StringMismatch().run(df).value
     # Assert
     assert_that(result, has_length(0))
+
+
+def test_high_cardinality_column():
+    # Arrange - 20,000 base forms with 2 variants each, where the upper-case variant is twice as common
+    base_forms = [f'value{i}' for i in range(20000)]
+    data = pd.DataFrame({'col1': base_forms + [s.upper() for s in base_forms] * 2})
+    # Act
+    result = StringMismatch().run(data).value
+    # Assert
+    assert_that(result['col1'], has_length(20000))
+    assert_that(result['col1']['value17'], equal_to([
+        {'variant': 'VALUE17', 'count': 2, 'percent': 2 / 60000},
+        {'variant': 'value17', 'count': 1, 'percent': 1 / 60000}
+    ]))
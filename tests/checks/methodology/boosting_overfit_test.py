@@ -11,6 +11,8 @@
 """Boosting overfit tests."""
 from statistics import mean
 
+import numpy as np
+
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
@@ -18,7 +20,8 @@ from sklearn.preprocessing import StandardScaler
 from hamcrest import assert_that, close_to, has_length
 
 from deepchecks.tabular.dataset import Dataset
-from deepchecks.tabular.checks.methodology.boosting_overfit import BoostingOverfit
+from deepchecks.tabular.checks.methodology.boosting_overfit import (BoostingOverfit, PartialBoostingModel,
+                                                                     StagedBoostingPredictions)
 
 from tests.checks.utils import equal_condition_result
 
@@ -132,3 +135,22 @@ def test_condition_score_percentage_decline_not_greater_than_not_pass(diabetes,
         name='Test score over iterations doesn\'t decline by more than 1% from the best score',
         details='Found score decline above threshold: -3.64%'
     ))
+
+
+def test_staged_predictions_equal_partial_model(iris):
+    # Arrange
+    train_df, test_df = train_test_split(iris, test_size=0.33, random_state=0)
+    features = test_df.drop(columns='target')
+    pipe = Pipeline([('scaler', StandardScaler()), ('gb', GradientBoostingClassifier(random_state=0))])
+    pipe.fit(train_df.drop(columns='target'), train_df['target'])
+    steps = [1, 2, 5, 50, 100]
+
+    # Act
+    staged_predictions = StagedBoostingPredictions(pipe, steps)
+
+    # Assert
+    for step in steps:
+        partial_model = PartialBoostingModel(pipe, step)
+        staged_model = staged_predictions.partial_model(step)
+        assert_that(np.allclose(staged_model.predict_proba(features), partial_model.predict_proba(features)))
+        assert_that(np.array_equal(staged_model.predict(features), partial_model.predict(features)))
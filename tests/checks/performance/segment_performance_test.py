@@ -9,11 +9,20 @@
 # ----------------------------------------------------------------------------
 #
 """Tests for segment performance check."""
+import numpy as np
+import pandas as pd
 from hamcrest import assert_that, has_entries, close_to, has_property, equal_to, calling, raises
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.metrics import accuracy_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OrdinalEncoder
+from sklearn.tree import DecisionTreeClassifier
 
 from deepchecks.tabular.dataset import Dataset
 from deepchecks.core.errors import DeepchecksValueError, DeepchecksNotSupportedError
 from deepchecks.tabular.checks.performance.segment_performance import SegmentPerformance
+from deepchecks.utils.performance.partition import partition_column
 
 
 def test_dataset_wrong_input():
@@ -66,3 +75,44 @@ def test_segment_top_features(diabetes_split_dataset_and_model):
         'counts': has_property('shape', (10, 10))
     }))
     assert_that(result['counts'].sum(), equal_to(146))
+
+
+def test_segment_performance_equals_scores_of_filtered_cells():
+    # Arrange
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'numeric': rng.normal(size=600),
+        'category': rng.choice(['a', 'b', 'c', 'd', 'e'], size=600, p=[0.4, 0.3, 0.2, 0.07, 0.03]),
+        'other': rng.normal(size=600),
+    })
+    df['label'] = ((df['numeric'] + df['other'] + rng.normal(size=600)) > 0).astype(int)
+    df.loc[rng.choice(600, 60, replace=False), 'numeric'] = np.nan
+    # Non-unique index, on which the cached predictions can't be looked up and the model predicts every cell
+    df.index = np.arange(600) // 2
+    features = ['numeric', 'category', 'other']
+    model = Pipeline([
+        ('transform', ColumnTransformer([('numeric', SimpleImputer(), ['numeric', 'other']),
+                                         ('category', OrdinalEncoder(), ['category'])])),
+        ('tree', DecisionTreeClassifier(max_depth=3, random_state=0))
+    ]).fit(df[features], df['label'])
+    dataset = Dataset(df, label='label', cat_features=['category'])
+
+    # Act
+    result = SegmentPerformance(feature_1='numeric', feature_2='category', max_segments=4,
+                                alternative_scorer=('Accuracy', 'accuracy')).run(dataset, model).value
+
+    # Assert
+    numeric_filters = partition_column(dataset, 'numeric', max_segments=4)
+    category_filters = partition_column(dataset, 'category', max_segments=4)
+    expected_scores = np.full((len(numeric_filters), len(category_filters)), np.nan)
+    expected_counts = np.zeros((len(numeric_filters), len(category_filters)), dtype=int)
+    for i, numeric_filter in enumerate(numeric_filters):
+        for j, category_filter in enumerate(category_filters):
+            cell = category_filter.filter(numeric_filter.filter(df))
+            expected_counts[i, j] = len(cell)
+            if len(cell) > 0:
+                expected_scores[i, j] = accuracy_score(cell['label'], model.predict(cell[features]))
+
+    assert_that(result['counts'].tolist(), equal_to(expected_counts.tolist()))
+    assert_that(np.allclose(result['scores'], expected_scores, equal_nan=True), equal_to(True))
+    assert_that(result['counts'].sum(), equal_to(df['numeric'].notna().sum()))
@@ -0,0 +1,85 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test functions of the column profile."""
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, equal_to
+
+from deepchecks.utils.column_profile import ColumnProfile
+from deepchecks.utils.features import infer_categorical_features
+from deepchecks.utils.strings import is_string_column
+
+
+def test_profile_statistics_equal_pandas():
+    columns = [
+        pd.Series(['a', None, np.nan, 'a', 'b']),
+        pd.Series([1.0, np.nan, np.nan, 2.0]),
+        pd.Series(pd.Categorical(['x', 'y', 'x'], categories=['x', 'y', 'z'])),
+        pd.Series([1, 2, 3, 1])
+    ]
+    for column in columns:
+        profile = ColumnProfile(column)
+        assert_that(profile.value_counts.equals(column.value_counts(dropna=False)), equal_to(True))
+        assert_that(profile.n_unique, equal_to(column.nunique(dropna=True)))
+        assert_that(profile.n_unique_with_nulls, equal_to(column.nunique(dropna=False)))
+        assert_that(profile.n_nulls, equal_to(column.isna().sum()))
+        assert_that(profile.is_string, equal_to(is_string_column(column)))
+
+
+def test_profile_counts_values_once():
+    # Arrange
+    column = pd.Series(['a', 'b', 'a', None])
+    calls = []
+    original_value_counts = column.value_counts
+
+    def counting_value_counts(*args, **kwargs):
+        calls.append(1)
+        return original_value_counts(*args, **kwargs)
+
+    column.value_counts = counting_value_counts
+    profile = ColumnProfile(column)
+
+    # Act
+    _ = profile.n_unique, profile.n_unique_with_nulls, profile.n_nulls, profile.is_categorical(), profile.value_counts
+
+    # Assert
+    assert_that(len(calls), equal_to(1))
+
+
+def test_bounded_categorical_inference_equals_exact():
+    # Arrange
+    rng = np.random.RandomState(0)
+    n_samples = 50_000
+    df = pd.DataFrame({
+        'float': rng.rand(n_samples),
+        'float_cat': rng.randint(0, 3, n_samples).astype(float),
+        'int_cat': rng.randint(0, 10, n_samples),
+        'sorted_ids': np.arange(n_samples),
+        'late_categories': np.concatenate([np.zeros(n_samples - 100), np.arange(100)]).astype(int),
+        'strings_with_nulls': np.where(rng.rand(n_samples) < 0.1, None, rng.choice(['a', 'b', 'c'], n_samples)),
+        'few_samples_per_category': rng.randint(0, 25, n_samples) % (n_samples // 1000)
+    })
+    # Act
+    exact = infer_categorical_features(df)
+    bounded = infer_categorical_features(df, bounded=True, n_jobs=2)
+    # Assert
+    assert_that(bounded, equal_to(exact))
+    assert_that(exact, equal_to(['float_cat', 'int_cat', 'strings_with_nulls', 'few_samples_per_category']))
+
+
+def test_bounded_count_stops_at_limit():
+    # Arrange
+    profile = ColumnProfile(pd.Series(np.arange(1_000_000)))
+    # Act
+    n_unique = profile.n_unique_up_to(30, chunk_size=1000)
+    # Assert
+    assert_that(n_unique > 30, equal_to(True))
+    assert_that(n_unique <= 1000, equal_to(True))
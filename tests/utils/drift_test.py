@@ -0,0 +1,90 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+"""Test drift utils"""
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, close_to, equal_to
+from scipy.stats import wasserstein_distance
+
+from deepchecks.utils.distribution import drift
+from deepchecks.utils.distribution.drift import calc_drift_score, calc_drift_scores, earth_movers_distance
+
+
+def test_batched_drift_scores_equal_single_column_scores(monkeypatch):
+    # Arrange - batches of two columns
+    monkeypatch.setattr(drift, 'DRIFT_BATCH_SIZE', 1600)
+    rng = np.random.default_rng(42)
+    train = pd.DataFrame({
+        'normal': rng.normal(size=500),
+        'discrete': rng.integers(0, 5, 500),
+        'with_nulls': np.concatenate([rng.normal(size=400), [np.nan] * 100]),
+        'constant': np.ones(500),
+        'category': rng.choice(['a', 'b', 'c'], 500)
+    })
+    test = pd.DataFrame({
+        'normal': rng.normal(0.3, size=300),
+        'discrete': rng.integers(0, 7, 300),
+        'with_nulls': np.concatenate([[np.nan] * 50, rng.exponential(size=250)]),
+        'constant': np.ones(300),
+        'category': rng.choice(['a', 'b', 'c', 'd'], 300)
+    })
+    column_types = {column: 'numerical' for column in train.columns}
+    column_types['category'] = 'categorical'
+
+    # Act
+    scores = calc_drift_scores(train, test, column_types)
+
+    # Assert
+    assert_that(list(scores), equal_to(list(column_types)))
+    for column, column_type in column_types.items():
+        expected_score, expected_method = calc_drift_score(train[column], test[column], column_type)
+        assert_that(scores[column][0], close_to(expected_score, 1e-10))
+        assert_that(scores[column][1], equal_to(expected_method))
+
+
+def test_batched_drift_scores_of_nullable_columns_with_na():
+    # Arrange
+    train = pd.DataFrame({
+        'int': pd.array([1, 2, None, 4, 5, 2], dtype='Int64'),
+        'float': pd.array([0.5, None, 1.5, 2.5, None, 1.0], dtype='Float64')
+    })
+    test = pd.DataFrame({
+        'int': pd.array([3, None, 5, 6], dtype='Int64'),
+        'float': pd.array([None, 2.0, 3.5, 1.0], dtype='Float64')
+    })
+    column_types = {'int': 'numerical', 'float': 'numerical'}
+
+    # Act
+    scores = calc_drift_scores(train, test, column_types)
+
+    # Assert
+    for column in column_types:
+        expected_score, _ = calc_drift_score(train[column], test[column], 'numerical')
+        assert_that(scores[column][0], close_to(expected_score, 1e-10))
+
+
+def test_earth_movers_distance_equals_scipy_wasserstein_distance():
+    # Arrange
+    rng = np.random.default_rng(0)
+    dist1 = rng.normal(size=300).round(1)
+    dist2 = rng.normal(0.5, 2, size=200).round(1)
+    weights1, weights2 = rng.random(300), rng.random(200)
+    val_min, val_max = min(dist1.min(), dist2.min()), max(dist1.max(), dist2.max())
+    scaled1, scaled2 = (dist1 - val_min) / (val_max - val_min), (dist2 - val_min) / (val_max - val_min)
+
+    # Act & Assert
+    assert_that(earth_movers_distance(dist1, dist2),
+                close_to(wasserstein_distance(scaled1, scaled2), 1e-12))
+    assert_that(earth_movers_distance(np.sort(dist1), np.sort(dist2), assume_sorted=True),
+                close_to(wasserstein_distance(scaled1, scaled2), 1e-12))
+    assert_that(earth_movers_distance(dist1, dist2, weights1, weights2),
+                close_to(wasserstein_distance(scaled1, scaled2, weights1, weights2), 1e-12))
+    assert_that(earth_movers_distance(np.ones(10), np.ones(5)), equal_to(0))
@@ -26,8 +26,10 @@ from hamcrest import (
 from deepchecks.core import CheckResult
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.vision.vision_data import TaskType
+from deepchecks.vision.classification_data import ClassificationData
 from deepchecks.vision.base_checks import SingleDatasetCheck
 from deepchecks.vision.suite import Suite
+from deepchecks.vision.checks import ClassPerformance
 from deepchecks.vision.datasets.detection import coco
 from deepchecks.vision.datasets.classification import mnist
 
@@ -53,4 +55,117 @@ from deepchecks.vision.datasets.classification import mnist
 #     suite = Suite("test", DummyCheck())
 #     suite_result = suite.run(train_dataset=coco_dataset)
 
-#     breakpoint()
\ No newline at end of file
+#     breakpoint()
+
+class _SyntheticClassificationData(ClassificationData):
+    def batch_to_labels(self, batch):
+        return batch[1]
+
+    def infer_on_batch(self, batch, model, device):
+        return torch.nn.functional.softmax(model(batch[0].float().to(device)), dim=1)
+
+    def batch_to_images(self, batch):
+        return batch[0].numpy()
+
+
+class _CollectLabelsAndPredictionsCheck(SingleDatasetCheck):
+    def initialize_run(self, context, dataset_kind):
+        self.labels = []
+        self.predictions = []
+
+    def update(self, context, batch, dataset_kind):
+        self.labels.extend(batch.labels.tolist())
+        self.predictions.extend(batch.predictions.argmax(dim=1).tolist())
+
+    def compute(self, context, dataset_kind) -> CheckResult:
+        return CheckResult({'labels': self.labels, 'predictions': self.predictions})
+
+
+def test_suite_run_with_prefetched_batches():
+    torch.manual_seed(0)
+    images = torch.rand(50, 4, 4, 1)
+    labels = torch.arange(50) % 3
+    data = _SyntheticClassificationData(DataLoader(list(zip(images, labels)), batch_size=8))
+    model = torch.nn.Sequential(torch.nn.Flatten(), torch.nn.Linear(16, 3))
+    suite = Suite('prefetch suite', _CollectLabelsAndPredictionsCheck())
+
+    sequential_result = suite.run(train_dataset=data, model=model)
+    prefetch_result = suite.run(train_dataset=data, model=model, prefetch_batches=2)
+
+    assert_that(prefetch_result.results[0], instance_of(CheckResult))
+    assert_that(prefetch_result.results[0].value, equal_to(sequential_result.results[0].value))
+    assert_that(
+        calling(suite.run).with_args(train_dataset=data, model=model, prefetch_batches=-1),
+        raises(DeepchecksValueError, 'prefetch_batches must be a non-negative integer, but got: -1')
+    )
+
+
+def test_suite_run_replays_predictions_from_inference_cache(tmp_path):
+    torch.manual_seed(0)
+    images = torch.rand(50, 4, 4, 1)
+    labels = torch.arange(50) % 3
+    data = _SyntheticClassificationData(DataLoader(list(zip(images, labels)), batch_size=8))
+    model = torch.nn.Sequential(torch.nn.Flatten(), torch.nn.Linear(16, 3))
+    inferred_samples = []
+    model.register_forward_hook(lambda module, inputs, output: inferred_samples.append(len(output)))
+    suite = Suite('cache suite', _CollectLabelsAndPredictionsCheck())
+
+    first_result = suite.run(train_dataset=data, model=model, inference_cache_dir=str(tmp_path))
+    n_inferred_first_run = sum(inferred_samples)
+    inferred_samples.clear()
+    second_result = suite.run(train_dataset=data, model=model, inference_cache_dir=str(tmp_path), random_state=0)
+
+    assert_that(n_inferred_first_run >= 50)
+    # Only the validation of the model predictions runs the model
+    assert_that(sum(inferred_samples) < 50)
+    assert_that(sorted(zip(second_result.results[0].value['labels'], second_result.results[0].value['predictions'])),
+                equal_to(sorted(zip(first_result.results[0].value['labels'],
+                                    first_result.results[0].value['predictions']))))
+
+
+class _CollectLabelsCheck(SingleDatasetCheck):
+    def initialize_run(self, context, dataset_kind):
+        self.labels = []
+
+    def update(self, context, batch, dataset_kind):
+        self.labels.extend(batch.labels.tolist())
+
+    def compute(self, context, dataset_kind) -> CheckResult:
+        return CheckResult(self.labels)
+
+
+def test_suite_run_with_lazy_device_transfer():
+    torch.manual_seed(0)
+    images = torch.rand(50, 4, 4, 1)
+    labels = torch.arange(50) % 3
+    data = _SyntheticClassificationData(DataLoader(list(zip(images, labels)), batch_size=8))
+    model = torch.nn.Sequential(torch.nn.Flatten(), torch.nn.Linear(16, 3))
+    suite = Suite('lazy transfer suite', _CollectLabelsAndPredictionsCheck())
+
+    eager_result = suite.run(train_dataset=data, model=model)
+    lazy_result = suite.run(train_dataset=data, model=model, lazy_device_transfer=True)
+    # Labels only suite never moves the batches to the device. The meta device has no data, so labels moved to it
+    # can't be read
+    labels_result = Suite('labels suite', _CollectLabelsCheck()).run(train_dataset=data, device='meta',
+                                                                    lazy_device_transfer=True)
+
+    assert_that(lazy_result.results[0].value, equal_to(eager_result.results[0].value))
+    assert_that(sorted(labels_result.results[0].value), equal_to(sorted(labels.tolist())))
+
+
+def test_suite_run_metrics_check_with_lazy_device_transfer():
+    # Metrics are updated with both the predictions and the labels, which should be on the same device
+    torch.manual_seed(0)
+    images = torch.rand(60, 4, 4, 1)
+    labels = torch.arange(60) % 3
+    data = _SyntheticClassificationData(DataLoader(list(zip(images, labels)), batch_size=8))
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    model = torch.nn.Sequential(torch.nn.Flatten(), torch.nn.Linear(16, 3)).to(device)
+    suite = Suite('metrics suite', ClassPerformance())
+
+    eager_result = suite.run(train_dataset=data, test_dataset=data, model=model, device=device)
+    lazy_result = suite.run(train_dataset=data, test_dataset=data, model=model, device=device,
+                            lazy_device_transfer=True)
+
+    assert_that(lazy_result.results[0], instance_of(CheckResult))
+    assert_that(lazy_result.results[0].value.equals(eager_result.results[0].value), equal_to(True))
@@ -291,3 +291,38 @@ def test_data_at_batch_of_index(mnist_dataset_train):
     # Assert
     assert torch.equal(batch[0], single_batch[0])
     assert torch.equal(batch[1], single_batch[1])
+
+
+class _ModuloDetectionData(DetectionData):
+    """Detection data of integer samples, with boxes of the classes of the sample modulo 3 and 5."""
+
+    def batch_to_labels(self, batch):
+        return [torch.tensor([[x % 3, 0, 0, 1, 1], [x % 5, 0, 0, 1, 1]], dtype=torch.float32) if x % 7
+                else torch.zeros((0, 5)) for x in batch.tolist()]
+
+
+def _expected_classes_indices(vision_data):
+    expected = {}
+    for index in vision_data.data_loader.batch_sampler.sampler:
+        for single_class in vision_data.get_classes(vision_data.batch_to_labels(torch.tensor([index])))[0]:
+            expected.setdefault(single_class, []).append(index)
+    return expected
+
+
+def test_classes_indices_of_sampled_copy_without_iterating_data():
+    # Arrange
+    dataset = _ModuloDetectionData(DataLoader(list(range(200)), batch_size=16, shuffle=True))
+    dataset.init_cache()
+    for batch in dataset:
+        dataset.update_cache(dataset.batch_to_labels(batch))
+
+    # Act
+    sampled = dataset.copy(n_samples=50, shuffle=True, random_state=0)
+
+    # Assert
+    for vision_data in (dataset, sampled):
+        expected = _expected_classes_indices(vision_data)
+        classes_indices = vision_data.classes_indices
+        assert_that(list(classes_indices), equal_to(list(expected)))
+        assert_that({k: v.tolist() for k, v in classes_indices.items()}, equal_to(expected))
+        assert_that(vision_data.n_of_samples_per_class, equal_to({k: len(v) for k, v in expected.items()}))
@@ -14,13 +14,16 @@ import types
 
 import albumentations
 import numpy as np
+import torch
+from torch.utils.data import DataLoader, Dataset
 from deepchecks.vision.datasets.detection.coco import COCOData, CocoDataset
 
 from tests.checks.utils import equal_condition_result
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.vision.checks.performance.robustness_report import RobustnessReport
+from deepchecks.vision.classification_data import ClassificationData
 from PIL import Image
-from hamcrest import assert_that, has_entries, close_to, calling, raises, has_items
+from hamcrest import assert_that, has_entries, close_to, calling, raises, has_items, equal_to
 
 
 from tests.vision.vision_conftest import *
@@ -118,3 +121,76 @@ def test_dataset_not_augmenting_data(coco_train_visiondata: COCOData, trained_yo
     assert_that(calling(check.run).with_args(vision_data, trained_yolov5_object_detection,
                                              device=device),
                 raises(DeepchecksValueError, msg))
+
+
+class _PixelsDataset(Dataset):
+    """Dataset of random images, labeled by their brightest channel."""
+
+    def __init__(self, transforms):
+        generator = np.random.RandomState(0)
+        self.images = generator.randint(0, 256, size=(60, 8, 8, 3)).astype(np.uint8)
+        self.images[np.arange(60), :, :, np.arange(60) % 3] = 255
+        self.targets = np.arange(60) % 3
+        self.transforms = transforms
+
+    def __getitem__(self, index):
+        return self.transforms(image=self.images[index])['image'], self.targets[index]
+
+    def __len__(self):
+        return len(self.images)
+
+
+class _PixelsData(ClassificationData):
+
+    def batch_to_labels(self, batch):
+        return batch[1]
+
+    def infer_on_batch(self, batch, model, device):
+        return torch.nn.Softmax(dim=1)(model(batch[0].float().mean(dim=(1, 2))))
+
+    def batch_to_images(self, batch):
+        return batch[0].numpy()
+
+
+class _BrightestChannelModel(torch.nn.Module):
+
+    def forward(self, x):
+        return x / 10
+
+
+def test_single_pass_equals_separate_passes():
+    # Arrange
+    data = _PixelsData(DataLoader(_PixelsDataset(albumentations.Compose([])), batch_size=16))
+    # Augmentations without randomness, which are the same in both modes
+    augmentations = [albumentations.ChannelShuffle(p=0), albumentations.InvertImg(p=1),
+                     albumentations.ToGray(p=1)]
+
+    # Act
+    result = RobustnessReport(augmentations=augmentations).run(data, _BrightestChannelModel())
+    single_pass_result = RobustnessReport(augmentations=augmentations, single_pass=True).run(
+        data, _BrightestChannelModel()
+    )
+
+    # Assert
+    assert_that(single_pass_result.value, equal_to(result.value))
+    assert_that(result.value, has_entries({
+        'Invert Img': has_entries({'Precision': has_entries(diff=close_to(-1, 0.001))})
+    }))
+
+
+def test_single_pass_with_samples_per_augmentation():
+    # Arrange
+    data = _PixelsData(DataLoader(_PixelsDataset(albumentations.Compose([])), batch_size=16))
+    augmentations = [albumentations.InvertImg(p=1)]
+    check = RobustnessReport(augmentations=augmentations, single_pass=True, n_samples_per_augmentation=20)
+
+    # Act
+    result = check.run(data, _BrightestChannelModel())
+
+    # Assert
+    assert_that(result.value, has_entries({
+        'Invert Img': has_entries({
+            'Precision': has_entries(score=close_to(0, 0.001), diff=close_to(-1, 0.001)),
+            'Recall': has_entries(score=close_to(0, 0.001), diff=close_to(-1, 0.001))
+        })
+    }))
@@ -0,0 +1,154 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+from collections import defaultdict
+
+import numpy as np
+import torch
+from hamcrest import assert_that, equal_to
+
+from deepchecks.vision.metrics_utils.detection_precision_recall import AveragePrecision
+from deepchecks.vision.metrics_utils.iou_utils import build_class_bounding_box, compute_pairwise_ious
+
+
+class _ListAveragePrecision(AveragePrecision):
+    """The previous list based evaluation of AveragePrecision, used as reference for the array based evaluation."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._evals = defaultdict(lambda: {'scores': defaultdict(list), 'matched': defaultdict(list),
+                                           'NP': defaultdict(list)})
+
+    def _group_detections(self, detected, ground_truth):
+        bb_info = build_class_bounding_box(detected, ground_truth)
+        for class_id, boxes in bb_info.items():
+            ious = compute_pairwise_ious(boxes['detected'], boxes['ground_truth'])
+            image_evals = self._evaluate_image_lists(boxes['detected'], boxes['ground_truth'], ious)
+            for key, values in image_evals.items():
+                for eval_key, value in values.items():
+                    self._evals[class_id][key][eval_key].extend(value if isinstance(value, list) else [value])
+
+    def compute(self):
+        sorted_classes = sorted(self._evals.keys())
+        shape = (len(self.iou_thresholds), len(self.area_ranges_names), len(self.max_detections_per_class),
+                 len(sorted_classes))
+        reses = {'precision': -np.ones(shape), 'recall': -np.ones(shape)}
+        for iou_i, min_iou in enumerate(self.iou_thresholds):
+            for dets_i, dets in enumerate(self.max_detections_per_class):
+                for area_i, area_size in enumerate(self.area_ranges_names):
+                    for class_i, class_id in enumerate(sorted_classes):
+                        ev = self._evals[class_id]
+                        key = (area_size, dets, min_iou)
+                        precision, recall = self._compute_ap_recall(np.array(ev['scores'][key]),
+                                                                    np.array(ev['matched'][key], dtype=bool),
+                                                                    np.sum(np.array(ev['NP'][key])))
+                        reses['precision'][iou_i, area_i, dets_i, class_i] = precision
+                        reses['recall'][iou_i, area_i, dets_i, class_i] = recall
+        return [reses]
+
+    def _is_ignore_single_area(self, area_bb, area_size):
+        if area_size == 'small':
+            return not area_bb < self.area_range[0]
+        if area_size == 'medium':
+            return not self.area_range[0] <= area_bb <= self.area_range[1]
+        if area_size == 'large':
+            return not area_bb > self.area_range[1]
+        return False
+
+    def _evaluate_image_lists(self, detections, ground_truths, ious):
+        sorted_detection_ids = np.argsort([-d[4] for d in detections], kind='stable')
+        ground_truth_area = [g[3] * g[4] for g in ground_truths]
+        scores, matched, n_gts = {}, {}, {}
+        for min_iou in self.iou_thresholds:
+            for top_n_detections in self.max_detections_per_class:
+                for area_size in self.area_ranges_names:
+                    dt = [detections[idx] for idx in sorted_detection_ids[:top_n_detections]]
+                    dt_ious = ious[sorted_detection_ids[:top_n_detections]]
+                    ground_truth_to_ignore = [self._is_ignore_single_area(area, area_size)
+                                              for area in ground_truth_area]
+                    gt_sort = np.argsort(ground_truth_to_ignore, kind='stable')
+                    ground_truth_to_ignore = [ground_truth_to_ignore[idx] for idx in gt_sort]
+                    dt_ious = dt_ious[:, gt_sort]
+
+                    detection_matches = self._get_best_matches_lists(len(dt), min_iou, ground_truth_to_ignore,
+                                                                     dt_ious)
+                    detections_to_ignore = [
+                        ground_truth_to_ignore[detection_matches[d_idx]] if d_idx in detection_matches
+                        else self._is_ignore_single_area(d[2] * d[3], area_size)
+                        for d_idx, d in enumerate(dt)
+                    ]
+                    key = (area_size, top_n_detections, min_iou)
+                    scores[key] = [float(dt[d_idx][4]) for d_idx in range(len(dt))
+                                   if not detections_to_ignore[d_idx]]
+                    matched[key] = [d_idx in detection_matches for d_idx in range(len(dt))
+                                    if not detections_to_ignore[d_idx]]
+                    n_gts[key] = len([ignore for ignore in ground_truth_to_ignore if not ignore])
+        return {'scores': scores, 'matched': matched, 'NP': n_gts}
+
+    @staticmethod
+    def _get_best_matches_lists(n_detections, min_iou, ground_truth_to_ignore, ious):
+        ground_truth_matched = {}
+        detection_matches = {}
+        for d_idx in range(n_detections):
+            best_iou = min(min_iou, 1 - 1e-10)
+            best_match = -1
+            for g_idx in range(len(ground_truth_to_ignore)):
+                if g_idx in ground_truth_matched:
+                    continue
+                if best_match > -1 and ground_truth_to_ignore[g_idx]:
+                    break
+                if ious[d_idx, g_idx] >= best_iou:
+                    best_iou = ious[d_idx, g_idx]
+                    best_match = g_idx
+            if best_match != -1:
+                detection_matches[d_idx] = best_match
+                ground_truth_matched[best_match] = d_idx
+        return detection_matches
+
+
+def _random_detections(n_images=30):
+    generator = torch.Generator().manual_seed(42)
+    predictions, labels = [], []
+    for _ in range(n_images):
+        n_labels, n_detections = int(torch.randint(0, 10, (1,), generator=generator)), \
+            int(torch.randint(0, 40, (1,), generator=generator))
+        # box sizes in all the area ranges, and duplicated labels and rounded values for ties in ious and scores
+        sizes = torch.tensor([8., 16., 32., 64., 96., 128.])[torch.randint(0, 6, (n_labels, 2), generator=generator)]
+        label = torch.cat([torch.randint(0, 3, (n_labels, 1), generator=generator).float(),
+                           (torch.rand(n_labels, 2, generator=generator) * 20).round(), sizes], dim=1).repeat(2, 1)
+        matched_labels = label[torch.randint(0, max(len(label), 1), (n_detections,), generator=generator)] \
+            if n_labels else torch.zeros(n_detections, 5)
+        detection = torch.cat([matched_labels[:, 1:] + (torch.randn(n_detections, 4, generator=generator) * 2).round(),
+                               (torch.rand(n_detections, 1, generator=generator) * 10).round() / 10,
+                               matched_labels[:, :1]], dim=1)
+        detection[:, 2:4] = detection[:, 2:4].abs() + 1
+        predictions.append(detection)
+        labels.append(label)
+    predictions.append(torch.zeros(0, 6))
+    labels.append(torch.tensor([]))
+    return predictions, labels
+
+
+def test_array_evaluation_equals_list_evaluation():
+    # Arrange
+    predictions, labels = _random_detections()
+    metric = AveragePrecision(return_option=None, max_dets=(1, 5, 20))
+    reference_metric = _ListAveragePrecision(return_option=None, max_dets=(1, 5, 20))
+
+    # Act
+    metric.update((predictions, labels))
+    reference_metric.update((predictions, labels))
+    result, = metric.compute()
+    reference_result, = reference_metric.compute()
+
+    # Assert
+    for key in ['precision', 'recall']:
+        assert_that(result[key].tolist(), equal_to(reference_result[key].tolist()))
+    assert_that(bool((result['precision'] > 0).any()), equal_to(True))
@@ -0,0 +1,63 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import numpy as np
+from hamcrest import assert_that, equal_to, close_to, has_length
+from skimage.color import rgb2gray
+
+from deepchecks.vision.utils import image_properties
+
+
+def _mixed_size_batch():
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (20, 30, 3)).astype(np.uint8) for _ in range(3)] + \
+           [rng.integers(0, 256, (10, 12, 3)).astype(np.uint8)] + \
+           [rng.integers(0, 256, (20, 30, 3)).astype(np.uint8)]
+
+
+def test_calc_properties_on_mixed_size_batch():
+    batch = _mixed_size_batch()
+
+    result = image_properties.calc_properties(batch, image_properties.default_image_properties)
+
+    for prop in image_properties.default_image_properties:
+        assert_that(result[prop['name']], has_length(len(batch)))
+    for img, value in zip(batch, result['Brightness']):
+        assert_that(value, close_to(rgb2gray(img).mean(), 1e-9))
+    for img, value in zip(batch, result['RMS Contrast']):
+        assert_that(value, close_to(rgb2gray(img).std(), 1e-9))
+    for img, value in zip(batch, result['Normalized Red Mean']):
+        channels_sum = img.sum(axis=2)
+        assert_that(value, close_to(np.mean(img[:, :, 0] / channels_sum), 1e-9))
+    assert_that(result['Area'], equal_to([600, 600, 600, 120, 600]))
+    assert_that(result['Aspect Ratio'][3], close_to(10 / 12, 1e-9))
+
+
+def test_calc_properties_matches_single_property_methods():
+    batch = _mixed_size_batch()
+
+    result = image_properties.calc_properties(batch, image_properties.default_image_properties)
+
+    for prop in image_properties.default_image_properties:
+        assert_that(np.allclose(result[prop['name']], prop['method'](batch)), equal_to(True))
+
+
+def test_calc_properties_on_grayscale_batch_with_custom_property():
+    batch = [np.ones((5, 5, 1)) * i for i in range(3)]
+    properties = image_properties.default_image_properties + [
+        {'name': 'Max', 'method': lambda imgs: [img.max() for img in imgs], 'output_type': 'continuous'}
+    ]
+
+    result = image_properties.calc_properties(batch, properties)
+
+    assert_that(result['Brightness'], equal_to([0, 1, 2]))
+    assert_that(result['RMS Contrast'], equal_to([0, 0, 0]))
+    assert_that(result['Normalized Green Mean'], equal_to([None, None, None]))
+    assert_that(result['Max'], equal_to([0, 1, 2]))
@@ -0,0 +1,71 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import torch
+from hamcrest import assert_that, equal_to, has_length, is_not
+from torch.utils.data import DataLoader
+
+from deepchecks.vision.detection_data import DetectionData
+from deepchecks.vision.utils.inference_cache import InferenceCache, data_fingerprint
+
+
+class _CountingDetectionData(DetectionData):
+    """Detection data predicting a box per unit of the sample value."""
+
+    def __init__(self, data_loader):
+        self.n_inferred = 0
+        super().__init__(data_loader)
+
+    def batch_to_labels(self, batch):
+        return [torch.tensor([[0, 1, 1, 2, 2]] * int(x), dtype=torch.float32).reshape(-1, 5) for x in batch]
+
+    def infer_on_batch(self, batch, model, device):
+        self.n_inferred += len(batch)
+        return [torch.tensor([[1, 1, 2, 2, 0.5, 0]] * int(x), dtype=torch.float32).reshape(-1, 6) * x for x in batch]
+
+
+def test_inference_cache_replays_detection_predictions(tmp_path):
+    data = _CountingDetectionData(DataLoader([1, 0, 2, 3, 4, 5], batch_size=4))
+    model = torch.nn.Linear(1, 1)
+    batches = list(data)
+
+    predictions = [InferenceCache(str(tmp_path)).infer_on_batch(data, batch, data.indices_of_batch(i), model, 'cpu')
+                   for i, batch in enumerate(batches)]
+    data.n_inferred = 0
+    # New cache object on the same directory, as in a new run
+    cache = InferenceCache(str(tmp_path))
+    cached_predictions = [cache.infer_on_batch(data, batch, data.indices_of_batch(i), model, 'cpu')
+                          for i, batch in enumerate(batches)]
+
+    assert_that(data.n_inferred, equal_to(0))
+    for batch_predictions, batch_cached_predictions in zip(predictions, cached_predictions):
+        assert_that(batch_cached_predictions, has_length(len(batch_predictions)))
+        for sample_predictions, sample_cached_predictions in zip(batch_predictions, batch_cached_predictions):
+            assert_that(torch.equal(sample_predictions, sample_cached_predictions.reshape(sample_predictions.shape)))
+
+
+def test_inference_cache_is_invalidated_by_model_change(tmp_path):
+    data = _CountingDetectionData(DataLoader([1, 2, 3], batch_size=4))
+    model = torch.nn.Linear(1, 1)
+    batch = next(iter(data))
+
+    InferenceCache(str(tmp_path)).infer_on_batch(data, batch, data.indices_of_batch(0), model, 'cpu')
+    with torch.no_grad():
+        model.weight.add_(1)
+    InferenceCache(str(tmp_path)).infer_on_batch(data, batch, data.indices_of_batch(0), model, 'cpu')
+
+    assert_that(data.n_inferred, equal_to(6))
+
+
+def test_data_fingerprint_changes_with_samples_other_than_first():
+    data = _CountingDetectionData(DataLoader([1, 0, 2, 3, 4, 5], batch_size=4))
+    changed_data = _CountingDetectionData(DataLoader([1, 0, 2, 3, 4, 6], batch_size=4))
+
+    assert_that(data_fingerprint(data), is_not(equal_to(data_fingerprint(changed_data))))
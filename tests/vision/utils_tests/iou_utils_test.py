@@ -0,0 +1,54 @@
+# ----------------------------------------------------------------------------
+# Copyright (C) 2021-2022 Deepchecks (https://www.deepchecks.com)
+#
+# This file is part of Deepchecks.
+# Deepchecks is distributed under the terms of the GNU Affero General
+# Public License (version 3 or later).
+# You should have received a copy of the GNU Affero General Public License
+# along with Deepchecks.  If not, see <http://www.gnu.org/licenses/>.
+# ----------------------------------------------------------------------------
+#
+import torch
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, has_length
+
+from deepchecks.vision.metrics_utils.iou_utils import (build_class_bounding_box, compute_class_ious,
+                                                       compute_pairwise_ious, jaccard_iou, per_sample_mean_iou)
+
+
+def _random_boxes():
+    generator = torch.Generator().manual_seed(42)
+    detected = torch.cat([torch.rand(30, 2, generator=generator) * 50, torch.rand(30, 2, generator=generator) * 30,
+                          torch.rand(30, 1, generator=generator), torch.randint(0, 3, (30, 1), generator=generator)],
+                         dim=1)
+    ground_truth = torch.cat([torch.randint(0, 3, (10, 1), generator=generator),
+                              torch.rand(10, 2, generator=generator) * 50, torch.rand(10, 2, generator=generator) * 30],
+                             dim=1)
+    return detected, ground_truth
+
+
+def test_pairwise_ious_equal_jaccard_iou():
+    detected, ground_truth = _random_boxes()
+
+    ious = compute_pairwise_ious(detected, ground_truth)
+
+    assert_that(ious.shape, equal_to((30, 10)))
+    for d_idx, detection in enumerate(detected):
+        for g_idx, label in enumerate(ground_truth):
+            assert_that(ious[d_idx, g_idx], close_to(jaccard_iou(detection, label), 1e-6))
+
+
+def test_class_ious_and_mean_iou():
+    detected = torch.tensor([[0., 0., 10., 10., 0.9, 1.], [0., 0., 10., 5., 0.8, 1.], [20., 20., 5., 5., 0.7, 2.]])
+    ground_truth = torch.tensor([[1., 0., 0., 10., 10.], [3., 20., 20., 5., 5.]])
+
+    bounding_boxes = build_class_bounding_box(detected, ground_truth)
+    ious = compute_class_ious(detected, ground_truth)
+    mean_ious = per_sample_mean_iou([detected, detected[:0]], [ground_truth, torch.tensor([])])
+
+    assert_that(sorted(bounding_boxes), contains_exactly(1., 2., 3.))
+    assert_that(bounding_boxes[1.]['detected'], has_length(2))
+    assert_that(bounding_boxes[2.]['ground_truth'], has_length(0))
+    assert_that(ious[1.].tolist(), equal_to([[1.], [0.5]]))
+    assert_that(ious[3.].shape, equal_to((0, 1)))
+    # The class 2 detection has no ground truth of its class, so its best iou is 0
+    assert_that(mean_ious, contains_exactly(close_to(0.5, 1e-9), 1))